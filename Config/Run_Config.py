@@ -22,6 +22,20 @@ Attributes:
     hill_climbing_iterations (int): Number of iterations for hill climbing.
     simulated_annealing_iterations (int): Number of iterations for simulated annealing.
     ga_index (int): Index for the genetic algorithm run.
+    evaluator (str): Fitness evaluator, 'simpy' (event simulation) or 'array' (array decoder).
+    fitness_cache_mb (float): Memory cap of the fitness cache in MB (0 disables it).
+    trace_format (str): File format of the event log, 'npz' (binary), 'parquet' or 'csv'.
+    decoder (str): Chromosome decoder, 'semi-active' (sequence order) or 'active' (Giffler-Thompson).
+    active_delta (float): Look-ahead of the 'active' decoder, 0 (non-delay) to 1 (active).
+    compaction (bool): Left-shift the schedules of elites and PSO/OR-Tools results (no extra evaluations).
+    duplicate_policy (str): Individuals with a duplicate genotype after mutation, 'keep', 'random' or 'mutate'.
+    replacement (str): Population update of GAEngine, 'generational' or 'steady-state' ((mu + lambda), GAS/SteadyState.py).
+    offspring_size (int): Children bred per steady-state step (lambda).
+    replace_policy (str): Individual replaced by a better steady-state child, 'worst' or 'similar' (most similar machine order).
+    time_limit (float): Wall-clock seconds after which GAEngine stops (None for no limit).
+    evaluation_limit (int): Number of evaluations after which GAEngine stops (None for no limit).
+    stagnation_limit (int): Generations without improvement after which GAEngine stops (None for no limit).
+    restart_stagnation (int): Generations without improvement after which all but the elites are re-seeded (None for no restart).
 """
 import os
 import datetime
@@ -37,7 +51,21 @@ class Run_Config:
                  trace_object='Process4', title=None,
                  tabu_search_iterations=100, hill_climbing_iterations=100, simulated_annealing_iterations=100,
                  two_iterations = 100,
-                 ga_index=0):
+                 ga_index=0,
+                 evaluator='simpy',
+                 fitness_cache_mb=32,
+                 trace_format='npz',
+                 decoder='semi-active',
+                 active_delta=1.0,
+                 compaction=False,
+                 duplicate_policy='keep',
+                 replacement='generational',
+                 offspring_size=2,
+                 replace_policy='worst',
+                 time_limit=None,
+                 evaluation_limit=None,
+                 stagnation_limit=None,
+                 restart_stagnation=None):
         """
         Initializes the Run_Config class with the specified parameters.
 
@@ -59,6 +87,20 @@ class Run_Config:
             hill_climbing_iterations (int): Number of iterations for hill climbing.
             simulated_annealing_iterations (int): Number of iterations for simulated annealing.
             ga_index (int): Index for the genetic algorithm run.
+            evaluator (str): Fitness evaluator, 'simpy' (event simulation) or 'array' (array decoder).
+            fitness_cache_mb (float): Memory cap of the fitness cache in MB (0 disables it).
+            trace_format (str): File format of the event log, 'npz' (binary), 'parquet' or 'csv'.
+            decoder (str): Chromosome decoder, 'semi-active' (sequence order) or 'active' (Giffler-Thompson).
+            active_delta (float): Look-ahead of the 'active' decoder, 0 (non-delay) to 1 (active).
+            compaction (bool): Left-shift the schedules of elites and PSO/OR-Tools results (no extra evaluations).
+            duplicate_policy (str): Individuals with a duplicate genotype after mutation, 'keep', 'random' or 'mutate'.
+            replacement (str): Population update of GAEngine, 'generational' or 'steady-state' ((mu + lambda), GAS/SteadyState.py).
+            offspring_size (int): Children bred per steady-state step (lambda).
+            replace_policy (str): Individual replaced by a better steady-state child, 'worst' or 'similar' (most similar machine order).
+            time_limit (float): Wall-clock seconds after which GAEngine stops (None for no limit).
+            evaluation_limit (int): Number of evaluations after which GAEngine stops (None for no limit).
+            stagnation_limit (int): Generations without improvement after which GAEngine stops (None for no limit).
+            restart_stagnation (int): Generations without improvement after which all but the elites are re-seeded (None for no restart).
         """                 
 
         self.n_job = n_job
@@ -80,6 +122,42 @@ class Run_Config:
 
         self.simul_time = 10000
         self.dispatch_mode = 'Manual'
+        if evaluator not in ('simpy', 'array'):
+            raise ValueError(f"Unknown evaluator: {evaluator}")
+        self.evaluator = evaluator  # 'array'는 SimPy 없이 schedule을 계산 (trace 없음)
+        # 탐색 중 평가 (trace 없음)의 (makespan, mio_score) cache 메모리 상한 (MB, GAS/FitnessCache.py 참고)
+        self.fitness_cache_mb = fitness_cache_mb
+        if trace_format not in ('npz', 'parquet', 'csv'):
+            raise ValueError(f"Unknown trace format: {trace_format}")
+        self.trace_format = trace_format  # event log 형식 ('csv'는 기존 문자열 log, opt-in)
+        if decoder not in ('semi-active', 'active'):
+            raise ValueError(f"Unknown decoder: {decoder}")
+        if not 0.0 <= active_delta <= 1.0:
+            raise ValueError(f"active_delta must be in [0, 1]: {active_delta}")
+        self.decoder = decoder  # 'active'는 seq를 우선순위로 Giffler-Thompson 방식의 schedule 생성
+        self.active_delta = active_delta
+        self.compaction = compaction  # GAS/Compaction.py 참고
+        if duplicate_policy not in ('keep', 'random', 'mutate'):
+            raise ValueError(f"Unknown duplicate policy: {duplicate_policy}")
+        self.duplicate_policy = duplicate_policy  # GAS/GenotypeIndex.py 참고
+        if replacement not in ('generational', 'steady-state'):
+            raise ValueError(f"Unknown replacement: {replacement}")
+        if offspring_size < 1:
+            raise ValueError(f"offspring_size must be positive: {offspring_size}")
+        if replace_policy not in ('worst', 'similar'):
+            raise ValueError(f"Unknown replace policy: {replace_policy}")
+        self.replacement = replacement  # GAS/SteadyState.py 참고
+        self.offspring_size = offspring_size
+        self.replace_policy = replace_policy
+        for name, limit in (('time_limit', time_limit), ('evaluation_limit', evaluation_limit),
+                            ('stagnation_limit', stagnation_limit), ('restart_stagnation', restart_stagnation)):
+            if limit is not None and limit <= 0:
+                raise ValueError(f"{name} must be positive: {limit}")
+        # 종료 조건 (None이면 사용하지 않음), GAEngine.check_termination 참고
+        self.time_limit = time_limit
+        self.evaluation_limit = evaluation_limit
+        self.stagnation_limit = stagnation_limit
+        self.restart_stagnation = restart_stagnation
         self.gantt_title = title
 
         self.population_size = population_size
@@ -104,7 +182,7 @@ class Run_Config:
         now = datetime.datetime.now()
         self.now = now.strftime('%Y-%m-%d-%H-%M-%S')
         self.filename = {
-            'log': os.path.join(self.save_path, f'GA{ga_index}_{self.now}.csv'),
+            'log': os.path.join(self.save_path, f'GA{ga_index}_{self.now}.{trace_format}'),
             'machine': os.path.join(self.save_path, f'GA{ga_index}_{self.now}_machine.csv'),
             'gantt': os.path.join(self.save_path, f'GA{ga_index}_{self.now}.png'),
             'csv': os.path.join(ga_generations_path, f'GA{ga_index}_{self.now}.csv')  # 추가된 부분
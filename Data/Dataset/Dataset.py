@@ -13,7 +13,9 @@ Attributes:
     n_job (int): Number of jobs.
     n_machine (int): Number of machines.
     n_op (int): Number of operations (n_job * n_machine).
-    op_data (list): List of operation data parsed from the file.
+    instance (ProblemInstance): Immutable, array-backed view of the parsed instance.
+    op_data (ProblemInstance): Operation data, op_data[job][step] = (machine, process_time).
+                               The same object as instance, kept under the old name.
     n_solution (int): Number of solutions (initialized to 0).
 """
 import os
@@ -22,6 +24,7 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 import pandas as pd
 from GAS.Individual import Individual  
+from Data.Dataset.ProblemInstance import ProblemInstance
 # class Solution():
 
 class Dataset:
@@ -46,15 +49,14 @@ class Dataset:
         self.n_job, self.n_machine = map(int, first_line.strip().split('\t'))
         self.n_op = self.n_job * self.n_machine
 
-        # Initialize operation data list
-        self.op_data = []
         data = pd.read_csv(file_path, sep="\t", engine='python', encoding="cp949", skiprows=[0], header=None)
 
         # Parse the operation data from the file
-        for i in range(self.n_job):
-            self.op_data.append([])
-            for j in range(self.n_machine):
-                self.op_data[i].append((data.iloc[self.n_job + i, j] - 1, data.iloc[i, j]))
+        # 앞 n_job 행은 process time, 뒤 n_job 행은 1부터 시작하는 machine 번호
+        duration_table = data.iloc[:self.n_job, :self.n_machine].to_numpy()
+        machine_table = data.iloc[self.n_job:2 * self.n_job, :self.n_machine].to_numpy() - 1
+        self.instance = ProblemInstance(self.name, machine_table, duration_table)
+        self.op_data = self.instance  # Individual, Population, 연산자 모두 같은 객체를 참조
 
         self.n_solution = 0 # Initialize the number of solutions to 0
 
@@ -0,0 +1,173 @@
+"""
+Problem Instance
+
+This script defines the ProblemInstance class, an immutable, array-backed view of a
+job shop instance. It is built once by Dataset and then shared by reference by
+Individual, Population, the operators and the local searches, so that facts such as
+op -> job, op -> step, op -> machine, processing times, remaining job work and machine
+loads are computed once instead of on every call.
+
+Operations are numbered op = job * n_machine + step, the same numbering used by
+Individual.feasible_seq.
+
+The instance also behaves like the nested op_data list it replaces: instance[job][step]
+is the (machine, process_time) tuple, and len()/iteration run over jobs, so existing
+code that indexes op_data keeps working when given an instance.
+
+Classes:
+    ProblemInstance: Immutable, array-backed job shop instance.
+"""
+
+import hashlib
+
+import numpy as np
+
+
+def _frozen(array):
+    array = np.ascontiguousarray(array, dtype=np.int32)
+    array.setflags(write=False)
+    return array
+
+
+class ProblemInstance:
+    """
+    Immutable, array-backed job shop instance.
+
+    Attributes:
+        name (str): Name of the instance (e.g. 'la01').
+        n_job (int): Number of jobs.
+        n_machine (int): Number of machines.
+        n_op (int): Number of operations (n_job * n_machine).
+        machine (np.ndarray): machine[op], int32.
+        duration (np.ndarray): duration[op], int32.
+        job (np.ndarray): job[op], int32.
+        step (np.ndarray): step[op], int32.
+        machine_table (np.ndarray): machine[job, step], int32 view of machine.
+        duration_table (np.ndarray): duration[job, step], int32 view of duration.
+        step_on_machine (np.ndarray): step_on_machine[job, machine], the step at which the job visits the machine.
+        job_head_work (np.ndarray): Work of the job before op (release time lower bound of op).
+        job_tail_work (np.ndarray): Work of the job after op (tail lower bound of op).
+        job_remaining_work (np.ndarray): Work of the job from op on, op included (MWR/LWR priority).
+        job_remaining_ops (np.ndarray): Number of operations of the job from op on, op included (MOR/LOR priority).
+        job_total_work (np.ndarray): Total work of each job.
+        machine_load (np.ndarray): Total work of each machine.
+        job_bound (int): max(job_total_work).
+        machine_bound (int): max over machines of min head + load + min tail.
+        lower_bound (int): max(job_bound, machine_bound), a lower bound on the makespan.
+        horizon (int): Sum of all processing times, an upper bound on any semi-active makespan.
+        op_data (tuple): The instance as nested (machine, process_time) tuples.
+        digest (bytes): 16-byte digest of the shape, routings and processing times (equal for equal instances).
+    """
+
+    def __init__(self, name, machine_table, duration_table):
+        """
+        Initializes the ProblemInstance class from per-job machine and duration tables.
+
+        Parameters:
+            name (str): Name of the instance.
+            machine_table (array-like): machine_table[job][step], 0-based machine index.
+            duration_table (array-like): duration_table[job][step], processing time.
+        """
+        machine_table = np.asarray(machine_table)
+        duration_table = np.asarray(duration_table)
+        n_job, n_machine = machine_table.shape
+
+        s = object.__setattr__
+        s(self, 'name', name)
+        s(self, 'n_job', int(n_job))
+        s(self, 'n_machine', int(n_machine))
+        s(self, 'n_op', int(n_job * n_machine))
+
+        s(self, 'machine', _frozen(machine_table.reshape(-1)))
+        s(self, 'duration', _frozen(duration_table.reshape(-1)))
+        s(self, 'job', _frozen(np.repeat(np.arange(n_job), n_machine)))
+        s(self, 'step', _frozen(np.tile(np.arange(n_machine), n_job)))
+        s(self, 'machine_table', self.machine.reshape(n_job, n_machine))
+        s(self, 'duration_table', self.duration.reshape(n_job, n_machine))
+
+        step_on_machine = np.empty((n_job, n_machine), dtype=np.int32)
+        step_on_machine[self.job, self.machine] = self.step
+        s(self, 'step_on_machine', _frozen(step_on_machine))
+
+        cumulative = np.cumsum(self.duration_table, axis=1)
+        s(self, 'job_total_work', _frozen(cumulative[:, -1]))
+        s(self, 'job_head_work', _frozen((cumulative - self.duration_table).reshape(-1)))
+        s(self, 'job_tail_work', _frozen((cumulative[:, -1:] - cumulative).reshape(-1)))
+        s(self, 'job_remaining_work', _frozen(self.job_tail_work + self.duration))
+        s(self, 'job_remaining_ops', _frozen(n_machine - self.step))
+        s(self, 'machine_load', _frozen(np.bincount(self.machine, weights=self.duration, minlength=n_machine)))
+
+        heads = np.empty((n_job, n_machine), dtype=np.int64)
+        tails = np.empty((n_job, n_machine), dtype=np.int64)
+        heads[self.job, self.machine] = self.job_head_work
+        tails[self.job, self.machine] = self.job_tail_work
+        s(self, 'job_bound', int(self.job_total_work.max()))
+        s(self, 'machine_bound', int((heads.min(axis=0) + self.machine_load + tails.min(axis=0)).max()))
+        s(self, 'lower_bound', max(self.job_bound, self.machine_bound))
+        s(self, 'horizon', int(self.duration.sum()))
+
+        digest = hashlib.blake2b(np.array([n_job, n_machine], dtype=np.int32).tobytes(), digest_size=16)
+        digest.update(self.machine.tobytes())
+        digest.update(self.duration.tobytes())
+        s(self, 'digest', digest.digest())
+
+        s(self, 'op_data', tuple(tuple(zip(row_m, row_p)) for row_m, row_p in
+                                 zip(self.machine_table.tolist(), self.duration_table.tolist())))
+
+    @classmethod
+    def from_op_data(cls, op_data, name=None):
+        """
+        Builds an instance from nested op_data lists.
+
+        Parameters:
+            op_data (list): op_data[job][step] = (machine, process_time).
+            name (str): Name of the instance (default is None).
+
+        Returns:
+            ProblemInstance: The instance.
+        """
+        return cls(name,
+                   [[op[0] for op in job] for job in op_data],
+                   [[op[1] for op in job] for job in op_data])
+
+    @classmethod
+    def of(cls, op_data):
+        """
+        Returns op_data itself if it is already an instance, otherwise builds one.
+
+        Parameters:
+            op_data (ProblemInstance or list): The instance or nested op_data lists.
+
+        Returns:
+            ProblemInstance: The instance.
+        """
+        if isinstance(op_data, cls):
+            return op_data
+        return cls.from_op_data(op_data)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("ProblemInstance is immutable.")
+
+    # op_data 호환: instance[job][step] == (machine, process_time)
+    def __getitem__(self, job):
+        return self.op_data[job]
+
+    def __len__(self):
+        return self.n_job
+
+    def __iter__(self):
+        return iter(self.op_data)
+
+    # 불변 객체이므로 copy/deepcopy 시에도 같은 객체를 공유
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    # pickle에는 원본 table만 담고 나머지는 worker에서 다시 계산
+    def __reduce__(self):
+        return (self.__class__, (self.name, np.asarray(self.machine_table), np.asarray(self.duration_table)))
+
+    def __str__(self):
+        return f"ProblemInstance({self.name}, {self.n_job}x{self.n_machine}, lower_bound={self.lower_bound})"
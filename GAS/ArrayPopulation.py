@@ -0,0 +1,478 @@
+"""
+Array Population
+
+This script defines ArrayPopulation, an array-backed alternative to GAS/Population.py.
+The chromosomes are stored as one contiguous (N x n_op) integer matrix using the
+narrowest signed integer type that holds every gene (int8 up to 128 operations, int16 up
+to 32768, then int32), next to makespan, mio_score, fitness, scaled-fitness and age
+vectors. Selection, elitism and migration are index operations on these arrays
+(take / assign), evaluation decodes all changed rows at once with GAS/BatchDecoder.py,
+and the rows are never re-sorted: ranking() returns the order when it is needed.
+
+Individual objects are only created at the API boundary (individual / to_individuals /
+to_population), and the list-based operators of GAS/Crossover, GAS/Mutation and
+GAS/Selection are still accepted through that boundary.
+
+Classes:
+    ArrayPopulation: Array-backed population of chromosomes with fitness vectors.
+
+Functions:
+    chromosome_dtype(n_op): Returns the narrowest signed integer dtype that holds 0..n_op-1.
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+from GAS.Individual import Individual
+from GAS.BatchDecoder import evaluate_population_cached, machine_order_matrix
+from GAS.FitnessCache import get_fitness_cache
+from GAS.GenotypeIndex import GenotypeIndex, genotype_hashes
+from GAS.Mutation.BatchMutation import swap_mutation
+from Data.Dataset.ProblemInstance import ProblemInstance
+
+
+def chromosome_dtype(n_op):
+    """
+    Returns the narrowest signed integer dtype that holds the genes 0..n_op-1.
+
+    Parameters:
+        n_op (int): Number of operations.
+
+    Returns:
+        np.dtype: int8, int16, int32 or int64.
+    """
+    for dtype in (np.int8, np.int16, np.int32):
+        if n_op - 1 <= np.iinfo(dtype).max:
+            return np.dtype(dtype)
+    return np.dtype(np.int64)
+
+
+class ArrayPopulation:
+    """
+    Array-backed population of chromosomes with fitness vectors.
+
+    Rows that are not evaluated have makespan -1 and fitness nan.
+
+    Attributes:
+        config: Configuration object for the job shop.
+        op_data (ProblemInstance): The problem instance.
+        seqs (np.ndarray): Chromosomes, shape (N, n_op), dtype chromosome_dtype(n_op).
+        makespan (np.ndarray): Makespan of each row, int64.
+        mio_score (np.ndarray): MIO score of each row, int64.
+        fitness (np.ndarray): target_makespan / makespan of each row, float64.
+        scaled_fitness (np.ndarray): Min-max scaled fitness of each row, float64.
+        age (np.ndarray): Generation in which each row was created, int32.
+        generation (int): Current generation.
+    """
+
+    def __init__(self, config, op_data, seqs=None, random_seed=None):
+        """
+        Initializes the population with the given chromosomes, or with random permutations.
+
+        Parameters:
+            config: Configuration object for the job shop.
+            op_data (ProblemInstance): The problem instance (nested op_data lists are also accepted).
+            seqs (array-like): Chromosomes, shape (N, n_op) (default is config.population_size random ones).
+            random_seed (int): Seed for the random chromosomes (default is None).
+        """
+        self.config = config
+        self.op_data = ProblemInstance.of(op_data)
+        self.generation = 0
+        dtype = chromosome_dtype(self.op_data.n_op)
+        if seqs is None:
+            rng = np.random.default_rng(random_seed)
+            seqs = np.argsort(rng.random((config.population_size, self.op_data.n_op)), axis=1)
+        self.seqs = np.ascontiguousarray(seqs, dtype=dtype)
+        self._reset_results(len(self.seqs))
+
+    def _reset_results(self, n):
+        self.makespan = np.full(n, -1, dtype=np.int64)
+        self.mio_score = np.zeros(n, dtype=np.int64)
+        self.fitness = np.full(n, np.nan)
+        self.scaled_fitness = np.full(n, np.nan)
+        self.age = np.full(n, self.generation, dtype=np.int32)
+
+    def __len__(self):
+        return len(self.seqs)
+
+    @property
+    def nbytes(self):
+        """
+        Returns the memory used by the chromosome matrix and the vectors in bytes.
+        """
+        return sum(array.nbytes for array in (self.seqs, self.makespan, self.mio_score,
+                                              self.fitness, self.scaled_fitness, self.age))
+
+    # ------------------------------------------------------------------
+    # Individual 객체와의 변환 (API 경계)
+    # ------------------------------------------------------------------
+    @classmethod
+    def from_individuals(cls, config, op_data, individuals):
+        """
+        Builds a population from Individual objects, keeping their evaluation results.
+
+        Parameters:
+            config: Configuration object for the job shop.
+            op_data (ProblemInstance): The problem instance.
+            individuals (list): The individuals.
+
+        Returns:
+            ArrayPopulation: The population.
+        """
+        population = cls(config, op_data, seqs=np.array([individual.seq for individual in individuals]))
+        population._absorb_results(individuals, np.arange(len(individuals)))
+        return population
+
+    @classmethod
+    def from_population(cls, population):
+        """
+        Builds an ArrayPopulation from a list-based Population.
+
+        Parameters:
+            population (Population): The population.
+
+        Returns:
+            ArrayPopulation: The population.
+        """
+        return cls.from_individuals(population.config, population.op_data, population.individuals)
+
+    def _absorb_results(self, individuals, rows):
+        for row, individual in zip(rows.tolist(), individuals):
+            if individual.is_evaluated():
+                self.makespan[row] = individual.makespan
+                self.mio_score[row] = individual.mio_score
+                self.fitness[row] = individual.fitness
+                self.scaled_fitness[row] = getattr(individual, 'scaled_fitness', np.nan)
+            else:
+                self.makespan[row] = -1
+                self.fitness[row] = np.nan
+
+    def individual(self, row):
+        """
+        Materialises one row as an Individual (with its evaluation results, if any).
+
+        Parameters:
+            row (int): Row index.
+
+        Returns:
+            Individual: The individual.
+        """
+        individual = Individual(self.config, seq=self.seqs[row], op_data=self.op_data)
+        if self.makespan[row] >= 0:
+            individual.makespan, individual.mio_score = int(self.makespan[row]), int(self.mio_score[row])
+            individual.scaled_fitness = float(self.scaled_fitness[row])
+        return individual
+
+    def to_individuals(self, rows=None):
+        """
+        Materialises rows as Individual objects.
+
+        Parameters:
+            rows (array-like): Row indices (default is all rows in ranking order).
+
+        Returns:
+            list: The individuals.
+        """
+        if rows is None:
+            rows = self.ranking()
+        return [self.individual(row) for row in np.asarray(rows).tolist()]
+
+    def to_population(self):
+        """
+        Materialises the whole population as a list-based Population (best first).
+
+        Returns:
+            Population: The population.
+        """
+        from GAS.Population import Population
+        population = Population.__new__(Population)
+        population.config = self.config
+        population.op_data = self.op_data
+        population.individuals = self.to_individuals()
+        return population
+
+    # ------------------------------------------------------------------
+    # 평가와 순위
+    # ------------------------------------------------------------------
+    def invalidate(self, rows):
+        """
+        Marks rows whose chromosomes were changed in place as not evaluated.
+
+        Parameters:
+            rows (array-like): Row indices or a boolean mask.
+        """
+        self.makespan[rows] = -1
+        self.fitness[rows] = np.nan
+        self.age[rows] = self.generation
+
+    def evaluate(self, target_makespan):
+        """
+        Evaluates the rows that are not evaluated yet and rescales the fitness of all rows.
+
+        Identical chromosomes are decoded once. With the array evaluator and the semi-active
+        decoder all rows are decoded together by the batch decoder; otherwise they are
+        materialised and evaluated one by one through Individual.
+
+        Parameters:
+            target_makespan (int): Target makespan for fitness calculation.
+        """
+        pending = np.flatnonzero(self.makespan < 0)
+        if len(pending):
+            unique, inverse = np.unique(self.seqs[pending], axis=0, return_inverse=True)
+            inverse = inverse.reshape(-1)
+            if self.config.evaluator == 'array' and self.config.decoder == 'semi-active':
+                makespans, mio_scores = evaluate_population_cached(unique, self.op_data, get_fitness_cache(self.config, self.op_data))
+                Individual.count_evaluations(len(unique))
+            else:
+                individuals = [Individual(self.config, seq=seq, op_data=self.op_data) for seq in unique]
+                makespans = [individual.makespan for individual in individuals]
+                mio_scores = [individual.mio_score for individual in individuals]
+            self.makespan[pending] = np.asarray(makespans, dtype=np.int64)[inverse]
+            self.mio_score[pending] = np.asarray(mio_scores, dtype=np.int64)[inverse]
+
+        if np.any(self.makespan == 0):
+            raise ValueError("Makespan is zero, which will cause division by zero error.")
+        self.fitness = target_makespan / self.makespan
+        self.min_max_scaling()
+
+    def genotype_index(self):
+        """
+        Builds the genotype index (GAS/GenotypeIndex.py) of the rows.
+
+        Returns:
+            GenotypeIndex: The index, one entry per row.
+        """
+        if self.config.decoder == 'semi-active':
+            machine_orders = machine_order_matrix(self.seqs, self.op_data)
+            return GenotypeIndex(genotype_hashes(machine_orders), machine_orders)
+        return GenotypeIndex.from_individuals(self.to_individuals(np.arange(len(self))), self.config, self.op_data)
+
+    def uniqueness_ratio(self):
+        """
+        Returns the number of distinct genotypes divided by the number of rows.
+
+        Returns:
+            float: Ratio in (0, 1].
+        """
+        return self.genotype_index().uniqueness_ratio()
+
+    def replace_duplicates(self, policy='random', random_seed=None):
+        """
+        Replaces every row whose genotype already occurs in an earlier row (as
+        Population.replace_duplicates) and invalidates the replaced rows.
+
+        Parameters:
+            policy (str): 'random', 'mutate' or 'keep'.
+            random_seed (int): Seed for the new chromosomes (default is None).
+
+        Returns:
+            int: Number of replaced rows.
+
+        Raises:
+            ValueError: If policy is unknown.
+        """
+        if policy not in ('keep', 'random', 'mutate'):
+            raise ValueError(f"Unknown duplicate policy: {policy}")
+        rows = self.genotype_index().duplicates() if policy != 'keep' else np.empty(0, dtype=np.int64)
+        if len(rows) == 0:
+            return 0
+        rng = np.random.default_rng(random_seed)
+        if policy == 'random':
+            replaced = np.argsort(rng.random((len(rows), self.seqs.shape[1])), axis=1)
+        else:
+            replaced = self.seqs[rows]
+            swap_mutation(replaced, 1.0, 0.02, 0.1, rng=rng)
+        self.seqs[rows] = replaced
+        self.invalidate(rows)
+        return len(rows)
+
+    def min_max_scaling(self):
+        """
+        Applies min-max scaling to the fitness values (as Population.min_max_scaling).
+        """
+        low, high = self.fitness.min(), self.fitness.max()
+        if high - low > 0:
+            self.scaled_fitness = (self.fitness - low) / (high - low)
+        else:
+            self.scaled_fitness = np.ones(len(self))
+
+    def ranking(self):
+        """
+        Returns the row indices from the best to the worst (highest fitness first, stable).
+
+        Returns:
+            np.ndarray: Row indices.
+        """
+        return np.argsort(-self.fitness, kind='stable')
+
+    def best(self, k=1):
+        """
+        Returns the indices of the k best rows, best first.
+
+        Parameters:
+            k (int): Number of rows (default is 1).
+
+        Returns:
+            np.ndarray: Row indices.
+        """
+        k = min(k, len(self))
+        if k <= 0:
+            return np.empty(0, dtype=np.int64)
+        keys = -self.fitness
+        top = np.argpartition(keys, k - 1)[:k] if k < len(self) else np.arange(len(self))
+        return top[np.argsort(keys[top], kind='stable')]
+
+    def worst(self, k=1):
+        """
+        Returns the indices of the k worst rows, worst first.
+
+        Parameters:
+            k (int): Number of rows (default is 1).
+
+        Returns:
+            np.ndarray: Row indices.
+        """
+        k = min(k, len(self))
+        if k <= 0:
+            return np.empty(0, dtype=np.int64)
+        keys = self.fitness
+        top = np.argpartition(keys, k - 1)[:k] if k < len(self) else np.arange(len(self))
+        return top[np.argsort(keys[top], kind='stable')]
+
+    # ------------------------------------------------------------------
+    # index 기반 연산 (selection, elitism, migration)
+    # ------------------------------------------------------------------
+    def take(self, rows):
+        """
+        Returns a new population made of the given rows (rows may repeat, e.g. after selection).
+
+        Parameters:
+            rows (array-like): Row indices.
+
+        Returns:
+            ArrayPopulation: The new population.
+        """
+        rows = np.asarray(rows)
+        population = self.__class__.__new__(self.__class__)
+        population.config = self.config
+        population.op_data = self.op_data
+        population.generation = self.generation
+        population.seqs = self.seqs[rows]
+        population.makespan = self.makespan[rows]
+        population.mio_score = self.mio_score[rows]
+        population.fitness = self.fitness[rows]
+        population.scaled_fitness = self.scaled_fitness[rows]
+        population.age = self.age[rows]
+        return population
+
+    def assign(self, rows, source, source_rows=None):
+        """
+        Overwrites rows with rows of another population (or of this one), results included.
+
+        Parameters:
+            rows (array-like): Destination row indices.
+            source (ArrayPopulation): The population to copy from.
+            source_rows (array-like): Source row indices (default is all rows of source).
+        """
+        if source_rows is None:
+            source_rows = np.arange(len(source))
+        self.seqs[rows] = source.seqs[source_rows]
+        self.makespan[rows] = source.makespan[source_rows]
+        self.mio_score[rows] = source.mio_score[source_rows]
+        self.fitness[rows] = source.fitness[source_rows]
+        self.scaled_fitness[rows] = source.scaled_fitness[source_rows]
+        self.age[rows] = source.age[source_rows]
+
+    def preserve_elites(self, elites):
+        """
+        Replaces the worst rows with the rows of elites (see Population.preserve_elites).
+
+        Parameters:
+            elites (ArrayPopulation): The elites, e.g. self.take(self.best(k)) of the previous generation.
+        """
+        self.assign(self.worst(len(elites)), elites)
+
+    def advance_generation(self):
+        """
+        Starts the next generation (rows created from now on get the new age).
+        """
+        self.generation += 1
+
+    # ------------------------------------------------------------------
+    # 기존 list 기반 operator (Individual을 만들어 적용한 뒤 다시 배열로)
+    # ------------------------------------------------------------------
+    def _keep_rows(self, rows):
+        kept = self.take(rows)
+        self.seqs, self.makespan, self.mio_score = kept.seqs, kept.makespan, kept.mio_score
+        self.fitness, self.scaled_fitness, self.age = kept.fitness, kept.scaled_fitness, kept.age
+
+    def _replace_rows(self, individuals):
+        self.seqs = np.array([individual.seq for individual in individuals], dtype=self.seqs.dtype)
+        self._reset_results(len(self.seqs))
+        self._absorb_results(individuals, np.arange(len(individuals)))
+
+    def select(self, selection):
+        """
+        Replaces the rows by population_size selected rows.
+
+        Operators with select_indices (GAS/Selection/VectorizedSelection.py) draw the row
+        indices from the fitness vector and the rows are gathered with take, results
+        included; other operators are applied population_size times through Individuals.
+
+        Parameters:
+            selection: A selection operator from GAS/Selection.
+        """
+        if hasattr(selection, 'select_indices'):
+            self._keep_rows(selection.select_indices(self.fitness, self.config.population_size))
+            return
+        individuals = self.to_individuals(np.arange(len(self)))
+        selected = [selection.select(individuals) for _ in range(self.config.population_size)]
+        self._replace_rows(selected)
+
+    def crossover(self, crossover):
+        """
+        Applies a crossover operator to the row pairs (0, 1), (2, 3), ...
+
+        Operators with cross_batch (GAS/Crossover/BatchCrossover.py) cross all pairs on the
+        chromosome matrix in place and only the rows that changed lose their results; other
+        operators are applied pair by pair through Individuals. An odd last row is dropped.
+
+        Parameters:
+            crossover: A crossover operator from GAS/Crossover.
+        """
+        if hasattr(crossover, 'cross_batch'):
+            n_rows = len(self) - len(self) % 2
+            if n_rows < len(self):
+                self._keep_rows(np.arange(n_rows))
+            parents = self.seqs.copy()
+            self.seqs[0::2], self.seqs[1::2], _ = crossover.cross_batch(parents[0::2], parents[1::2])
+            self.invalidate((self.seqs != parents).any(axis=1))
+            return
+        parents = self.to_individuals(np.arange(len(self) - len(self) % 2))
+        children = []
+        for i in range(0, len(parents), 2):
+            children.extend(crossover.cross(parents[i], parents[i + 1]))
+        self._replace_rows(children)
+
+    def mutate(self, mutation):
+        """
+        Applies a mutation operator to every row.
+
+        Operators with mutate_batch (GAS/Mutation/BatchMutation.py) mutate the chromosome
+        matrix in place and only the rows that changed lose their results; other operators
+        are applied per row through Individuals.
+
+        Parameters:
+            mutation: A mutation operator from GAS/Mutation.
+        """
+        if hasattr(mutation, 'mutate_batch'):
+            self.invalidate(mutation.mutate_batch(self.seqs, self.config))
+            return
+        individuals = self.to_individuals(np.arange(len(self)))
+        mutated = []
+        for individual in individuals:
+            result = mutation.mutate(individual)
+            mutated.append(result if result is not None else individual)
+        self._replace_rows(mutated)
@@ -0,0 +1,174 @@
+"""
+Batch Decoder
+
+This script defines a batched version of the array decoder in GAS/Decoder.py. A whole
+population is given as an (N x n_op) integer matrix of chromosomes and all N semi-active
+schedules are advanced in lock-step, one sequence position per step, with vectorized
+NumPy operations over the population axis. This replaces N Python-level simulation runs
+with n_op array updates.
+
+Functions:
+    decode_genes(seq_matrix, op_data): Maps every gene to its job, step, machine and process time.
+    evaluate_population(seq_matrix, op_data, return_start): Decodes a chromosome matrix.
+    machine_order_keys(seq_matrix, op_data): Fitness cache keys of every row.
+    machine_order_matrix(seq_matrix, op_data): Machine order of every row.
+    evaluate_population_cached(seq_matrix, op_data, cache, machine_orders): Decodes only the rows missing from the cache.
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+from GAS.FitnessCache import machine_order_key
+from Data.Dataset.ProblemInstance import ProblemInstance
+
+
+def decode_genes(seq_matrix, op_data):
+    """
+    Maps every gene of a chromosome matrix to its job, step, machine and process time.
+
+    Parameters:
+        seq_matrix (np.ndarray): Chromosomes, shape (N, n_op).
+        op_data (ProblemInstance): The problem instance (nested op_data lists are also accepted).
+
+    Returns:
+        tuple: (jobs, steps, machines, times), each of shape (N, n_op).
+    """
+    instance = ProblemInstance.of(op_data)
+    n, n_op = seq_matrix.shape
+
+    # gene -> job, and the occurrence count of the job up to that position -> step
+    jobs = instance.job[seq_matrix]
+    order = np.argsort(jobs, axis=1, kind='stable')
+    steps = np.empty_like(jobs)
+    np.put_along_axis(steps, order, np.broadcast_to(instance.step, (n, n_op)), axis=1)
+
+    return jobs, steps, instance.machine_table[jobs, steps], instance.duration_table[jobs, steps]
+
+
+def evaluate_population(seq_matrix, op_data, return_start=False):
+    """
+    Decodes every row of a chromosome matrix into a semi-active schedule.
+
+    Each row must be a permutation of range(n_op), interpreted the same way as
+    Individual.seq: gene // n_machine is the job, and the k-th occurrence of a job
+    is its k-th operation (Individual.get_feasible).
+
+    Parameters:
+        seq_matrix (array-like): Chromosomes, shape (N, n_op).
+        op_data (ProblemInstance): The problem instance (nested op_data lists are also accepted).
+        return_start (bool): Also return the start time of every operation (default is False).
+
+    Returns:
+        tuple: (makespans, mio_scores) as arrays of shape (N,), followed by the start times
+               of shape (N, n_job, n_machine) indexed by [row, job, step] if return_start is True.
+    """
+    instance = ProblemInstance.of(op_data)
+    n_job, n_machine = instance.n_job, instance.n_machine
+    seq_matrix = np.asarray(seq_matrix)
+    n, n_op = seq_matrix.shape
+    jobs, steps, machines, times = decode_genes(seq_matrix, instance)
+
+    # Flat indices into the (N*n_job) job clocks and (N*n_machine) machine clocks, position-major
+    job_idx = np.ascontiguousarray((np.arange(n)[:, None] * n_job + jobs).T)
+    machine_idx = np.ascontiguousarray((np.arange(n)[:, None] * n_machine + machines).T)
+    times_t = np.ascontiguousarray(times.T)
+
+    job_ready = np.zeros(n * n_job, dtype=np.int64)
+    machine_ready = np.zeros(n * n_machine, dtype=np.int64)
+    finish = np.empty((n_op, n), dtype=np.int64) if return_start else None
+
+    for t in range(n_op):
+        ji = job_idx[t]
+        mi = machine_idx[t]
+        end = np.maximum(job_ready[ji], machine_ready[mi]) + times_t[t]
+        job_ready[ji] = end
+        machine_ready[mi] = end
+        if return_start:
+            finish[t] = end
+
+    makespans = job_ready.reshape(n, n_job).max(axis=1)
+
+    # Individual.evaluate와 동일하게 마지막 machine의 MIO로 score 계산
+    last_mio = steps[machines == n_machine - 1].reshape(n, n_job)
+    mio_scores = np.abs(last_mio - np.sort(last_mio, axis=1)).sum(axis=1)
+
+    if not return_start:
+        return makespans, mio_scores
+
+    start = np.zeros((n, n_job, n_machine), dtype=np.int64)
+    rows = np.broadcast_to(np.arange(n)[:, None], (n, n_op))
+    start[rows, jobs, steps] = finish.T - times
+    return makespans, mio_scores, start
+
+
+def machine_order_keys(seq_matrix, op_data):
+    """
+    Computes the fitness cache key of every row of a chromosome matrix.
+
+    The keys are identical to machine_order_key(individual.machine_order) of the
+    corresponding Individual, so both evaluation paths share cache entries.
+
+    Parameters:
+        seq_matrix (array-like): Chromosomes, shape (N, n_op).
+        op_data (ProblemInstance): The problem instance (nested op_data lists are also accepted).
+
+    Returns:
+        list: One key (bytes) per row.
+    """
+    return [machine_order_key(machine_order) for machine_order in machine_order_matrix(seq_matrix, op_data)]
+
+
+def machine_order_matrix(seq_matrix, op_data):
+    """
+    Computes the semi-active machine order of every row of a chromosome matrix.
+
+    Parameters:
+        seq_matrix (array-like): Chromosomes, shape (N, n_op).
+        op_data (ProblemInstance): The problem instance (nested op_data lists are also accepted).
+
+    Returns:
+        np.ndarray: Job order of every machine, shape (N, n_machine, n_job), equal to Individual.machine_order.
+    """
+    instance = ProblemInstance.of(op_data)
+    seq_matrix = np.asarray(seq_matrix)
+    jobs, _, machines, _ = decode_genes(seq_matrix, instance)
+    # machine 번호로 stable 정렬하면 각 machine의 job 순서가 이어 붙은 canonical machine order가 됨
+    order = np.argsort(machines, axis=1, kind='stable')
+    return np.take_along_axis(jobs, order, axis=1).reshape(len(seq_matrix), instance.n_machine, instance.n_job)
+
+
+def evaluate_population_cached(seq_matrix, op_data, cache, machine_orders=None):
+    """
+    Evaluates a chromosome matrix, decoding only the rows missing from the cache.
+
+    Parameters:
+        seq_matrix (array-like): Chromosomes, shape (N, n_op).
+        op_data (ProblemInstance): The problem instance (nested op_data lists are also accepted).
+        cache (FitnessCache): The fitness cache, or None to decode every row.
+        machine_orders (array-like): Semi-active machine orders of the rows if the caller already
+                                     computed them (see machine_order_matrix), used for the cache keys
+                                     (default is None, computed here).
+
+    Returns:
+        tuple: (makespans, mio_scores) as lists of length N.
+    """
+    instance = ProblemInstance.of(op_data)
+    seq_matrix = np.asarray(seq_matrix)
+    if cache is None:
+        makespans, mio_scores = evaluate_population(seq_matrix, instance)
+        return makespans.tolist(), mio_scores.tolist()
+
+    if machine_orders is None:
+        keys = machine_order_keys(seq_matrix, instance)
+    else:
+        keys = [machine_order_key(machine_order) for machine_order in machine_orders]
+    results = [cache.get(key) for key in keys]
+    missing = [i for i, result in enumerate(results) if result is None]
+    if missing:
+        makespans, mio_scores = evaluate_population(seq_matrix[missing], instance)
+        for i, makespan, mio_score in zip(missing, makespans.tolist(), mio_scores.tolist()):
+            results[i] = (makespan, mio_score)
+            cache.put(keys[i], results[i])
+    return [result[0] for result in results], [result[1] for result in results]
@@ -0,0 +1,424 @@
+"""
+Batch Crossover
+
+This script defines batched versions of the crossover operators in GAS/Crossover. Each
+kernel takes two (P x n_op) parent matrices, whose row r forms the pair
+(parents1[r], parents2[r]), and returns two (P x n_op) child matrices. The kernels work
+on inverse permutations (the position of every gene in a parent), so membership tests
+such as `gene in parent.seq[a:b]`, `list.index` and `list.count` become O(1) lookups and
+every operator is linear in n_op per pair. Operators without a sequential dependency
+(OX, POX, OBC, PBX, JBX, LOX, SXX, PSX) are vectorized across all pairs at once; PMX
+(sequential swaps) and CX (cycle walk) loop over the segment / cycle length with every
+step vectorized across pairs.
+
+Given the same cut points, the kernels produce the same children as the cross() method
+of the corresponding class, with two exceptions in PSX: the window in the second parent
+is clamped to the end of the sequence (cross() returns a chromosome of the wrong length
+there), and the missing genes are used in ascending order instead of set iteration order.
+tests/test_batch_crossover.py checks both properties.
+
+Every crossover class exposes its kernel as cross_batch(parents1, parents2, rng=None),
+which calls batch_crossover with the method and pc of the operator: parents are
+(P x n_op) matrices, rng is a numpy Generator or RandomState (default is the global
+np.random state), and the result is (children1, children2, crossed) where crossed marks
+the pairs that were crossed (the other rows are copies of the parents).
+
+Functions:
+    valid_permutations(seqs): Returns which rows of a matrix are permutations of 0..n_op-1.
+    order_crossover(parents1, parents2, point1, point2): OX (POX with point2 + 1).
+    pmx_crossover(parents1, parents2, point1, point2): PMX.
+    lox_crossover(parents1, parents2, point1, point2): LOX.
+    cycle_crossover(parents1, parents2, start): CX.
+    order_based_crossover(parents1, parents2, positions): OBC.
+    position_based_crossover(parents1, parents2, positions): PBX.
+    sxx_crossover(parents1, parents2, point1, point2): SXX.
+    psx_crossover(parents1, parents2, point1, point2): PSX.
+    jbx_crossover(parents1, parents2, job_point1, job_point2): JBX.
+    batch_crossover(parents1, parents2, method, pc, rng): Draws the cut points and applies a kernel to the crossed pairs.
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+BATCH_CROSSOVERS = ('OX', 'PMX', 'LOX', 'POX', 'CX', 'OBC', 'PBX', 'SXX', 'PSX', 'JBX')
+
+
+def _rng(rng):
+    return np.random.mtrand._rand if rng is None else rng
+
+
+def _integers(rng, high, size):
+    # Generator와 RandomState 모두에서 동작하도록 random()으로 생성 (high는 배열도 가능)
+    return np.minimum((rng.random(size) * high).astype(np.int64), np.asarray(high) - 1)
+
+
+def _gather(values, indices):
+    return np.take_along_axis(values, indices, axis=1)
+
+
+def _positions(seqs):
+    # positions[r, gene] = seqs[r]에서 gene의 위치 (역순열)
+    n_pair, n_op = seqs.shape
+    positions = np.empty((n_pair, n_op), dtype=np.intp)
+    np.put_along_axis(positions, seqs.astype(np.intp), np.broadcast_to(np.arange(n_op), (n_pair, n_op)), axis=1)
+    return positions
+
+
+def _window(n_op, start, stop):
+    index = np.arange(n_op)
+    return (index >= np.asarray(start)[:, None]) & (index < np.asarray(stop)[:, None])
+
+
+def _gene_mask(seqs, where):
+    # mask[r, gene] = True if gene이 seqs[r]의 where 위치에 있음
+    mask = np.zeros(seqs.shape, dtype=bool)
+    rows = np.nonzero(where)[0]
+    mask[rows, seqs[where]] = True
+    return mask
+
+
+def _keep_and_fill(keeper, donor, fixed, keeper_positions=None):
+    # keeper의 fixed 위치는 그대로 두고, 나머지 위치는 donor에서 그 gene들을 뺀 순서대로 채움
+    if keeper_positions is None:
+        keeper_positions = _positions(keeper)
+    child = keeper.copy()
+    skip = _gather(fixed, _gather(keeper_positions, donor))
+    child[~fixed] = donor[~skip]
+    return child
+
+
+def valid_permutations(seqs):
+    """
+    Returns which rows of a matrix are permutations of 0..n_op-1.
+
+    Parameters:
+        seqs (np.ndarray): Chromosome matrix of shape (P, n_op).
+
+    Returns:
+        np.ndarray: Boolean vector of shape (P,).
+    """
+    seqs = np.asarray(seqs)
+    n_pair, n_op = seqs.shape
+    in_range = ((seqs >= 0) & (seqs < n_op)).all(axis=1)
+    genes = np.where(seqs >= 0, np.minimum(seqs, n_op - 1), 0).astype(np.int64)
+    counts = np.bincount((genes + n_op * np.arange(n_pair)[:, None]).ravel(), minlength=n_pair * n_op)
+    return in_range & (counts.reshape(n_pair, n_op) == 1).all(axis=1)
+
+
+def order_crossover(parents1, parents2, point1, point2):
+    """
+    Order crossover (OrderCrossover.cross): child1 keeps parents1[point1:point2] and the
+    other positions are filled left to right with the remaining genes in the order of
+    parents2 (and vice versa). POXCrossover is the same operator with point2 + 1.
+
+    Parameters:
+        parents1 (np.ndarray): First parents, shape (P, n_op).
+        parents2 (np.ndarray): Second parents, shape (P, n_op).
+        point1 (np.ndarray): Start of the segment of each pair.
+        point2 (np.ndarray): End (exclusive) of the segment of each pair.
+
+    Returns:
+        tuple: (children1, children2).
+    """
+    window = _window(parents1.shape[1], point1, point2)
+    return _keep_and_fill(parents1, parents2, window), _keep_and_fill(parents2, parents1, window)
+
+
+def pmx_crossover(parents1, parents2, point1, point2):
+    """
+    Partial-mapped crossover (PMXCrossover.cross): for each position i of the segment,
+    child1 swaps position i with the position of parents2[i] in parents1 (and vice versa).
+
+    Parameters:
+        parents1 (np.ndarray): First parents, shape (P, n_op).
+        parents2 (np.ndarray): Second parents, shape (P, n_op).
+        point1 (np.ndarray): Start of the segment of each pair.
+        point2 (np.ndarray): End (exclusive) of the segment of each pair.
+
+    Returns:
+        tuple: (children1, children2).
+    """
+    point1, point2 = np.asarray(point1), np.asarray(point2)
+    positions1, positions2 = _positions(parents1), _positions(parents2)
+    children1, children2 = parents1.copy(), parents2.copy()
+    rows = np.arange(len(parents1))
+    # swap은 순서에 의존하므로 segment offset별로 반복하되, 각 단계는 모든 pair에 대해 한 번에 처리
+    for offset in range(int((point2 - point1).max(initial=0))):
+        active = rows[point1 + offset < point2]
+        i = point1[active] + offset
+        for children, positions, values in ((children1, positions1, parents2), (children2, positions2, parents1)):
+            j = positions[active, values[active, i]]
+            a, b = children[active, i], children[active, j]
+            children[active, i], children[active, j] = b, a
+    return children1, children2
+
+
+def _lox_child(parent, other, window, other_positions):
+    n_pair, n_op = parent.shape
+    child = np.full(parent.shape, -1, dtype=parent.dtype)
+    child[window] = other[window]
+    # other의 segment에 없는 gene을 순서대로 앞으로 당긴 뒤, segment 위치에 놓인 것은 버림
+    keep = ~_gather(window, _gather(other_positions, parent))
+    target = np.cumsum(keep, axis=1) - 1
+    placed = keep & ~_gather(window, np.maximum(target, 0))
+    rows = np.nonzero(placed)[0]
+    child[rows, target[placed]] = parent[placed]
+    # 남은 빈 자리는 other의 순서대로, child에 없는 gene으로 채움
+    present = _gene_mask(child, child >= 0)
+    child[child < 0] = other[~_gather(present, other)]
+    return child
+
+
+def lox_crossover(parents1, parents2, point1, point2):
+    """
+    Linear order crossover (LOXCrossover.cross): the genes of parents2[point1:point2] are
+    removed from parents1, the rest slide to the front, the segment of parents2 is written
+    over [point1, point2), and the holes left at the end are filled in the order of
+    parents2 (and vice versa).
+
+    Parameters:
+        parents1 (np.ndarray): First parents, shape (P, n_op).
+        parents2 (np.ndarray): Second parents, shape (P, n_op).
+        point1 (np.ndarray): Start of the segment of each pair.
+        point2 (np.ndarray): End (exclusive) of the segment of each pair.
+
+    Returns:
+        tuple: (children1, children2).
+    """
+    window = _window(parents1.shape[1], point1, point2)
+    return (_lox_child(parents1, parents2, window, _positions(parents2)),
+            _lox_child(parents2, parents1, window, _positions(parents1)))
+
+
+def cycle_crossover(parents1, parents2, start):
+    """
+    Cycle crossover (CXCrossover.cross): child1 takes parents1 on the cycle of positions
+    through start (i -> position of parents2[i] in parents1) and parents2 elsewhere
+    (and vice versa).
+
+    Parameters:
+        parents1 (np.ndarray): First parents, shape (P, n_op).
+        parents2 (np.ndarray): Second parents, shape (P, n_op).
+        start (np.ndarray): Start position of the cycle of each pair.
+
+    Returns:
+        tuple: (children1, children2).
+    """
+    start = np.asarray(start)
+    following = _gather(_positions(parents1), parents2)
+    cycle = np.zeros(parents1.shape, dtype=bool)
+    current = start.copy()
+    active = np.arange(len(parents1))
+    while len(active):
+        cycle[active, current[active]] = True
+        current[active] = following[active, current[active]]
+        active = active[current[active] != start[active]]
+    return np.where(cycle, parents1, parents2), np.where(cycle, parents2, parents1)
+
+
+def order_based_crossover(parents1, parents2, positions):
+    """
+    Order-based crossover (OBC.cross): child1 keeps parents1 at the selected positions and
+    the other positions are filled in the order of parents2 (and vice versa).
+
+    Parameters:
+        parents1 (np.ndarray): First parents, shape (P, n_op).
+        parents2 (np.ndarray): Second parents, shape (P, n_op).
+        positions (np.ndarray): Boolean mask of the selected positions, shape (P, n_op).
+
+    Returns:
+        tuple: (children1, children2).
+    """
+    return _keep_and_fill(parents1, parents2, positions), _keep_and_fill(parents2, parents1, positions)
+
+
+def position_based_crossover(parents1, parents2, positions):
+    """
+    Position-based crossover (PositionBasedCrossover.cross): child1 takes parents2 at the
+    selected positions and the other positions are filled in the order of parents1
+    (and vice versa).
+
+    Parameters:
+        parents1 (np.ndarray): First parents, shape (P, n_op).
+        parents2 (np.ndarray): Second parents, shape (P, n_op).
+        positions (np.ndarray): Boolean mask of the selected positions, shape (P, n_op).
+
+    Returns:
+        tuple: (children1, children2).
+    """
+    return _keep_and_fill(parents2, parents1, positions), _keep_and_fill(parents1, parents2, positions)
+
+
+def _exchange_and_legalize(base, source, base_start, source_start, length, missing_in_base_order):
+    # base[base_start:base_start + length]를 source의 같은 길이 구간으로 바꾼 뒤 중복 gene을 정리
+    n_op = base.shape[1]
+    base_window = _window(n_op, base_start, base_start + length)
+    child = base.copy()
+    child[base_window] = source[_window(n_op, source_start, source_start + length)]
+
+    # 새 segment의 gene이 window 밖에도 있으면 중복: 앞쪽에 있는 것을 missing gene으로 교체
+    base_positions = _positions(base)
+    rows, window_positions = np.nonzero(base_window)
+    other_positions = base_positions[rows, child[base_window]]
+    duplicated = ~base_window[rows, other_positions]
+    replace = np.zeros(base.shape, dtype=bool)
+    replace[rows[duplicated], np.minimum(window_positions, other_positions)[duplicated]] = True
+
+    # missing gene: base의 window에 있었지만 새 segment에는 없는 gene
+    new_genes = _gene_mask(child, base_window)
+    missing = base_window & ~_gather(new_genes, base)
+    if missing_in_base_order:
+        child[replace] = base[missing]
+    else:
+        child[replace] = np.nonzero(_gene_mask(base, missing))[1]
+    return child
+
+
+def sxx_crossover(parents1, parents2, point1, point2):
+    """
+    Substring exchange crossover (SXX.cross): the substrings [point1, point2) are exchanged
+    and the first occurrence of every duplicated gene is replaced by the missing genes in
+    the order of the original parent.
+
+    Parameters:
+        parents1 (np.ndarray): First parents, shape (P, n_op).
+        parents2 (np.ndarray): Second parents, shape (P, n_op).
+        point1 (np.ndarray): Start of the substring of each pair.
+        point2 (np.ndarray): End (exclusive) of the substring of each pair.
+
+    Returns:
+        tuple: (children1, children2).
+    """
+    point1, length = np.asarray(point1), np.asarray(point2) - np.asarray(point1)
+    return (_exchange_and_legalize(parents1, parents2, point1, point1, length, True),
+            _exchange_and_legalize(parents2, parents1, point1, point1, length, True))
+
+
+def psx_crossover(parents1, parents2, point1, point2):
+    """
+    Partially shifted crossover (PSXCrossover.cross): parents1[point1:point2] is exchanged
+    with the window of the same length in parents2 that starts at the first gene of that
+    segment, and the first occurrence of every duplicated gene is replaced by the missing
+    genes in ascending order. The window in parents2 is clamped to the end of the sequence.
+
+    Parameters:
+        parents1 (np.ndarray): First parents, shape (P, n_op).
+        parents2 (np.ndarray): Second parents, shape (P, n_op).
+        point1 (np.ndarray): Start of the segment of each pair in parents1.
+        point2 (np.ndarray): End (exclusive) of the segment of each pair in parents1.
+
+    Returns:
+        tuple: (children1, children2).
+    """
+    n_op = parents1.shape[1]
+    point1, length = np.asarray(point1), np.asarray(point2) - np.asarray(point1)
+    window = _window(n_op, point1, point1 + length)
+    start = np.where(window, _gather(_positions(parents2), parents1), n_op).min(axis=1)
+    start = np.minimum(start, n_op - length)
+    return (_exchange_and_legalize(parents1, parents2, point1, start, length, False),
+            _exchange_and_legalize(parents2, parents1, start, point1, length, False))
+
+
+def jbx_crossover(parents1, parents2, job_point1, job_point2):
+    """
+    Job-based crossover (JBX.cross): the genes with values in [job_point1, job_point2) stay
+    where they are in each parent and the other positions are filled in the order of the
+    other parent.
+
+    Parameters:
+        parents1 (np.ndarray): First parents, shape (P, n_op).
+        parents2 (np.ndarray): Second parents, shape (P, n_op).
+        job_point1 (np.ndarray): Lowest gene of the kept segment of each pair.
+        job_point2 (np.ndarray): End (exclusive) of the kept segment of each pair.
+
+    Returns:
+        tuple: (children1, children2).
+    """
+    low, high = np.asarray(job_point1)[:, None], np.asarray(job_point2)[:, None]
+    kept1 = (parents1 >= low) & (parents1 < high)
+    kept2 = (parents2 >= low) & (parents2 < high)
+    children1, children2 = parents1.copy(), parents2.copy()
+    children1[~kept1] = parents2[~kept2]
+    children2[~kept2] = parents1[~kept1]
+    return children1, children2
+
+
+def _cut_points(rng, n_pair, n_op):
+    # sorted(random.sample(range(n_op), 2))와 같은 분포
+    first = _integers(rng, n_op, n_pair)
+    second = _integers(rng, n_op - 1, n_pair)
+    second += second >= first
+    return np.minimum(first, second), np.maximum(first, second)
+
+
+def _random_positions(rng, n_pair, n_op):
+    # random.sample(range(n_op), random.randint(1, n_op - 1))와 같은 분포
+    size = 1 + _integers(rng, n_op - 1, n_pair)
+    order = np.argsort(rng.random((n_pair, n_op)), axis=1)
+    positions = np.zeros((n_pair, n_op), dtype=bool)
+    np.put_along_axis(positions, order, np.arange(n_op) < size[:, None], axis=1)
+    return positions
+
+
+def _cycle_start(rng, parents1, parents2, max_attempts=10):
+    # 길이 1인 cycle(두 부모의 gene이 같은 위치)이면 최대 max_attempts번 다시 뽑음
+    n_pair, n_op = parents1.shape
+    start = _integers(rng, n_op, n_pair)
+    rows = np.arange(n_pair)
+    for _ in range(max_attempts - 1):
+        rows = rows[parents1[rows, start[rows]] == parents2[rows, start[rows]]]
+        if len(rows) == 0:
+            break
+        start[rows] = _integers(rng, n_op, len(rows))
+    return start
+
+
+def batch_crossover(parents1, parents2, method='OX', pc=1.0, rng=None):
+    """
+    Draws the random cut points of every pair and applies a batched crossover kernel.
+
+    Each pair is crossed with probability pc, as in the cross() methods; the other pairs
+    are returned unchanged.
+
+    Parameters:
+        parents1 (np.ndarray): First parents, shape (P, n_op).
+        parents2 (np.ndarray): Second parents, shape (P, n_op).
+        method (str): One of BATCH_CROSSOVERS (default is 'OX').
+        pc (float): The probability of crossover (default is 1.0).
+        rng: numpy Generator or RandomState (default is the global np.random state).
+
+    Returns:
+        tuple: (children1, children2, crossed) where crossed is a boolean vector of the pairs that were crossed.
+
+    Raises:
+        ValueError: If method is unknown.
+    """
+    if method not in BATCH_CROSSOVERS:
+        raise ValueError(f"method must be one of {BATCH_CROSSOVERS}, got {method!r}")
+    rng = _rng(rng)
+    parents1, parents2 = np.asarray(parents1), np.asarray(parents2)
+    crossed = rng.random(len(parents1)) <= pc
+    children1, children2 = parents1.copy(), parents2.copy()
+    if not crossed.any() or parents1.shape[1] < 2:
+        return children1, children2, crossed & (parents1.shape[1] >= 2)
+
+    p1, p2 = parents1[crossed], parents2[crossed]
+    n_pair, n_op = p1.shape
+    if method in ('OBC', 'PBX'):
+        kernel = order_based_crossover if method == 'OBC' else position_based_crossover
+        c1, c2 = kernel(p1, p2, _random_positions(rng, n_pair, n_op))
+    elif method == 'CX':
+        c1, c2 = cycle_crossover(p1, p2, _cycle_start(rng, p1, p2))
+    else:
+        point1, point2 = _cut_points(rng, n_pair, n_op)
+        if method == 'POX':
+            c1, c2 = order_crossover(p1, p2, point1, point2 + 1)
+        else:
+            kernel = {'OX': order_crossover, 'PMX': pmx_crossover, 'LOX': lox_crossover,
+                      'SXX': sxx_crossover, 'PSX': psx_crossover, 'JBX': jbx_crossover}[method]
+            c1, c2 = kernel(p1, p2, point1, point2)
+    children1[crossed], children2[crossed] = c1, c2
+    return children1, children2, crossed
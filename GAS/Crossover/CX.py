@@ -1,13 +1,12 @@
 import sys
 import os
 import random
-import copy
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from GAS.Crossover.base import Crossover
+from GAS.Crossover.BatchCrossover import batch_crossover
 from GAS.Individual import Individual
 import random
-import copy
 
 class CXCrossover:
     def __init__(self, pc):
@@ -17,9 +16,10 @@ class CXCrossover:
         # print(f'CXCrossover')
         # print(f"Starting crossover between:\nParent1: {parent1.seq}\nParent2: {parent2.seq}")
         if random.random() > self.pc:
-            return copy.deepcopy(parent1), copy.deepcopy(parent2)
+            return parent1.clone(), parent2.clone()
 
-        size = len(parent1.seq)
+        seq1, seq2 = parent1.seq.tolist(), parent2.seq.tolist()  # 읽기 전용 seq 배열을 list로 복사하여 사용
+        size = len(seq1)
         child1_seq = [None] * size
         child2_seq = [None] * size
 
@@ -48,18 +48,18 @@ class CXCrossover:
             
             return cycle
 
-        cycle_indices = create_cycle(parent1.seq, parent2.seq)
+        cycle_indices = create_cycle(seq1, seq2)
         # print(f"Cycle indices: {cycle_indices}")
 
         for i in cycle_indices:
-            child1_seq[i] = parent1.seq[i]
-            child2_seq[i] = parent2.seq[i]
+            child1_seq[i] = seq1[i]
+            child2_seq[i] = seq2[i]
 
         for i in range(size):
             if child1_seq[i] is None:
-                child1_seq[i] = parent2.seq[i]
+                child1_seq[i] = seq2[i]
             if child2_seq[i] is None:
-                child2_seq[i] = parent1.seq[i]
+                child2_seq[i] = seq1[i]
 
         # print(f"Child1 sequence after crossover: {child1_seq}")
         # print(f"Child2 sequence after crossover: {child2_seq}")
@@ -68,5 +68,6 @@ class CXCrossover:
 
         return child1, child2
 
-
-
+    def cross_batch(self, parents1, parents2, rng=None):
+        # 모든 pair (parents1[r], parents2[r])에 대해 한 번에 cycle crossover 수행
+        return batch_crossover(parents1, parents2, 'CX', self.pc, rng)
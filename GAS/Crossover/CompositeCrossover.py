@@ -1,7 +1,7 @@
 import sys
 import os
 import random
-import copy
+import numpy as np
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
@@ -22,4 +22,17 @@ class CompositeCrossover:
             crossover = random.choice(self.crossovers)  # 무작위로 crossover 방식 선택
             return crossover.cross(parent1, parent2)  # 선택된 crossover 실행
         else:
-            return copy.deepcopy(parent1), copy.deepcopy(parent2)
+            return parent1.clone(), parent2.clone()
+
+    def cross_batch(self, parents1, parents2, rng=None):
+        # pair마다 pc 확률로 crossover 방식을 무작위로 고르고, 방식별로 묶어서 한 번에 실행
+        rng = np.random.mtrand._rand if rng is None else rng
+        children1, children2 = np.array(parents1, copy=True), np.array(parents2, copy=True)
+        crossed = np.zeros(len(children1), dtype=bool)
+        chosen = np.where(rng.random(len(children1)) < self.pc,
+                          np.minimum((rng.random(len(children1)) * len(self.crossovers)).astype(int), len(self.crossovers) - 1), -1)
+        for k, crossover in enumerate(self.crossovers):
+            rows = np.flatnonzero(chosen == k)
+            if len(rows):
+                children1[rows], children2[rows], crossed[rows] = crossover.cross_batch(children1[rows], children2[rows], rng)
+        return children1, children2, crossed
@@ -10,6 +10,7 @@ Classes:
 
 Functions:
     cross(parent1, parent2): Performs the job-based crossover operation on two parents.
+    cross_batch(parents1, parents2, rng): Performs the job-based crossover on all pairs of two parent matrices at once.
 """
 
 import sys
@@ -18,6 +19,7 @@ import random
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from GAS.Crossover.base import Crossover
+from GAS.Crossover.BatchCrossover import batch_crossover
 from GAS.Individual import Individual
 
 class JBX(Crossover):
@@ -51,38 +53,45 @@ class JBX(Crossover):
         if random.random() > self.pc:
             return parent1, parent2
 
+        seq1, seq2 = parent1.seq.tolist(), parent2.seq.tolist()  # 읽기 전용 seq 배열을 list로 복사하여 사용
         # Job-based crossover points
-        jobs = list(set(parent1.seq))
+        jobs = list(set(seq1))
         num_jobs = len(jobs)
         job_point1, job_point2 = sorted(random.sample(range(num_jobs), 2))
 
         # Create empty child sequences
-        child1, child2 = [-1] * len(parent1.seq), [-1] * len(parent2.seq)
+        child1, child2 = [-1] * len(seq1), [-1] * len(seq2)
 
         # Keep the job segments
         job_segment1 = jobs[job_point1:job_point2]
         job_segment2 = jobs[job_point1:job_point2]
 
         # Copy the job segments to children
-        for i in range(len(parent1.seq)):
-            if parent1.seq[i] in job_segment1:
-                child1[i] = parent1.seq[i]
-            if parent2.seq[i] in job_segment2:
-                child2[i] = parent2.seq[i]
+        for i in range(len(seq1)):
+            if seq1[i] in job_segment1:
+                child1[i] = seq1[i]
+            if seq2[i] in job_segment2:
+                child2[i] = seq2[i]
 
         # Fill the remaining positions with the jobs from the other parent
         current_pos1, current_pos2 = 0, 0
-        for i in range(len(parent1.seq)):
+        for i in range(len(seq1)):
             if child1[i] == -1:
-                while parent2.seq[current_pos1] in job_segment1:
+                while seq2[current_pos1] in job_segment1:
                     current_pos1 += 1
-                child1[i] = parent2.seq[current_pos1]
+                child1[i] = seq2[current_pos1]
                 current_pos1 += 1
 
             if child2[i] == -1:
-                while parent1.seq[current_pos2] in job_segment2:
+                while seq1[current_pos2] in job_segment2:
                     current_pos2 += 1
-                child2[i] = parent1.seq[current_pos2]
+                child2[i] = seq1[current_pos2]
                 current_pos2 += 1
 
         return Individual(config=parent1.config, seq=child1, op_data=parent1.op_data), Individual(config=parent2.config, seq=child2, op_data=parent2.op_data)
+
+    def cross_batch(self, parents1, parents2, rng=None):
+        """
+        Crosses all pairs (parents1[r], parents2[r]) at once with the JBX kernel of GAS/Crossover/BatchCrossover.py.
+        """
+        return batch_crossover(parents1, parents2, 'JBX', self.pc, rng)
@@ -11,6 +11,7 @@ Classes:
 
 Functions:
     cross(parent1, parent2): Performs the linear order crossover operation on two parents.
+    cross_batch(parents1, parents2, rng): Performs the linear order crossover on all pairs of two parent matrices at once.
 """
 
 import sys
@@ -19,6 +20,7 @@ import random
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from GAS.Crossover.base import Crossover
+from GAS.Crossover.BatchCrossover import batch_crossover
 from GAS.Individual import Individual
 
 # Linear order crossover 
@@ -53,16 +55,17 @@ class LOXCrossover(Crossover):
         if random.random() > self.pc:
             return parent1, parent2
 
-        size = len(parent1.seq)
+        seq1, seq2 = parent1.seq.tolist(), parent2.seq.tolist()  # 읽기 전용 seq 배열을 list로 복사하여 사용
+        size = len(seq1)
         
         # Step 1: Randomly select sublists from both parents
         point1, point2 = sorted(random.sample(range(size), 2))
-        sublist1 = parent1.seq[point1:point2]
-        sublist2 = parent2.seq[point1:point2]
+        sublist1 = seq1[point1:point2]
+        sublist2 = seq2[point1:point2]
 
         # Step 2: Remove sublists and create holes
-        child1_holes = [gene if gene not in sublist2 else None for gene in parent1.seq]
-        child2_holes = [gene if gene not in sublist1 else None for gene in parent2.seq]
+        child1_holes = [gene if gene not in sublist2 else None for gene in seq1]
+        child2_holes = [gene if gene not in sublist1 else None for gene in seq2]
 
         # Slide holes to the end
         child1 = [gene for gene in child1_holes if gene is not None]
@@ -76,8 +79,8 @@ class LOXCrossover(Crossover):
         child2[point1:point2] = sublist1
 
         # Handle remaining holes by filling with the remaining elements in the order they appear in the other parent
-        remaining1 = [gene for gene in parent2.seq if gene not in child1]
-        remaining2 = [gene for gene in parent1.seq if gene not in child2]
+        remaining1 = [gene for gene in seq2 if gene not in child1]
+        remaining2 = [gene for gene in seq1 if gene not in child2]
 
         for i in range(size):
             if child1[i] is None:
@@ -86,3 +89,9 @@ class LOXCrossover(Crossover):
                 child2[i] = remaining2.pop(0)
 
         return Individual(config=parent1.config, seq=child1, op_data=parent1.op_data), Individual(config=parent1.config, seq=child2, op_data=parent1.op_data)
+
+    def cross_batch(self, parents1, parents2, rng=None):
+        """
+        Crosses all pairs (parents1[r], parents2[r]) at once with the LOX kernel of GAS/Crossover/BatchCrossover.py.
+        """
+        return batch_crossover(parents1, parents2, 'LOX', self.pc, rng)
@@ -11,6 +11,7 @@ Classes:
 
 Functions:
     cross(parent1, parent2): Performs the order crossover operation on two parents.
+    cross_batch(parents1, parents2, rng): Performs the order crossover on all pairs of two parent matrices at once.
 """
 ##
 import sys
@@ -19,6 +20,7 @@ import random
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from GAS.Crossover.base import Crossover
+from GAS.Crossover.BatchCrossover import batch_crossover
 from GAS.Individual import Individual
 
 # Order Crossover
@@ -53,15 +55,16 @@ class OrderCrossover(Crossover):
         if random.random() > self.pc:
             return parent1, parent2
 
-        point1, point2 = sorted(random.sample(range(len(parent1.seq)), 2))
-        child1, child2 = parent1.seq[:], parent2.seq[:]
+        seq1, seq2 = parent1.seq.tolist(), parent2.seq.tolist()  # 읽기 전용 seq 배열을 list로 복사하여 사용
+        point1, point2 = sorted(random.sample(range(len(seq1)), 2))
+        child1, child2 = seq1[:], seq2[:]
 
         # Create proto-children by inserting the selected substring into the corresponding positions
-        child1[point1:point2], child2[point1:point2] = parent1.seq[point1:point2], parent2.seq[point1:point2]
+        child1[point1:point2], child2[point1:point2] = seq1[point1:point2], seq2[point1:point2]
 
         # Remove the selected substring symbols from the other parent
-        temp1 = [item for item in parent2.seq if item not in parent1.seq[point1:point2]]
-        temp2 = [item for item in parent1.seq if item not in parent2.seq[point1:point2]]
+        temp1 = [item for item in seq2 if item not in seq1[point1:point2]]
+        temp2 = [item for item in seq1 if item not in seq2[point1:point2]]
 
         # Fill unfixed positions
         idx1, idx2 = 0, 0
@@ -73,3 +76,9 @@ class OrderCrossover(Crossover):
                 idx2 += 1
 
         return Individual(config=parent1.config, seq=child1, op_data=parent1.op_data), Individual(config=parent1.config, seq=child2, op_data=parent1.op_data)
+
+    def cross_batch(self, parents1, parents2, rng=None):
+        """
+        Crosses all pairs (parents1[r], parents2[r]) at once with the OX kernel of GAS/Crossover/BatchCrossover.py.
+        """
+        return batch_crossover(parents1, parents2, 'OX', self.pc, rng)
@@ -10,6 +10,7 @@ Classes:
 
 Functions:
     cross(parent1, parent2): Performs the partial-mapped crossover operation on two parents.
+    cross_batch(parents1, parents2, rng): Performs the partial-mapped crossover on all pairs of two parent matrices at once.
 """
 ##
 import sys
@@ -18,6 +19,7 @@ import random
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from GAS.Crossover.base import Crossover
+from GAS.Crossover.BatchCrossover import batch_crossover
 from GAS.Individual import Individual
 
 # Partial-Mapped Crossover
@@ -53,13 +55,20 @@ class PMXCrossover(Crossover):
             # If the random number is greater than pc, return parents as children without crossover
             return parent1, parent2
 
-        point1, point2 = sorted(random.sample(range(len(parent1.seq)), 2))
-        child1, child2 = parent1.seq[:], parent2.seq[:]
+        seq1, seq2 = parent1.seq.tolist(), parent2.seq.tolist()  # 읽기 전용 seq 배열을 list로 복사하여 사용
+        point1, point2 = sorted(random.sample(range(len(seq1)), 2))
+        child1, child2 = seq1[:], seq2[:]
 
         for i in range(point1, point2):
-            val1, val2 = parent1.seq[i], parent2.seq[i]
-            idx1, idx2 = parent1.seq.index(val2), parent2.seq.index(val1)
+            val1, val2 = seq1[i], seq2[i]
+            idx1, idx2 = seq1.index(val2), seq2.index(val1)
             child1[i], child1[idx1] = child1[idx1], child1[i]
             child2[i], child2[idx2] = child2[idx2], child2[i]
 
         return Individual(config=parent1.config, seq=child1, op_data=parent1.op_data), Individual(config=parent1.config, seq=child2, op_data=parent1.op_data)
+
+    def cross_batch(self, parents1, parents2, rng=None):
+        """
+        Crosses all pairs (parents1[r], parents2[r]) at once with the PMX kernel of GAS/Crossover/BatchCrossover.py.
+        """
+        return batch_crossover(parents1, parents2, 'PMX', self.pc, rng)
@@ -11,6 +11,7 @@ Classes:
 
 Functions:
     cross(parent1, parent2): Performs the partially ordered crossover operation on two parents.
+    cross_batch(parents1, parents2, rng): Performs the partially ordered crossover on all pairs of two parent matrices at once.
 """
 
 import sys
@@ -19,6 +20,7 @@ import random
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from GAS.Crossover.base import Crossover
+from GAS.Crossover.BatchCrossover import batch_crossover
 from GAS.Individual import Individual
 
 class POXCrossover(Crossover):
@@ -52,7 +54,8 @@ class POXCrossover(Crossover):
         if random.random() > self.pc:
             return parent1, parent2
 
-        seq_length = len(parent1.seq)
+        seq1, seq2 = parent1.seq.tolist(), parent2.seq.tolist()  # 읽기 전용 seq 배열을 list로 복사하여 사용
+        seq_length = len(seq1)
         child1_seq = [-1] * seq_length
         child2_seq = [-1] * seq_length
 
@@ -62,12 +65,12 @@ class POXCrossover(Crossover):
         sj1, sj2 = sub_jobs[0], sub_jobs[1]
 
         # Step 2: Copy the subsequence from each parent to the corresponding child
-        child1_seq[sj1:sj2+1] = parent1.seq[sj1:sj2+1]
-        child2_seq[sj1:sj2+1] = parent2.seq[sj1:sj2+1]
+        child1_seq[sj1:sj2+1] = seq1[sj1:sj2+1]
+        child2_seq[sj1:sj2+1] = seq2[sj1:sj2+1]
 
         # Step 3: Remove the selected subsequence symbols from the other parent
-        p2_remaining_genes = [gene for gene in parent2.seq if gene not in parent1.seq[sj1:sj2+1]]
-        p1_remaining_genes = [gene for gene in parent1.seq if gene not in parent2.seq[sj1:sj2+1]]
+        p2_remaining_genes = [gene for gene in seq2 if gene not in seq1[sj1:sj2+1]]
+        p1_remaining_genes = [gene for gene in seq1 if gene not in seq2[sj1:sj2+1]]
 
         # Step 4: Fill the remaining positions in the children with the remaining genes
         child1_index, child2_index = 0, 0
@@ -80,3 +83,9 @@ class POXCrossover(Crossover):
                 child2_index += 1
 
         return Individual(config=parent1.config, seq=child1_seq, machine_assignment=parent1.machine_assignment, op_data=parent1.op_data), Individual(config=parent1.config, seq=child2_seq, machine_assignment=parent2.machine_assignment, op_data=parent1.op_data)
+
+    def cross_batch(self, parents1, parents2, rng=None):
+        """
+        Crosses all pairs (parents1[r], parents2[r]) at once with the POX kernel of GAS/Crossover/BatchCrossover.py.
+        """
+        return batch_crossover(parents1, parents2, 'POX', self.pc, rng)
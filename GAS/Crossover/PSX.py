@@ -11,15 +11,16 @@ Classes:
 
 Functions:
     cross(parent1, parent2): Performs the partially shifted crossover operation on two parents.
+    cross_batch(parents1, parents2, rng): Performs the partially shifted crossover on all pairs of two parent matrices at once.
 """
 
 import sys
 import os
 import random
-from copy import deepcopy
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from GAS.Crossover.base import Crossover
+from GAS.Crossover.BatchCrossover import batch_crossover
 from GAS.Individual import Individual
 
 class PSXCrossover(Crossover):
@@ -53,26 +54,27 @@ class PSXCrossover(Crossover):
         if random.random() > self.pc:
             return parent1, parent2
 
-        size = len(parent1.seq)
+        seq1, seq2 = parent1.seq.tolist(), parent2.seq.tolist()  # 읽기 전용 seq 배열을 list로 복사하여 사용
+        size = len(seq1)
         point1, point2 = sorted(random.sample(range(size), 2))
 
         # Step 1: Identify a partial schedule in one parent and identify the corresponding part in the other parent
-        partial1 = parent1.seq[point1:point2]
+        partial1 = seq1[point1:point2]
         partial2 = []
 
         # Find the corresponding part in parent2 centered around the same jobs as in parent1
         start_index = None
         for i in range(size):
-            if parent2.seq[i] in partial1:
+            if seq2[i] in partial1:
                 start_index = i
                 break
         if start_index is not None:
             end_index = start_index + len(partial1)
-            partial2 = parent2.seq[start_index:end_index]
+            partial2 = seq2[start_index:end_index]
 
         # Step 2: Exchange the partial schedules to create proto-offspring
-        proto_offspring1 = deepcopy(parent1.seq)
-        proto_offspring2 = deepcopy(parent2.seq)
+        proto_offspring1 = seq1[:]
+        proto_offspring2 = seq2[:]
         
         proto_offspring1[point1:point2] = partial2
         proto_offspring2[start_index:end_index] = partial1
@@ -107,8 +109,13 @@ class PSXCrossover(Crossover):
 
             return proto
 
-        final_offspring1 = legalize(proto_offspring1, parent1.seq)
-        final_offspring2 = legalize(proto_offspring2, parent2.seq)
+        final_offspring1 = legalize(proto_offspring1, seq1)
+        final_offspring2 = legalize(proto_offspring2, seq2)
 
         return Individual(config=parent1.config, seq=final_offspring1, op_data=parent1.op_data), Individual(config=parent2.config, seq=final_offspring2, op_data=parent2.op_data)
 
+    def cross_batch(self, parents1, parents2, rng=None):
+        """
+        Crosses all pairs (parents1[r], parents2[r]) at once with the PSX kernel of GAS/Crossover/BatchCrossover.py.
+        """
+        return batch_crossover(parents1, parents2, 'PSX', self.pc, rng)
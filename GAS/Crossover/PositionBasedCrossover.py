@@ -11,6 +11,7 @@ Classes:
 
 Functions:
     cross(parent1, parent2): Performs the position-based crossover operation on two parents.
+    cross_batch(parents1, parents2, rng): Performs the position-based crossover on all pairs of two parent matrices at once.
 """
 
 import sys
@@ -19,6 +20,7 @@ import random
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from GAS.Crossover.base import Crossover
+from GAS.Crossover.BatchCrossover import batch_crossover
 from GAS.Individual import Individual
 
 # Position-Based Crossover
@@ -53,7 +55,8 @@ class PositionBasedCrossover(Crossover):
         if random.random() > self.pc:
             return parent1, parent2
 
-        size = len(parent1.seq)
+        seq1, seq2 = parent1.seq.tolist(), parent2.seq.tolist()  # 읽기 전용 seq 배열을 list로 복사하여 사용
+        size = len(seq1)
         child1, child2 = [None] * size, [None] * size
 
         # Step 1: Select positions from Parent 1
@@ -61,12 +64,12 @@ class PositionBasedCrossover(Crossover):
 
         # Step 2: Produce Proto-child
         for pos in positions:
-            child1[pos] = parent2.seq[pos]
-            child2[pos] = parent1.seq[pos]
+            child1[pos] = seq2[pos]
+            child2[pos] = seq1[pos]
 
         # Step 3: Remove selected positions' symbols from the other parent
-        parent1_remaining = [item for item in parent1.seq if item not in child1]
-        parent2_remaining = [item for item in parent2.seq if item not in child2]
+        parent1_remaining = [item for item in seq1 if item not in child1]
+        parent2_remaining = [item for item in seq2 if item not in child2]
 
         # Step 4: Fill unfixed positions
         idx1, idx2 = 0, 0
@@ -79,3 +82,9 @@ class PositionBasedCrossover(Crossover):
                 idx2 += 1
 
         return Individual(config=parent1.config, seq=child1, op_data=parent1.op_data), Individual(config=parent1.config, seq=child2, op_data=parent2.op_data)
+
+    def cross_batch(self, parents1, parents2, rng=None):
+        """
+        Crosses all pairs (parents1[r], parents2[r]) at once with the PBX kernel of GAS/Crossover/BatchCrossover.py.
+        """
+        return batch_crossover(parents1, parents2, 'PBX', self.pc, rng)
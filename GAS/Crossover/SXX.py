@@ -11,6 +11,7 @@ Classes:
 
 Functions:
     cross(parent1, parent2): Performs the substring exchange crossover operation on two parents.
+    cross_batch(parents1, parents2, rng): Performs the substring exchange crossover on all pairs of two parent matrices at once.
     legalize(proto, original_seq): Adjusts the proto-offspring to ensure valid sequences.
 """
 
@@ -20,6 +21,7 @@ import random
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 import numpy as np
 from GAS.Crossover.base import Crossover
+from GAS.Crossover.BatchCrossover import batch_crossover
 from GAS.Individual import Individual
 
 # Substring exchange crossover
@@ -52,15 +54,16 @@ class SXX(Crossover):
             tuple: Two offspring individuals resulting from the crossover.
         """
         if random.random() < self.pc:
-            point1, point2 = sorted(random.sample(range(len(parent1.seq)), 2))
-            substring1 = parent1.seq[point1:point2]
-            substring2 = parent2.seq[point1:point2]
+            seq1, seq2 = parent1.seq.tolist(), parent2.seq.tolist()  # 읽기 전용 seq 배열을 list로 복사하여 사용
+            point1, point2 = sorted(random.sample(range(len(seq1)), 2))
+            substring1 = seq1[point1:point2]
+            substring2 = seq2[point1:point2]
 
-            proto_child1 = parent1.seq[:point1] + substring2 + parent1.seq[point2:]
-            proto_child2 = parent2.seq[:point1] + substring1 + parent2.seq[point2:]
+            proto_child1 = seq1[:point1] + substring2 + seq1[point2:]
+            proto_child2 = seq2[:point1] + substring1 + seq2[point2:]
 
-            offspring1 = self.legalize(proto_child1, parent1.seq)
-            offspring2 = self.legalize(proto_child2, parent2.seq)
+            offspring1 = self.legalize(proto_child1, seq1)
+            offspring2 = self.legalize(proto_child2, seq2)
 
             return Individual(config=parent1.config, seq=offspring1, op_data=parent1.op_data), Individual(config=parent1.config, seq=offspring2, op_data=parent1.op_data)
 
@@ -91,3 +94,9 @@ class SXX(Crossover):
                     proto[i] = missing_genes.pop(0)
 
         return proto
+
+    def cross_batch(self, parents1, parents2, rng=None):
+        """
+        Crosses all pairs (parents1[r], parents2[r]) at once with the SXX kernel of GAS/Crossover/BatchCrossover.py.
+        """
+        return batch_crossover(parents1, parents2, 'SXX', self.pc, rng)
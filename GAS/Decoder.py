@@ -0,0 +1,288 @@
+"""
+Array Decoder
+
+This script defines an array-based decoder that computes the semi-active schedule
+of a chromosome directly from its machine order, without building a SimPy model.
+It produces the same makespan and machine input order (MIO) as the simulation in
+environment/, but in a single O(n_op) pass, so it can be used as the fast path of
+Individual.evaluate.
+
+decode_active is an alternative decoder: it reads the chromosome as a priority list and
+builds the schedule Giffler-Thompson style, so the result is an active schedule (delta=1),
+a non-delay schedule (delta=0) or a parameterised schedule in between. Its machine order
+is then evaluated like any other (the semi-active decoding of an active machine order is
+the active schedule itself). It is selected with Run_Config(decoder='active', active_delta=...).
+
+Classes:
+    Schedule: Holds the start/finish times and per-machine order of a decoded schedule.
+
+Functions:
+    decode_chromosome(seq, op_data): Decodes a chromosome into job_seq, feasible_seq and a flat machine order in one pass.
+    decode_semi_active(machine_order, op_data): Decodes a machine order into a semi-active schedule.
+    decode_active(seq, op_data, delta): Decodes a chromosome into a parameterised active schedule.
+    machine_input_order(machine_order, op_data): Returns the MIO of a machine order without decoding it.
+    machine_input_order_score(steps): Returns the MIO score of the input order of one machine.
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+from Data.Dataset.ProblemInstance import ProblemInstance
+
+
+class Schedule:
+    """
+    Holds the result of decoding a chromosome.
+
+    Attributes:
+        start (np.ndarray): Start time of each operation, indexed by [job, step].
+        finish (np.ndarray): Finish time of each operation, indexed by [job, step].
+        makespan (int): Completion time of the last operation.
+        machine_order (list): For each machine, the job order that produced the schedule.
+        mio (list): For each machine, the steps of the processed operations in processing order
+                    (the same values as Machine.op_where in the SimPy model).
+    """
+
+    def __init__(self, start, finish, makespan, machine_order, mio):
+        self.start = start
+        self.finish = finish
+        self.makespan = makespan
+        self.machine_order = machine_order
+        self.mio = mio
+
+    def __str__(self):
+        return f"Schedule(makespan={self.makespan})"
+
+
+def _stable_order(keys, n_keys):
+    # 작은 정수형이면 numpy가 stable 정렬에 radix sort를 사용하므로 O(n)
+    dtype = np.uint8 if n_keys <= 256 else np.uint16 if n_keys <= 65536 else np.int64
+    return np.argsort(keys.astype(dtype, copy=False), kind='stable')
+
+
+def decode_chromosome(seq, op_data):
+    """
+    Decodes a chromosome into job_seq, feasible_seq and a flat machine order in one pass.
+
+    This replaces Individual.get_repeatable, get_feasible and get_machine_order, which
+    together scan the sequence O(n_job * n_machine) times. Here every stage is a
+    linear-time array operation (table lookups and two counting sorts).
+
+    Parameters:
+        seq (array-like): Chromosome, a permutation of range(n_op).
+        op_data (ProblemInstance): The problem instance (nested op_data lists are also accepted).
+
+    Returns:
+        tuple: (job_seq, feasible_seq, machine_flat, machine_offsets) where
+               job_seq[i] is the job of gene i,
+               feasible_seq[i] is the operation (job * n_machine + step) of gene i,
+               machine_flat[machine_offsets[m]:machine_offsets[m + 1]] is the job order on machine m.
+    """
+    instance = ProblemInstance.of(op_data)
+    job_seq = instance.job[np.asarray(seq)]
+
+    # job별 stable 정렬 후 i번째 위치 = job * n_machine + (job 내 순번) = operation 번호
+    feasible_seq = np.empty(instance.n_op, dtype=np.int64)
+    feasible_seq[_stable_order(job_seq, instance.n_job)] = np.arange(instance.n_op)
+
+    machines = instance.machine[feasible_seq]
+    machine_flat = job_seq[_stable_order(machines, instance.n_machine)]
+    machine_offsets = np.zeros(instance.n_machine + 1, dtype=np.int64)
+    np.cumsum(np.bincount(machines, minlength=instance.n_machine), out=machine_offsets[1:])
+    return job_seq, feasible_seq, machine_flat, machine_offsets
+
+
+def decode_semi_active(machine_order, op_data):
+    """
+    Decodes a machine order into a semi-active schedule.
+
+    Every operation starts as soon as both its job predecessor and its machine
+    predecessor have finished, which is exactly the behaviour of the Manual
+    dispatch mode of environment/Process.py. Operations are released through a
+    worklist, so each one is visited once.
+
+    Parameters:
+        machine_order (list): For each machine, the order in which jobs are processed.
+        op_data (ProblemInstance): The problem instance (nested op_data lists are also accepted).
+
+    Returns:
+        Schedule: The decoded schedule.
+
+    Raises:
+        ValueError: If the machine order deadlocks (is not consistent with the job routes).
+    """
+    instance = ProblemInstance.of(op_data)
+    n_job, n_machine = instance.n_job, instance.n_machine
+    machine_of = instance.machine_table.tolist()
+    time_of = instance.duration_table.tolist()
+
+    start = [[0] * n_machine for _ in range(n_job)]
+    finish = [[0] * n_machine for _ in range(n_job)]
+    job_step = [0] * n_job
+    job_ready = [0] * n_job
+    machine_pos = [0] * n_machine
+    machine_ready = [0] * n_machine
+    mio = [[] for _ in range(n_machine)]
+
+    def head_is_ready(m):
+        pos = machine_pos[m]
+        if pos >= len(machine_order[m]):
+            return False
+        j = machine_order[m][pos]
+        return job_step[j] < n_machine and machine_of[j][job_step[j]] == m
+
+    ready = [m for m in range(n_machine) if head_is_ready(m)]
+    queued = [False] * n_machine
+    for m in ready:
+        queued[m] = True
+    scheduled = 0
+    while ready:
+        m = ready.pop()
+        queued[m] = False
+        j = machine_order[m][machine_pos[m]]
+        s = job_step[j]
+
+        t = job_ready[j] if job_ready[j] > machine_ready[m] else machine_ready[m]
+        end = t + time_of[j][s]
+        start[j][s] = t
+        finish[j][s] = end
+        job_ready[j] = end
+        machine_ready[m] = end
+        mio[m].append(s)
+        scheduled += 1
+
+        job_step[j] += 1
+        machine_pos[m] += 1
+        if head_is_ready(m):
+            ready.append(m)
+            queued[m] = True
+        if job_step[j] < n_machine:
+            next_m = machine_of[j][job_step[j]]
+            if not queued[next_m] and head_is_ready(next_m):
+                ready.append(next_m)
+                queued[next_m] = True
+
+    if scheduled != n_job * n_machine:
+        raise ValueError(f"Machine order deadlocks after {scheduled} of {n_job * n_machine} operations.")
+
+    return Schedule(np.array(start), np.array(finish), max(job_ready), machine_order, mio)
+
+
+def decode_active(seq, op_data, delta=1.0):
+    """
+    Decodes a chromosome into a parameterised active schedule (Giffler-Thompson).
+
+    The k-th occurrence of job j in seq gives operation (j, k) the priority of its position,
+    as in decode_chromosome. At every step the operation that can finish first defines the
+    machine m* and its completion time C*. Among the operations waiting for m*, those that
+    can start before S* + delta * (C* - S*), where S* is the earliest start on m*, form the
+    conflict set, and the one that comes first in seq is scheduled. delta=1 gives active
+    schedules, delta=0 non-delay schedules.
+
+    Parameters:
+        seq (array-like): Chromosome, a permutation of range(n_op).
+        op_data (ProblemInstance): The problem instance (nested op_data lists are also accepted).
+        delta (float): Look-ahead between non-delay (0) and active (1) (default is 1.0).
+
+    Returns:
+        Schedule: The decoded schedule.
+    """
+    if not 0.0 <= delta <= 1.0:
+        raise ValueError(f"delta must be in [0, 1]: {delta}")
+    instance = ProblemInstance.of(op_data)
+    n_job, n_machine = instance.n_job, instance.n_machine
+    machine_of = instance.machine_table.tolist()
+    time_of = instance.duration_table.tolist()
+
+    # priority[op] = seq에서 operation op가 나타나는 위치
+    _, feasible_seq, _, _ = decode_chromosome(seq, instance)
+    priority = [0] * instance.n_op
+    for pos, op in enumerate(feasible_seq.tolist()):
+        priority[op] = pos
+
+    start = [[0] * n_machine for _ in range(n_job)]
+    finish = [[0] * n_machine for _ in range(n_job)]
+    job_step = [0] * n_job
+    job_ready = [0] * n_job
+    machine_ready = [0] * n_machine
+    machine_order = [[] for _ in range(n_machine)]
+    mio = [[] for _ in range(n_machine)]
+    # machine별로 다음 operation이 그 machine에 있는 job들
+    waiting = [[] for _ in range(n_machine)]
+    for j in range(n_job):
+        waiting[machine_of[j][0]].append(j)
+
+    for _ in range(instance.n_op):
+        # 가장 먼저 끝날 수 있는 operation의 machine m*와 종료 시각 C*
+        best_end = None
+        for m in range(n_machine):
+            jobs = waiting[m]
+            if not jobs:
+                continue
+            ready = machine_ready[m]
+            for j in jobs:
+                t = job_ready[j] if job_ready[j] > ready else ready
+                end = t + time_of[j][job_step[j]]
+                if best_end is None or end < best_end:
+                    best_end, m_star = end, m
+
+        # conflict set: S* + delta * (C* - S*) 이전에 시작할 수 있는 operation 중 seq에서 가장 앞선 것
+        jobs = waiting[m_star]
+        ready = machine_ready[m_star]
+        starts = [job_ready[j] if job_ready[j] > ready else ready for j in jobs]
+        earliest = min(starts)
+        limit = earliest + delta * (best_end - earliest)
+        chosen, chosen_start, chosen_priority = None, None, None
+        for j, t in zip(jobs, starts):
+            if t < limit or t == earliest:
+                p = priority[j * n_machine + job_step[j]]
+                if chosen is None or p < chosen_priority:
+                    chosen, chosen_start, chosen_priority = j, t, p
+
+        j, s, t = chosen, job_step[chosen], chosen_start
+        end = t + time_of[j][s]
+        start[j][s] = t
+        finish[j][s] = end
+        job_ready[j] = end
+        machine_ready[m_star] = end
+        machine_order[m_star].append(j)
+        mio[m_star].append(s)
+        jobs.remove(j)
+        job_step[j] = s + 1
+        if s + 1 < n_machine:
+            waiting[machine_of[j][s + 1]].append(j)
+
+    return Schedule(np.array(start), np.array(finish), max(job_ready), machine_order, mio)
+
+
+def machine_input_order(machine_order, op_data):
+    """
+    Returns the machine input order (MIO) of a machine order without decoding it.
+
+    Parameters:
+        machine_order (list): For each machine, the order in which jobs are processed.
+        op_data (ProblemInstance): The problem instance (nested op_data lists are also accepted).
+
+    Returns:
+        list: For each machine, the steps of its operations in processing order.
+    """
+    instance = ProblemInstance.of(op_data)
+    step_on_machine = instance.step_on_machine.tolist()
+    return [[step_on_machine[j][m] for j in machine_order[m]] for m in range(instance.n_machine)]
+
+
+def machine_input_order_score(steps):
+    """
+    Returns the MIO score of the input order of one machine, the distance between the
+    steps in processing order and the same steps sorted. Individual.mio_score is the
+    score of the last machine.
+
+    Parameters:
+        steps (list): The steps of the operations of one machine in processing order.
+
+    Returns:
+        int: Sum of the absolute differences between steps and sorted(steps).
+    """
+    return np.sum(np.abs(np.subtract(np.array(steps), np.array(sorted(steps)))))
@@ -0,0 +1,323 @@
+"""
+Disjunctive Graph
+
+This script defines the disjunctive-graph representation of a decoded schedule. Nodes are
+operations (op = job * n_machine + step), conjunctive arcs follow the job routes and the
+selected disjunctive arcs follow the machine order of the schedule. From the graph the
+heads (release times), tails, makespan, critical path and critical blocks are computed
+in O(n_op), and the N5 (Nowicki & Smutnicki) and N6 (Balas & Vazacopoulos) critical-block
+neighborhoods are generated. A changed machine order is turned back into a valid seq with
+machine_order_to_seq, so the neighbors can be evaluated like any other chromosome.
+
+Classes:
+    DisjunctiveGraph: Heads, tails, critical path/blocks and N5/N6 moves of a machine order.
+
+Functions:
+    topological_order(machine_order, op_data): Orders all operations consistently with job routes and machine order.
+    machine_order_to_seq(machine_order, op_data): Encodes a machine order as a chromosome.
+"""
+
+import sys
+import os
+from collections import deque
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from GAS.Decoder import decode_chromosome
+from Data.Dataset.ProblemInstance import ProblemInstance
+
+
+def _machine_arcs(machine_order, instance):
+    # machine_order[m]의 job 순서를 operation 번호의 machine predecessor/successor로 변환
+    n_machine = instance.n_machine
+    step_on_machine = instance.step_on_machine.tolist()
+    machine_pred = [-1] * instance.n_op
+    machine_succ = [-1] * instance.n_op
+    for m in range(n_machine):
+        prev = -1
+        for j in machine_order[m]:
+            op = j * n_machine + step_on_machine[j][m]
+            machine_pred[op] = prev
+            if prev >= 0:
+                machine_succ[prev] = op
+            prev = op
+    return machine_pred, machine_succ
+
+
+def topological_order(machine_order, op_data):
+    """
+    Orders all operations consistently with the job routes and the machine order.
+
+    Parameters:
+        machine_order (list): For each machine, the order in which jobs are processed.
+        op_data (ProblemInstance): The problem instance (nested op_data lists are also accepted).
+
+    Returns:
+        list: Operation numbers in a topological order of the disjunctive graph.
+
+    Raises:
+        ValueError: If the machine order creates a cycle (is not consistent with the job routes).
+    """
+    instance = ProblemInstance.of(op_data)
+    n_machine, n_op = instance.n_machine, instance.n_op
+    machine_pred, machine_succ = _machine_arcs(machine_order, instance)
+
+    indegree = [(op % n_machine > 0) + (machine_pred[op] >= 0) for op in range(n_op)]
+    queue = deque(op for op in range(n_op) if indegree[op] == 0)
+    order = []
+    while queue:
+        op = queue.popleft()
+        order.append(op)
+        if (op + 1) % n_machine:
+            indegree[op + 1] -= 1
+            if indegree[op + 1] == 0:
+                queue.append(op + 1)
+        succ = machine_succ[op]
+        if succ >= 0:
+            indegree[succ] -= 1
+            if indegree[succ] == 0:
+                queue.append(succ)
+
+    if len(order) != n_op:
+        raise ValueError(f"Machine order contains a cycle after {len(order)} of {n_op} operations.")
+    return order
+
+
+def machine_order_to_seq(machine_order, op_data):
+    """
+    Encodes a machine order as a chromosome.
+
+    The operation numbers in topological order form a valid seq: the k-th occurrence of
+    a job is its k-th operation, and decoding the seq gives back the same machine order.
+
+    Parameters:
+        machine_order (list): For each machine, the order in which jobs are processed.
+        op_data (ProblemInstance): The problem instance (nested op_data lists are also accepted).
+
+    Returns:
+        list: The chromosome.
+    """
+    return topological_order(machine_order, op_data)
+
+
+class DisjunctiveGraph:
+    """
+    Disjunctive graph of a semi-active schedule.
+
+    Attributes:
+        instance (ProblemInstance): The problem instance.
+        machine_order (list): For each machine, the order in which jobs are processed.
+        order (list): Operations in topological order.
+        head (list): head[op], earliest start time of op (release time).
+        tail (list): tail[op], length of the longest path from the end of op to the sink.
+        makespan (int): max(head[op] + duration[op] + tail[op]).
+        machine_pred (list): Previous operation on the same machine, or -1.
+        machine_succ (list): Next operation on the same machine, or -1.
+    """
+
+    def __init__(self, machine_order, op_data):
+        """
+        Builds the graph and computes heads and tails.
+
+        Parameters:
+            machine_order (list): For each machine, the order in which jobs are processed.
+            op_data (ProblemInstance): The problem instance (nested op_data lists are also accepted).
+        """
+        self.instance = ProblemInstance.of(op_data)
+        self.machine_order = [list(jobs) for jobs in machine_order]
+        self.machine_pred, self.machine_succ = _machine_arcs(self.machine_order, self.instance)
+        self.order = topological_order(self.machine_order, self.instance)
+
+        n_machine = self.instance.n_machine
+        duration = self.instance.duration.tolist()
+        self._duration = duration
+        self._machine = self.instance.machine.tolist()
+
+        head = [0] * self.instance.n_op
+        for op in self.order:
+            t = 0
+            if op % n_machine:
+                t = head[op - 1] + duration[op - 1]
+            mp = self.machine_pred[op]
+            if mp >= 0 and head[mp] + duration[mp] > t:
+                t = head[mp] + duration[mp]
+            head[op] = t
+
+        tail = [0] * self.instance.n_op
+        for op in reversed(self.order):
+            t = 0
+            if (op + 1) % n_machine:
+                t = tail[op + 1] + duration[op + 1]
+            ms = self.machine_succ[op]
+            if ms >= 0 and tail[ms] + duration[ms] > t:
+                t = tail[ms] + duration[ms]
+            tail[op] = t
+
+        self.head = head
+        self.tail = tail
+        self.makespan = max(head[op] + duration[op] for op in range(self.instance.n_op))
+
+    @classmethod
+    def from_seq(cls, seq, op_data):
+        """
+        Builds the graph of a chromosome.
+
+        Parameters:
+            seq (list): Chromosome, a permutation of range(n_op).
+            op_data (ProblemInstance): The problem instance (nested op_data lists are also accepted).
+
+        Returns:
+            DisjunctiveGraph: The graph.
+        """
+        instance = ProblemInstance.of(op_data)
+        _, _, machine_flat, offsets = decode_chromosome(seq, instance)
+        machine_order = [machine_flat[offsets[m]:offsets[m + 1]].tolist() for m in range(instance.n_machine)]
+        return cls(machine_order, instance)
+
+    def job_pred(self, op):
+        return op - 1 if op % self.instance.n_machine else -1
+
+    def job_succ(self, op):
+        return op + 1 if (op + 1) % self.instance.n_machine else -1
+
+    def is_critical(self, op):
+        """
+        Returns True if op lies on a longest path.
+        """
+        return self.head[op] + self._duration[op] + self.tail[op] == self.makespan
+
+    def critical_path(self):
+        """
+        Returns one critical (longest) path from the source to the sink.
+
+        Returns:
+            list: Operations of the path in processing order.
+        """
+        duration, head = self._duration, self.head
+        op = next(op for op in self.order if head[op] + duration[op] == self.makespan and self.tail[op] == 0)
+        path = [op]
+        while head[op] > 0:
+            # job predecessor를 우선으로, head를 결정한 선행 operation을 따라감
+            jp = self.job_pred(op)
+            if jp >= 0 and head[jp] + duration[jp] == head[op]:
+                op = jp
+            else:
+                op = self.machine_pred[op]
+            path.append(op)
+        path.reverse()
+        return path
+
+    def critical_blocks(self, path=None):
+        """
+        Splits a critical path into blocks of consecutive operations on the same machine.
+
+        Parameters:
+            path (list): A critical path (default is critical_path()).
+
+        Returns:
+            list: The blocks, each a list of operations in processing order.
+        """
+        if path is None:
+            path = self.critical_path()
+        blocks = []
+        for op in path:
+            if blocks and self._machine[blocks[-1][-1]] == self._machine[op] and self.machine_succ[blocks[-1][-1]] == op:
+                blocks[-1].append(op)
+            else:
+                blocks.append([op])
+        return blocks
+
+    def n5_moves(self, blocks=None):
+        """
+        Returns the N5 neighborhood: swaps of the first two and the last two operations of
+        each critical block, except the first two of the first block and the last two of
+        the last block.
+
+        Parameters:
+            blocks (list): Critical blocks (default is critical_blocks()).
+
+        Returns:
+            list: Moves (u, v, 'swap') where u is processed immediately before v.
+        """
+        if blocks is None:
+            blocks = self.critical_blocks()
+        moves = []
+        last = len(blocks) - 1
+        for b, block in enumerate(blocks):
+            if len(block) < 2:
+                continue
+            if b > 0:
+                moves.append((block[0], block[1], 'swap'))
+            if b < last and (len(block) > 2 or b == 0):
+                moves.append((block[-2], block[-1], 'swap'))
+        return moves
+
+    def n6_moves(self, blocks=None):
+        """
+        Returns the N6 neighborhood: moving an operation of a critical block to the start
+        or the end of the block, restricted to moves that keep the schedule acyclic
+        (Balas & Vazacopoulos conditions).
+
+        Parameters:
+            blocks (list): Critical blocks (default is critical_blocks()).
+
+        Returns:
+            list: Moves (u, v, 'after') moving u right after v, and (u, v, 'before') moving v right before u.
+        """
+        if blocks is None:
+            blocks = self.critical_blocks()
+        duration, head, tail = self._duration, self.head, self.tail
+        moves = []
+        for block in blocks:
+            if len(block) < 2:
+                continue
+            first, last = block[0], block[-1]
+            for v in block[1:]:
+                # v를 block 맨 앞(first 앞)으로: jp(v)가 first보다 늦게 끝나지 않아야 함
+                jp = self.job_pred(v)
+                if v == block[1] or jp < 0 or head[first] + duration[first] >= head[jp] + duration[jp]:
+                    moves.append((first, v, 'before'))
+            for u in block[:-1]:
+                # u를 block 맨 뒤(last 뒤)로: js(u)의 tail이 last보다 길지 않아야 함
+                js = self.job_succ(u)
+                if u == block[-2] or js < 0 or tail[last] + duration[last] >= tail[js] + duration[js]:
+                    moves.append((u, last, 'after'))
+        return moves
+
+    def apply_move(self, move):
+        """
+        Applies a move to a copy of the machine order.
+
+        Parameters:
+            move (tuple): (u, v, kind) from n5_moves or n6_moves.
+
+        Returns:
+            list: The new machine order.
+        """
+        u, v, kind = move
+        n_machine = self.instance.n_machine
+        m = self._machine[u]
+        machine_order = [jobs[:] for jobs in self.machine_order]
+        jobs = machine_order[m]
+        ju, jv = u // n_machine, v // n_machine
+        pu, pv = jobs.index(ju), jobs.index(jv)
+        if kind == 'swap':
+            jobs[pu], jobs[pv] = jobs[pv], jobs[pu]
+        elif kind == 'after':
+            jobs.insert(pv, jobs.pop(pu))
+        elif kind == 'before':
+            jobs.insert(pu, jobs.pop(pv))
+        else:
+            raise ValueError(f"Unknown move: {kind}")
+        return machine_order
+
+    def neighbor_seq(self, move):
+        """
+        Applies a move and encodes the resulting machine order as a chromosome.
+
+        Parameters:
+            move (tuple): (u, v, kind) from n5_moves or n6_moves.
+
+        Returns:
+            list: The chromosome of the neighbor.
+        """
+        return machine_order_to_seq(self.apply_move(move), self.instance)
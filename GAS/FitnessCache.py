@@ -0,0 +1,177 @@
+"""
+Fitness Cache
+
+This script defines a bounded, process-local LRU cache from the canonical machine
+order of a chromosome to its (makespan, mio_score). Many different sequences decode
+to the same machine order, and selection, elitism and local search keep re-submitting
+the same chromosomes, so every search-time evaluation (Individual.evaluate without a
+trace, with either evaluator, and Population.evaluate) looks results up here before
+decoding or simulating.
+
+The cache is capped in memory (Run_Config(fitness_cache_mb=...)). The cap is converted
+into a number of entries with ENTRY_BYTES, the size of one entry (16-byte key, result
+tuple and OrderedDict node) measured with tracemalloc on CPython 3.11: 264-274 bytes.
+
+Classes:
+    FitnessCache: A size-bounded LRU cache with hit/miss/eviction counters.
+
+Functions:
+    machine_order_key(machine_order): Hashes a per-machine job order into a cache key.
+    cache_entries(megabytes): Converts a memory cap in MB into a number of entries.
+    get_fitness_cache(config, op_data): Returns the process-local cache for a problem instance.
+"""
+
+import sys
+import os
+import hashlib
+from collections import OrderedDict
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+from Data.Dataset.ProblemInstance import ProblemInstance
+
+_caches = {}
+
+# entry 하나의 메모리 (key bytes + (makespan, mio_score) tuple + OrderedDict node), tracemalloc 측정값
+ENTRY_BYTES = 280
+
+
+def machine_order_key(machine_order):
+    """
+    Hashes a per-machine job order into a cache key.
+
+    Parameters:
+        machine_order (array-like): For each machine, the order in which jobs are processed.
+
+    Returns:
+        bytes: A 16-byte digest of the machine order.
+    """
+    return hashlib.blake2b(np.asarray(machine_order, dtype=np.int32).tobytes(), digest_size=16).digest()
+
+
+class FitnessCache:
+    """
+    A size-bounded LRU cache from machine order keys to (makespan, mio_score).
+
+    Attributes:
+        max_size (int): Maximum number of entries kept in the cache.
+        hits (int): Number of successful lookups.
+        misses (int): Number of failed lookups.
+        evictions (int): Number of entries dropped to stay within max_size.
+    """
+
+    def __init__(self, max_size):
+        """
+        Initializes the FitnessCache class with the specified capacity.
+
+        Parameters:
+            max_size (int): Maximum number of entries kept in the cache.
+        """
+        self.max_size = max_size
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __str__(self):
+        return (f"FitnessCache(size={len(self.entries)}/{self.max_size}, hits={self.hits}, "
+                f"misses={self.misses}, evictions={self.evictions}, hit_rate={self.hit_rate():.3f})")
+
+    def get(self, key):
+        """
+        Looks up a key and marks it as recently used.
+
+        Parameters:
+            key (bytes): Key returned by machine_order_key.
+
+        Returns:
+            tuple: (makespan, mio_score), or None if the key is not cached.
+        """
+        value = self.entries.get(key)
+        if value is None:
+            self.misses += 1
+            return None
+        self.entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, key, value):
+        """
+        Stores a value, evicting the least recently used entries if the cache is full.
+
+        Parameters:
+            key (bytes): Key returned by machine_order_key.
+            value (tuple): (makespan, mio_score).
+        """
+        self.entries[key] = value
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.max_size:
+            self.entries.popitem(last=False)
+            self.evictions += 1
+
+    def hit_rate(self):
+        """
+        Returns the fraction of lookups that were hits.
+        """
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def stats(self):
+        """
+        Returns the cache counters.
+
+        Returns:
+            dict: size, max_size, hits, misses, evictions and hit_rate.
+        """
+        return {'size': len(self.entries), 'max_size': self.max_size, 'hits': self.hits,
+                'misses': self.misses, 'evictions': self.evictions, 'hit_rate': self.hit_rate()}
+
+    def clear(self):
+        """
+        Removes all entries and resets the counters.
+        """
+        self.entries.clear()
+        self.hits = self.misses = self.evictions = 0
+
+
+def cache_entries(megabytes):
+    """
+    Converts a memory cap in MB into a number of cache entries.
+
+    Parameters:
+        megabytes (float): Memory cap in MB.
+
+    Returns:
+        int: Maximum number of entries (ENTRY_BYTES each).
+    """
+    return int(megabytes * 2 ** 20 // ENTRY_BYTES)
+
+
+def get_fitness_cache(config, op_data):
+    """
+    Returns the process-local cache for a problem instance.
+
+    One cache is kept per instance digest (routings and processing times, see
+    ProblemInstance.digest) so that islands running in the same process share entries
+    while different instances never collide, even without a dataset filename.
+
+    Parameters:
+        config: Configuration object with fitness_cache_mb.
+        op_data (ProblemInstance or list): The problem instance.
+
+    Returns:
+        FitnessCache: The shared cache, or None if config.fitness_cache_mb is 0.
+    """
+    max_size = cache_entries(config.fitness_cache_mb)
+    if not max_size:
+        return None
+    namespace = ProblemInstance.of(op_data).digest
+    cache = _caches.get(namespace)
+    if cache is None:
+        cache = _caches[namespace] = FitnessCache(max_size)
+    elif cache.max_size != max_size:
+        cache.max_size = max_size
+    return cache
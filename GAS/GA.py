@@ -8,7 +8,9 @@ selection, local search, and parallel execution.
 Functions:
     migrate_top_10_percent(ga_engines, migration_order, island_mode): Migrates top 10 percent of individuals between GA engines.
     GAEngine.__init__(self, config, op_data, crossover, mutation, selection, ...): Initializes the GA engine with the given parameters.
+    GAEngine.counting(self): Counts the evaluations made inside a with block in GAEngine.evaluations.
     GAEngine.evolve(self, index, sync_generation, sync_lock, events=None): Evolves the population for a number of generations.
+    GAEngine.check_termination(self, elapsed_time, evaluations, stagnation): Checks the time, evaluation and stagnation limits.
     GAEngine.apply_local_search(self, individual): Applies local search optimization to an individual.
     GAEngine.apply_pso(self, individual): Applies PSO optimization to an individual.
     GAEngine.save_csv(self, all_generations, execution_time, file_path): Saves the GA generations data to a CSV file.
@@ -18,15 +20,20 @@ import sys
 import os
 import random
 import time
-import copy
 import csv
+from contextlib import contextmanager
 from concurrent.futures import ProcessPoolExecutor
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from GAS.Population import Population
+from GAS.Individual import Individual
+from GAS.FitnessCache import get_fitness_cache
+from GAS.Compaction import compact_individual
+from GAS.SteadyState import SteadyStateReplacement
 from Local_Search.TabuSearch import TabuSearch
 from Data.Dataset.Dataset import Dataset
+from Data.Dataset.ProblemInstance import ProblemInstance
 from Meta.PSO import PSO
 from GAS.Mutation.SelectiveMutation import SelectiveMutation
 from Local_Search.HillClimbing import HillClimbing
@@ -53,7 +60,7 @@ def migrate_top_10_percent(ga_engines, migration_order, island_mode):
         target_island = ga_engines[target_island_idx]
 
         for individual in source_island.new_populations:
-            target_island.population.individuals[random.randint(0, len(target_island.population.individuals) - 1)] = copy.deepcopy(individual)
+            target_island.population.replace(random.randint(0, len(target_island.population.individuals) - 1), individual.clone())
             print(f"Migrating from GA{source_island_idx + 1} to GA{target_island_idx + 1}")
 def get_next_filename(base_name):
     index = 1
@@ -88,7 +95,12 @@ class GAEngine:
         pso: PSO optimizer for the GA.
         selective_mutation: Selective mutation operator for the GA.
         elite_ratio (float): Proportion of elites in the population.
-        best_time: Best execution time recorded.
+        best_time: Seconds from the start of evolve until the best makespan was first reached (time-to-best).
+        best_evaluations (int): Evaluations until the best makespan was first reached (evaluations-to-best).
+        best_generation (int): Generation in which the best makespan was first reached.
+        termination_reason (str): Why evolve stopped ('generations', 'target', 'time limit', 'evaluation limit' or 'stagnation').
+        restarts (int): Number of partial restarts (config.restart_stagnation).
+        uniqueness_history (list): (generation, uniqueness ratio) of every generation (GAS/GenotypeIndex.py).
         ga_engines: List of GA engines for island model.
         island_mode (int): Mode of migration between islands.
         migration_frequency (int): Frequency of migration between islands.
@@ -125,7 +137,7 @@ class GAEngine:
             random_seed (int): Seed for random number generation (default is None).
         """
         self.config = config
-        self.op_data = op_data
+        self.op_data = ProblemInstance.of(op_data)  # worker로 pickle될 때도 table만 전달
         self.crossover = crossover
         self.mutation = mutation
         self.selection = selection
@@ -135,6 +147,12 @@ class GAEngine:
         self.selective_mutation = selective_mutation
         self.elite_ratio = elite_ratio
         self.best_time = None
+        self.best_evaluations = None
+        self.best_generation = None
+        self.termination_reason = None
+        self.restarts = 0
+        self.evaluations = 0  # 이 engine의 population을 위해 수행된 평가 횟수 (counting 참고)
+        self.uniqueness_history = []  # (generation, 서로 다른 genotype 비율)
         self.ga_engines = ga_engines
         self.island_mode = island_mode
         self.migration_frequency = migration_frequency
@@ -145,27 +163,49 @@ class GAEngine:
         self.local_search_top_percentage = 0.01  
 
         if initialization_mode == '2':
-            self.population = Population.from_mio(config, op_data, dataset_filename, random_seed=random_seed)
+            self.population = Population.from_mio(config, self.op_data, dataset_filename, random_seed=random_seed)
         elif initialization_mode == '3':
-            self.population = Population.from_giffler_thompson(config, op_data, dataset_filename, random_seed=random_seed)
+            self.population = Population.from_giffler_thompson(config, self.op_data, dataset_filename, random_seed=random_seed)
         else:
-            self.population = Population(config, op_data, random_seed=random_seed)
+            self.population = Population(config, self.op_data, random_seed=random_seed)
 
     def update_new_populations(self, index, new_populations):
         # 현재 population에서 상위 10% 개체를 추출하여 new_populations에 저장
-        top_individuals = sorted(self.population.individuals, key=lambda ind: ind.makespan)[:max(1, len(self.population.individuals) // 10)]
-        new_populations[index] = [copy.deepcopy(ind) for ind in top_individuals]
+        top_individuals = self.population.top(max(1, len(self.population.individuals) // 10))
+        new_populations[index] = [ind.clone() for ind in top_individuals]
 
         # 로그 출력: 상위 10% 개체 확인
         # print(f"GA{index+1} 세대의 상위 10% 개체: {[ind.seq for ind in new_populations[index]]}")
 
+    @contextmanager
+    def counting(self):
+        """
+        Counts the evaluations made inside the with block in self.evaluations instead of in
+        the engine that is evolving (e.g. when migration evaluates another island's population).
+        """
+        previous, Individual.evaluation_counter = Individual.evaluation_counter, self
+        try:
+            yield self
+        finally:
+            Individual.evaluation_counter = previous
+
     def evolve(self, index, sync_generation, sync_lock, new_populations, events=None):
+        # 이 engine에서 일어난 평가만 self.evaluations에 셈 (evaluation_limit, 출력)
+        with self.counting():
+            return self._evolve(index, sync_generation, sync_lock, new_populations, events)
+
+    def _evolve(self, index, sync_generation, sync_lock, new_populations, events=None):
         try:
             all_generations = []
             start_time = time.time()
             best_individual = None
             best_fitness = float('inf')
             
+            start_evaluations = self.evaluations
+            best_makespan = float('inf')  # time-to-best 기록용
+            stagnation = 0  # 개선 없이 지난 세대 수
+            self.termination_reason = 'generations'
+
             base_filename = f"population_generations_{index+1}"
             filename = get_next_filename(base_filename)  # 다음 사용 가능한 파일 이름을 가져옵니다.
 
@@ -178,46 +218,55 @@ class GAEngine:
                 print(f"GA{index+1} Best Individual: {best_individual is not None}")
 
 
-                best_individual = min(self.population.individuals, key=lambda ind: ind.makespan)
+                best_individual = self.population.best()
                 best_fitness = best_individual.makespan
                 print(f"GA{index+1}_Best fitness at generation select crossover mutate 전 {sync_generation[index]}: {best_fitness}")
 
-                # 엘리트 개체 선택
-                num_elites = int(self.elite_ratio * len(self.population.individuals))
-                elites = copy.deepcopy(sorted(self.population.individuals, key=lambda ind: ind.makespan)[:num_elites])
-
-                self.population.select(self.selection)
-
-                self.population.crossover(self.crossover)
-
-                self.population.mutate(self.mutation)
-
-                # 각 개체에 대해 필요한 업데이트 적용
-                for individual in self.population.individuals:
-                    individual.job_seq = individual.get_repeatable()  # job_seq 업데이트
-                    individual.feasible_seq = individual.get_feasible()  # feasible_seq 업데이트
-                    individual.machine_order = individual.get_machine_order()  # machine_order 재계산
-                    individual.makespan, _ = individual.evaluate(individual.machine_order)  # makespan 재계산
-                    
-                # 전체 population 출력
-                population_size = len(self.population.individuals)  # population의 갯수 계산
-                print(f"GA{index+1} - 전체 population After crossover (Total Population: {population_size}):")
-
-                self.population.evaluate(self.config.target_makespan)
-
-                # 엘리트 개체를 population에 다시 삽입
-                for elite in elites:
-                    # 현재 population에서 가장 성능이 떨어지는 개체를 찾음
-                    worst_index = max(range(len(self.population.individuals)), key=lambda idx: self.population.individuals[idx].makespan)
-                    # 엘리트 개체의 깊은 복사본을 생성하여 삽입
-                    self.population.individuals[worst_index] = copy.deepcopy(elite)
-                    print(f"Inserted elite at index {worst_index} - Makespan: {elite.makespan}, Fitness: {elite.fitness}")
-
-                self.population.evaluate(self.config.target_makespan)
+                if self.config.replacement == 'steady-state':
+                    # (mu + lambda): 한 세대 = population_size개의 자식, 자식만 평가하고 더 나은 자식만 삽입
+                    steady_state = SteadyStateReplacement(self.population, self.config.replace_policy)
+                    inserted = steady_state.run(self.selection, self.crossover, self.mutation,
+                                                self.config.offspring_size, len(self.population.individuals))
+                    print(f"GA{index+1}_Inserted {inserted} of {steady_state.evaluations} evaluated children")
+                else:
+                    # 엘리트 개체 선택
+                    num_elites = int(self.elite_ratio * len(self.population.individuals))
+                    elites = [elite.clone() for elite in self.population.top(num_elites)]
+                    if self.config.compaction:
+                        # 평가 없이 엘리트의 schedule을 left-shift로 압축 (active schedule)
+                        for elite in elites:
+                            compact_individual(elite)
+
+                    self.population.select(self.selection)
+
+                    self.population.crossover(self.crossover)
+
+                    self.population.mutate(self.mutation)
+
+                    if self.config.duplicate_policy != 'keep':
+                        # 같은 genotype(machine order)의 중복 개체를 새 개체 또는 변이된 개체로 교체
+                        replaced = self.population.replace_duplicates(self.config.duplicate_policy)
+                        print(f"GA{index+1}_Replaced {replaced} duplicate individuals")
+
+                    # seq가 바뀐 개체는 자동으로 무효화되어 아래 evaluate에서 한 번만 평가됨
+                    # 전체 population 출력
+                    population_size = len(self.population.individuals)  # population의 갯수 계산
+                    print(f"GA{index+1} - 전체 population After crossover (Total Population: {population_size}):")
+
+                    self.population.evaluate(self.config.target_makespan)
+
+                    # 엘리트 개체를 population에서 가장 성능이 떨어지는 개체들 자리에 다시 삽입 (ranking에서 O(E))
+                    worst_indices = self.population.ranking().worst(len(elites))
+                    for elite, worst_index in zip(elites, worst_indices):
+                        # 엘리트 개체의 clone (chromosome과 평가 결과를 공유하는 얕은 복사본)을 삽입
+                        self.population.replace(worst_index, elite.clone())
+                        print(f"Inserted elite at index {worst_index} - Makespan: {elite.makespan}, Fitness: {elite.fitness}")
+
+                    self.population.evaluate(self.config.target_makespan)
                 # best_individual = min(self.population.individuals, key=lambda ind: ind.makespan)
                 # best_fitness = best_individual.makespan
                  
-                best_individual = min(self.population.individuals, key=lambda ind: ind.makespan)
+                best_individual = self.population.best()
                 best_fitness = best_individual.makespan
                 print(f"GA{index+1}_Best fitness at generation select crossover mutate 후 {sync_generation[index]}: {best_fitness}")
 
@@ -233,45 +282,35 @@ class GAEngine:
 
                     # 상위 10% 개체 추출 (가장 우수한 개체들)
                     top_count = int(len(self.population.individuals) * top_percentage)
-                    top_indices_and_individuals = sorted(
-                        enumerate(self.population.individuals),
-                        key=lambda ind: ind[1].makespan
-                    )[:top_count]
+                    ranking = self.population.ranking()
+                    top_indices_and_individuals = [(idx, self.population.individuals[idx]) for idx in ranking.best(top_count)]
 
                     # 나머지 개체들 중에서 무작위로 나머지 40% 선택
                     remaining_count = int(len(self.population.individuals) * (total_percentage - top_percentage))
                     
-                    remaining_indices_and_individuals = sorted(
-                        enumerate(self.population.individuals),
-                        key=lambda ind: ind[1].makespan
-                    )[top_count:]  # 상위 10% 이후의 개체들
+                    remaining_indices_and_individuals = [(idx, self.population.individuals[idx]) for idx in ranking.order(top_count)]  # 상위 10% 이후의 개체들
 
                     random_remaining = random.sample(remaining_indices_and_individuals, remaining_count)
 
                     # # 선택된 상위 10%와 무작위 40%를 결합
                     # selected_individuals = top_indices_and_individuals + random_remaining
 
-                    # top_individuals = [copy.deepcopy(individual) for idx, individual in selected_individuals]
+                    # top_individuals = [individual.clone() for idx, individual in selected_individuals]
                     # top_indices = [idx for idx, individual in selected_individuals]
 
-                    top_individuals = [copy.deepcopy(individual) for idx, individual in top_indices_and_individuals]
+                    top_individuals = [individual.clone() for idx, individual in top_indices_and_individuals]
                     top_indices = [idx for idx, individual in top_indices_and_individuals]
 
                     for method in self.local_search_methods:
                         for i in range(len(top_individuals)):
                             individual = top_individuals[i]  # 원래 개체 사용
-                            optimized_ind = method.optimize(copy.deepcopy(individual), self.config)
+                            optimized_ind = method.optimize(individual.clone(), self.config)
                             
-                            # Local Search 후 개체의 모든 속성 업데이트
-                            optimized_ind.seq = optimized_ind.seq[:]  # 최종 seq 반영
-                            optimized_ind.job_seq = optimized_ind.get_repeatable()  # job_seq 업데이트
-                            optimized_ind.feasible_seq = optimized_ind.get_feasible()  # feasible_seq 업데이트
-                            optimized_ind.machine_order = optimized_ind.get_machine_order()  # machine_order 재계산
-                            optimized_ind.makespan, _ = optimized_ind.evaluate(optimized_ind.machine_order)  # makespan 재계산
+                            # Local Search 후 seq가 바뀐 경우에만 makespan을 읽을 때 재평가됨
 
                             # 비교를 통해 기존 개체보다 더 나은 경우에만 대체
                             if optimized_ind.makespan <= individual.makespan:
-                                self.population.individuals[top_indices[i]] = optimized_ind
+                                self.population.replace(top_indices[i], optimized_ind)
                                 top_individuals[i] = optimized_ind  # top_individuals에서도 대체
                             else:
                                 # 기존 개체 유지, 아무 작업도 하지 않음
@@ -279,7 +318,7 @@ class GAEngine:
 
 
 
-                best_individual = min(self.population.individuals, key=lambda ind: ind.makespan)
+                best_individual = self.population.best()
                 best_fitness = best_individual.makespan
                 print(f"GA{index+1}_Best fitness at generation Local Search 후 {sync_generation[index]}: {best_fitness}")
 
@@ -319,7 +358,7 @@ class GAEngine:
                             print(f"GA{i+1} is migrating, receiving individuals from GA{target_index+1}")
 
                             if new_populations[target_index]:
-                                best_index = min(range(len(self.ga_engines[i].population.individuals)), key=lambda idx: self.ga_engines[i].population.individuals[idx].makespan)
+                                best_index = self.ga_engines[i].population.ranking().best(1)[0]
                                 other_indices = [idx for idx in range(len(self.ga_engines[i].population.individuals)) if idx != best_index]
 
                                 for j in range(len(new_populations[target_index])):
@@ -327,22 +366,23 @@ class GAEngine:
                                     other_indices.remove(random_index)
 
                                     # 개체 복사 (seq만 복사)
-                                    migrated_individual = copy.deepcopy(new_populations[target_index][j])
+                                    migrated_individual = new_populations[target_index][j].clone()
 
-                                    # machine_order는 이주 후 재계산
-                                    migrated_individual.machine_order = migrated_individual.get_machine_order()
+                                    # job_seq, feasible_seq, machine_order는 이주 후 재계산
+                                    migrated_individual.decode_seq()
                                     
                                     # 이동 전후 상태 출력
                                     # print(f"Before Migration - GA{i+1}, Individual Seq: {self.ga_engines[i].population.individuals[random_index].seq}, Makespan: {self.ga_engines[i].population.individuals[random_index].makespan}")
                                     # print(f"After Migration - GA{i+1}, Migrated Individual Seq: {migrated_individual.seq}, Makespan: {migrated_individual.makespan}")
 
                                     # 마이그레이션 완료 후 상태 확인
-                                    self.ga_engines[i].population.individuals[random_index] = migrated_individual
+                                    self.ga_engines[i].population.replace(random_index, migrated_individual)
 
                                 print(f"Migrating from GA{target_index+1} to GA{i+1} 완료")
                                 
-                                # 이주 후 population 평가
-                                self.ga_engines[i].population.evaluate(self.config.target_makespan)
+                                # 이주 후 population 평가 (평가 횟수는 이주받은 engine에 셈)
+                                with self.ga_engines[i].counting():
+                                    self.ga_engines[i].population.evaluate(self.config.target_makespan)
 
                                 # 이주 후 상태 출력
                                 # print(f"이주 후 GA{i+1}의 population 상태:")
@@ -353,9 +393,12 @@ class GAEngine:
                                 print(f"new_populations[{target_index}] is empty, skipping migration.")
 
                 self.population.evaluate(self.config.target_makespan)
-                best_individual = min(self.population.individuals, key=lambda ind: ind.makespan)
+                best_individual = self.population.best()
                 best_fitness = best_individual.makespan                
                 print(f"GA{index+1}_Best fitness at generation 이주 후 {sync_generation[index]}: {best_fitness}")
+                uniqueness = self.population.uniqueness_ratio()
+                self.uniqueness_history.append((sync_generation[index], uniqueness))
+                print(f"GA{index+1}_Uniqueness at generation {sync_generation[index]}: {uniqueness:.3f}")
                 # print(f"{sync_generation[index]}: {best_fitness}, Sequence: {best_individual.seq}")
 
                 generation_data = [(ind.seq, ind.makespan) for ind in self.population.individuals]
@@ -364,13 +407,41 @@ class GAEngine:
                 # 각 세대의 인구를 CSV 파일에 저장
                 save_population_to_csv(self.population, filename, sync_generation[index])
                 
-                if best_individual is not None and best_individual.makespan <= self.config.target_makespan:
+                # best makespan이 처음 나온 시점 (time-to-best, evaluations-to-best)
+                if best_individual.makespan < best_makespan:
+                    best_makespan = best_individual.makespan
+                    self.best_time = time.time() - start_time
+                    self.best_evaluations = self.evaluations - start_evaluations
+                    self.best_generation = sync_generation[index]
+                    stagnation = 0
+                else:
+                    stagnation += 1
+
+                # 목표 Makespan 또는 instance lower bound(최적해 보장)에 도달하면 종료
+                stop_makespan = max(self.config.target_makespan, self.op_data.lower_bound)
+                if best_individual is not None and best_individual.makespan <= stop_makespan:
                     elapsed_time = time.time() - start_time  # 걸린 소요시간 계산
-                    print(f"GA{index+1}_Stopping early as best makespan {best_individual.makespan} is below target {self.config.target_makespan}.")
+                    self.termination_reason = 'target'
+                    print(f"GA{index+1}_Stopping early as best makespan {best_individual.makespan} is below target {stop_makespan} (lower bound {self.op_data.lower_bound}).")
                     print(f"GA{index+1}_Elapsed time: {elapsed_time:.2f} seconds.")  # 소요시간 출력
 
                     break
 
+                # 시간, 평가 횟수, 정체 세대 수 제한
+                reason = self.check_termination(time.time() - start_time, self.evaluations - start_evaluations, stagnation)
+                if reason is not None:
+                    self.termination_reason = reason
+                    print(f"GA{index+1}_Stopping at generation {sync_generation[index]}: {reason} reached.")
+                    break
+
+                # 정체되면 엘리트만 남기고 나머지를 새 개체로 교체 (다음 세대의 evaluate에서 평가)
+                restart_stagnation = self.config.restart_stagnation
+                if restart_stagnation is not None and stagnation > 0 and stagnation % restart_stagnation == 0:
+                    num_elites = max(1, int(self.elite_ratio * len(self.population.individuals)))
+                    reseeded = self.population.reseed(num_elites)
+                    self.restarts += 1
+                    print(f"GA{index+1}_Restart at generation {sync_generation[index]}: kept {num_elites} elites, re-seeded {reseeded} individuals")
+
                 with sync_lock:
                     sync_generation[index] += 1
 
@@ -387,12 +458,20 @@ class GAEngine:
                 for i in range(len(self.population.individuals)):
                     individual = self.population.individuals[i]
                     optimized_individual = self.apply_pso(individual)
-                    self.population.individuals[i] = optimized_individual
+                    self.population.replace(i, optimized_individual)
 
             end_time = time.time()
             execution_time = end_time - start_time
 
-            if best_individual is not None and hasattr(best_individual, 'monitor'):
+            print(f"GA{index+1}_Evaluations: {self.evaluations - start_evaluations}")
+            if self.best_time is not None:
+                print(f"GA{index+1}_Time to best: {self.best_time:.2f} seconds, evaluations to best: {self.best_evaluations} (generation {self.best_generation}, stopped by {self.termination_reason}, {self.restarts} restarts)")
+            fitness_cache = get_fitness_cache(self.config, self.op_data)
+            if fitness_cache is not None:
+                print(f"GA{index+1}_{fitness_cache}")
+
+            # 최종 best 개체의 schedule만 event trace를 켜고 다시 실행
+            if best_individual is not None and best_individual.replay() is not None:
                 best_individual.monitor.save_event_tracer(self.config.filename['log'])
             else:
                 print("No valid best individual or monitor to save the event tracer.")
@@ -405,6 +484,27 @@ class GAEngine:
 
             return None, None, None, [], 0, None
 
+    def check_termination(self, elapsed_time, evaluations, stagnation):
+        """
+        Checks the time, evaluation and stagnation limits of the config (None disables a limit).
+
+        Parameters:
+            elapsed_time (float): Seconds since the start of evolve.
+            evaluations (int): Evaluations since the start of evolve.
+            stagnation (int): Generations without improvement of the best makespan.
+
+        Returns:
+            str: The reached limit ('time limit', 'evaluation limit' or 'stagnation'), or None.
+        """
+        config = self.config
+        if config.time_limit is not None and elapsed_time >= config.time_limit:
+            return 'time limit'
+        if config.evaluation_limit is not None and evaluations >= config.evaluation_limit:
+            return 'evaluation limit'
+        if config.stagnation_limit is not None and stagnation >= config.stagnation_limit:
+            return 'stagnation'
+        return None
+
     def apply_local_search(self, individual):
         """
         Applies local search optimization to an individual.
@@ -415,7 +515,7 @@ class GAEngine:
         Returns:
             Individual: The optimized individual.
         """
-        best_individual = copy.deepcopy(individual)
+        best_individual = individual.clone()
         for method in self.local_search_methods:
             improved_individual = method.optimize(best_individual, self.config)
             if improved_individual.makespan < best_individual.makespan:
@@ -432,8 +532,10 @@ class GAEngine:
         Returns:
             Individual: The optimized individual.
         """
-        best_individual = copy.deepcopy(individual)
+        best_individual = individual.clone()
         optimized_individual = self.pso.optimize(best_individual, self.config)
+        if self.config.compaction:
+            compact_individual(optimized_individual)
         if optimized_individual.makespan < best_individual.makespan:
             best_individual = optimized_individual
         return best_individual
@@ -455,11 +557,13 @@ class GAEngine:
             csvwriter.writerow(['Generation', 'Chromosome', 'Makespan'])
             for generation, individuals in all_generations:
                 for seq, makespan in individuals:
-                    csvwriter.writerow([generation, seq, makespan])
+                    csvwriter.writerow([generation, seq.tolist(), makespan])
 
     def apply_ORtools(self, individual):
-        best_individual = copy.deepcopy(individual)
+        best_individual = individual.clone()
         optimized_individual = self.ortools_optimizer.optimize(best_individual, self.config)
+        if self.config.compaction:
+            compact_individual(optimized_individual)
         if optimized_individual.makespan < best_individual.makespan:
             best_individual = optimized_individual
         return best_individual
\ No newline at end of file
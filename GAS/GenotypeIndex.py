@@ -0,0 +1,192 @@
+"""
+Genotype Index
+
+This script defines a population-level index of genotype hashes. Many different
+chromosomes decode to the same machine order, i.e. to the same schedule, and selection
+with elitism quickly fills a population with such clones. The genotype of an individual
+is therefore its decoded machine order (semi-active or active, as set by config.decoder),
+hashed to one 64-bit integer: a random linear hash of the job orders followed by the
+splitmix64 finalizer, computed for a whole population with one matrix product.
+
+The index groups the rows of a population by hash and, when the machine orders are
+given, checks that rows in the same hash bucket really have equal machine orders. Population.evaluate uses it to
+evaluate one representative per genotype, Population.replace_duplicates to replace the
+clones with fresh or mutated individuals (Run_Config(duplicate_policy=...)), and
+GAEngine reports the uniqueness ratio (distinct genotypes / population size) of every
+generation.
+
+Classes:
+    GenotypeIndex: Groups the rows of a population by genotype hash.
+
+Functions:
+    genotype_hashes(machine_orders): Hashes machine orders into 64-bit integers.
+    individual_machine_orders(individuals, config, op_data): Machine orders of a list of individuals.
+    individual_hashes(individuals, config, op_data): Genotype hashes of a list of individuals.
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+from GAS.BatchDecoder import machine_order_matrix
+
+# 길이별 hash 계수 (process마다 같은 값이 나오도록 seed 고정)
+_weights = {}
+
+
+def _hash_weights(length):
+    weights = _weights.get(length)
+    if weights is None:
+        rng = np.random.default_rng(0x5EED)
+        weights = _weights[length] = rng.integers(0, 2 ** 64, size=length, dtype=np.uint64, endpoint=False) | np.uint64(1)
+    return weights
+
+
+def genotype_hashes(machine_orders):
+    """
+    Hashes machine orders into 64-bit integers.
+
+    Parameters:
+        machine_orders (array-like): Machine orders, shape (N, n_machine, n_job) or (N, n_op).
+
+    Returns:
+        np.ndarray: One np.uint64 hash per row.
+    """
+    orders = np.asarray(machine_orders).reshape(len(machine_orders), -1).astype(np.uint64) + np.uint64(1)
+    # uint64 연산은 2^64로 wrap-around 되므로 그대로 mod 2^64 선형 hash
+    z = orders @ _hash_weights(orders.shape[1])
+    z ^= z >> np.uint64(30)
+    z *= np.uint64(0xBF58476D1CE4E5B9)
+    z ^= z >> np.uint64(27)
+    z *= np.uint64(0x94D049BB133111EB)
+    z ^= z >> np.uint64(31)
+    return z
+
+
+def individual_machine_orders(individuals, config, op_data):
+    """
+    Computes the machine orders (genotypes) of a list of individuals.
+
+    With the semi-active decoder the machine orders of all individuals are computed at
+    once from their chromosomes; with the active decoder the (cached) machine order of
+    each individual is used.
+
+    Parameters:
+        individuals (list): The individuals (at least one).
+        config: Configuration object with simulation settings.
+        op_data (ProblemInstance): The problem instance.
+
+    Returns:
+        np.ndarray: Machine orders, shape (N, n_machine, n_job).
+    """
+    if config.decoder == 'semi-active':
+        return machine_order_matrix(np.array([individual.seq for individual in individuals]), op_data)
+    return np.array([individual.machine_order for individual in individuals])
+
+
+def individual_hashes(individuals, config, op_data):
+    """
+    Computes the genotype hashes of a list of individuals (see individual_machine_orders).
+
+    Parameters:
+        individuals (list): The individuals.
+        config: Configuration object with simulation settings.
+        op_data (ProblemInstance): The problem instance.
+
+    Returns:
+        np.ndarray: One np.uint64 hash per individual.
+    """
+    if len(individuals) == 0:
+        return np.empty(0, dtype=np.uint64)
+    return genotype_hashes(individual_machine_orders(individuals, config, op_data))
+
+
+class GenotypeIndex:
+    """
+    Groups the rows of a population by genotype hash.
+
+    When the machine orders are given, rows with the same hash are only grouped if their
+    machine orders are equal, so a hash collision never merges two different genotypes.
+
+    Attributes:
+        hashes (np.ndarray): Genotype hash of every row.
+        representative (np.ndarray): For every row, the first row with the same genotype.
+        n_unique (int): Number of distinct genotypes.
+    """
+
+    def __init__(self, hashes, machine_orders=None):
+        """
+        Builds the index.
+
+        Parameters:
+            hashes (array-like): Genotype hash of every row (see genotype_hashes).
+            machine_orders (array-like): Machine order of every row, used to verify rows with
+                                         equal hashes (default is None, hashes only).
+        """
+        self.hashes = np.asarray(hashes, dtype=np.uint64)
+        unique, first, inverse = np.unique(self.hashes, return_index=True, return_inverse=True)
+        self.representative = first[inverse.reshape(-1)]
+        if machine_orders is not None and len(self.hashes):
+            self._split_collisions(np.asarray(machine_orders).reshape(len(self.hashes), -1))
+        self.n_unique = int(np.count_nonzero(self.representative == np.arange(len(self.hashes))))
+
+    def _split_collisions(self, orders):
+        rows = np.flatnonzero(self.representative != np.arange(len(self.hashes)))
+        collided = rows[(orders[rows] != orders[self.representative[rows]]).any(axis=1)]
+        # hash 충돌 (거의 일어나지 않음): 같은 hash 안에서 machine order가 같은 첫 row를 대표로 지정
+        for row in collided.tolist():
+            bucket = np.flatnonzero(self.hashes[:row] == self.hashes[row])
+            equal = bucket[(orders[bucket] == orders[row]).all(axis=1)]
+            self.representative[row] = equal[0] if len(equal) else row
+
+    @classmethod
+    def from_individuals(cls, individuals, config, op_data):
+        """
+        Builds the index of a list of individuals, verified on their machine orders.
+        """
+        if len(individuals) == 0:
+            return cls(np.empty(0, dtype=np.uint64))
+        machine_orders = individual_machine_orders(individuals, config, op_data)
+        return cls(genotype_hashes(machine_orders), machine_orders)
+
+    def __len__(self):
+        return len(self.hashes)
+
+    def is_duplicate(self):
+        """
+        Returns a mask of the rows whose genotype already occurs in an earlier row.
+
+        Returns:
+            np.ndarray: Boolean mask of shape (N,).
+        """
+        return self.representative != np.arange(len(self.hashes))
+
+    def duplicates(self):
+        """
+        Returns the rows whose genotype already occurs in an earlier row.
+
+        Returns:
+            np.ndarray: Row indices.
+        """
+        return np.flatnonzero(self.is_duplicate())
+
+    def groups(self):
+        """
+        Returns the rows of every genotype, representative first.
+
+        Returns:
+            list: One array of row indices per distinct genotype.
+        """
+        order = np.argsort(self.representative, kind='stable')
+        bounds = np.flatnonzero(np.diff(self.representative[order])) + 1
+        return np.split(order, bounds) if len(order) else []
+
+    def uniqueness_ratio(self):
+        """
+        Returns the number of distinct genotypes divided by the number of rows.
+
+        Returns:
+            float: Ratio in (0, 1] (1.0 for an empty index).
+        """
+        return self.n_unique / len(self.hashes) if len(self.hashes) else 1.0
@@ -0,0 +1,282 @@
+"""
+Incremental Evaluator
+
+This script defines the IncrementalEvaluator class, which evaluates local-search moves
+without re-simulating the whole schedule. Decoding a chromosome in sequence order
+(as GAS/BatchDecoder.py does) only needs the job ready times, machine ready times and
+per-job step counters of the prefix decoded so far. The evaluator stores this state at
+fixed intervals along the current (base) sequence, so a neighbor that differs from the
+base only from position i on is decoded by resuming from the nearest checkpoint
+before i. The cost of a neighbor is therefore proportional to the suffix length
+instead of n_op.
+
+evaluate also accepts a cutoff. While decoding, the finish time of every scheduled
+operation plus the remaining work of its job is a lower bound on the final makespan.
+As soon as this bound (or the instance lower bound) reaches the cutoff the neighbor
+cannot beat it, so decoding stops and a dominated result (bound, None) is returned
+instead of the exact (makespan, mio_score).
+
+The makespan and mio_score are those of the semi-active array decoder, i.e. the same
+values as Individual.evaluate with the default decoder. With Run_Config(decoder='active')
+they are only a surrogate, and individuals created from them are evaluated again.
+
+Classes:
+    IncrementalEvaluator: Checkpointed, sequence-order evaluator for local-search moves.
+
+Functions:
+    first_difference(seq_a, seq_b): Returns the first position at which two sequences differ.
+"""
+
+import sys
+import os
+import math
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+from GAS.Individual import Individual
+from GAS.Decoder import machine_input_order_score
+from Data.Dataset.ProblemInstance import ProblemInstance
+
+
+def first_difference(seq_a, seq_b):
+    """
+    Returns the first position at which two sequences differ.
+
+    Parameters:
+        seq_a (list): First sequence.
+        seq_b (list): Second sequence.
+
+    Returns:
+        int: The first differing position, or min(len(seq_a), len(seq_b)) if one is a prefix of the other.
+    """
+    for pos, (a, b) in enumerate(zip(seq_a, seq_b)):
+        if a != b:
+            return pos
+    return min(len(seq_a), len(seq_b))
+
+
+class IncrementalEvaluator:
+    """
+    Checkpointed, sequence-order evaluator for local-search moves.
+
+    Attributes:
+        instance (ProblemInstance): The problem instance.
+        checkpoint_interval (int): Number of sequence positions between two checkpoints.
+        seq (list): The base sequence the checkpoints belong to.
+        makespan (int): Makespan of the base sequence.
+        mio_score (int): MIO score of the base sequence.
+        evaluations (int): Number of neighbors evaluated.
+        pruned (int): Number of those neighbors abandoned at the cutoff.
+        decoded_positions (int): Number of sequence positions decoded for those neighbors.
+    """
+
+    def __init__(self, seq, op_data, checkpoint_interval=None):
+        """
+        Initializes the IncrementalEvaluator class and decodes the base sequence.
+
+        Parameters:
+            seq (list): The base sequence.
+            op_data (ProblemInstance): The problem instance (nested op_data lists are also accepted).
+            checkpoint_interval (int): Positions between checkpoints (default is sqrt(n_op)).
+        """
+        self.instance = ProblemInstance.of(op_data)
+        self.checkpoint_interval = checkpoint_interval or max(1, int(math.sqrt(self.instance.n_op)))
+        self._job_of = self.instance.job.tolist()
+        self._machine_of = self.instance.machine_table.tolist()
+        self._time_of = self.instance.duration_table.tolist()
+        self._tail_of = self.instance.job_tail_work.reshape(self.instance.n_job, self.instance.n_machine).tolist()
+        self._bounded_tables = {}
+        self._last_machine = self.instance.n_machine - 1
+        self.evaluations = 0
+        self.pruned = 0
+        self.decoded_positions = 0
+        self.reset(seq)
+
+    def reset(self, seq):
+        """
+        Makes seq the base sequence and rebuilds all checkpoints.
+
+        Parameters:
+            seq (list): The new base sequence.
+        """
+        self.seq = np.asarray(seq).tolist()
+        self._checkpoints = []
+        self._base_last_steps = []
+        self.makespan, self.mio_score = self._decode(self.seq, 0, record=True)
+
+    def accept(self, seq, start=None):
+        """
+        Makes a neighbor the base sequence, rebuilding only the checkpoints after start.
+
+        Parameters:
+            seq (list): The accepted neighbor.
+            start (int): First position at which seq differs from the base (default is computed).
+
+        Returns:
+            tuple: (makespan, mio_score) of the new base sequence.
+        """
+        if start is None:
+            start = first_difference(self.seq, seq)
+        keep = self._checkpoint_before(start)
+        n_last = self._checkpoints[keep][3]
+        del self._checkpoints[keep + 1:]
+        del self._base_last_steps[n_last:]
+        self.seq = list(seq)
+        self.makespan, self.mio_score = self._decode(self.seq, keep * self.checkpoint_interval, record=True)
+        return self.makespan, self.mio_score
+
+    def evaluate(self, seq, start=None, cutoff=None):
+        """
+        Evaluates a neighbor of the base sequence.
+
+        Parameters:
+            seq (list): The neighbor, equal to the base sequence before position start.
+            start (int): First position at which seq differs from the base (default is computed).
+            cutoff (int): Stop as soon as the makespan is known to be >= cutoff (default is None, no cutoff).
+
+        Returns:
+            tuple: (makespan, mio_score) of seq, or (bound, None) with bound >= cutoff if seq is dominated.
+        """
+        if start is None:
+            start = first_difference(self.seq, seq)
+        self.evaluations += 1
+        Individual.count_evaluations()
+        if cutoff is not None and self.instance.lower_bound >= cutoff:
+            self.pruned += 1
+            return self.instance.lower_bound, None
+        return self._decode(seq, self._checkpoint_before(start) * self.checkpoint_interval, record=False, cutoff=cutoff)
+
+    def swap(self, i, j):
+        """
+        Returns the base sequence with positions i and j swapped.
+        """
+        seq = self.seq[:]
+        seq[i], seq[j] = seq[j], seq[i]
+        return seq
+
+    def evaluate_swap(self, i, j, cutoff=None):
+        """
+        Evaluates the base sequence with positions i and j swapped.
+
+        Returns:
+            tuple: (makespan, mio_score) of the neighbor, or (bound, None) if it is dominated by cutoff.
+        """
+        return self.evaluate(self.swap(i, j), min(i, j), cutoff)
+
+    def insert(self, i, j):
+        """
+        Returns the base sequence with the gene at position i moved to position j.
+        """
+        seq = self.seq[:]
+        seq.insert(j, seq.pop(i))
+        return seq
+
+    def evaluate_insert(self, i, j, cutoff=None):
+        """
+        Evaluates the base sequence with the gene at position i moved to position j.
+
+        Returns:
+            tuple: (makespan, mio_score) of the neighbor, or (bound, None) if it is dominated by cutoff.
+        """
+        return self.evaluate(self.insert(i, j), min(i, j), cutoff)
+
+    def create_individual(self, individual, seq, makespan, mio_score, config):
+        """
+        Creates an individual from an evaluated neighbor without evaluating it again.
+
+        Parameters:
+            individual (Individual): The individual to copy.
+            seq (list): The neighbor sequence.
+            makespan (int): Makespan returned by evaluate.
+            mio_score (int): MIO score returned by evaluate.
+            config: Configuration object with simulation settings.
+
+        Returns:
+            Individual: The new individual.
+        """
+        new_individual = individual.clone()
+        new_individual.seq = seq
+        new_individual.monitor = None
+        if config.decoder != 'semi-active':
+            # semi-active 값은 active decoder의 makespan과 다르므로 읽을 때 다시 평가
+            return new_individual
+        new_individual.makespan, new_individual.mio_score = makespan, mio_score
+        new_individual.calculate_fitness(config.target_makespan)
+        return new_individual
+
+    def _checkpoint_before(self, start):
+        return min(start // self.checkpoint_interval, len(self._checkpoints) - 1)
+
+    def is_optimal(self, makespan):
+        """
+        Returns True if makespan reaches the instance lower bound, so no neighbor can improve on it.
+        """
+        return makespan <= self.instance.lower_bound
+
+    def _bounded_table(self, cutoff):
+        # cutoff별로 (machine, process_time, cutoff - job tail)을 묶은 table을 만들어 재사용
+        table = self._bounded_tables.get(cutoff)
+        if table is None:
+            if len(self._bounded_tables) >= 8:
+                self._bounded_tables.clear()
+            table = [[(m, d, cutoff - tail) for m, d, tail in zip(*rows)]
+                     for rows in zip(self._machine_of, self._time_of, self._tail_of)]
+            self._bounded_tables[cutoff] = table
+        return table
+
+    def _decode(self, seq, pos, record, cutoff=None):
+        # pos는 checkpoint 위치: 그 이전 prefix의 상태를 복원하고 seq[pos:]만 decoding
+        k = pos // self.checkpoint_interval
+        if k < len(self._checkpoints):
+            job_ready, machine_ready, job_step, n_last = self._checkpoints[k]
+            job_ready, machine_ready, job_step = job_ready[:], machine_ready[:], job_step[:]
+        else:
+            job_ready = [0] * self.instance.n_job
+            machine_ready = [0] * self.instance.n_machine
+            job_step = [0] * self.instance.n_job
+            n_last = 0
+        last_steps = self._base_last_steps[:n_last] if not record else self._base_last_steps
+
+        job_of, machine_of, time_of, last_machine = self._job_of, self._machine_of, self._time_of, self._last_machine
+        if cutoff is not None:
+            table = self._bounded_table(cutoff)
+            for p in range(pos, len(seq)):
+                j = job_of[seq[p]]
+                s = job_step[j]
+                job_step[j] = s + 1
+                m, d, limit = table[j][s]
+                t = job_ready[j]
+                if machine_ready[m] > t:
+                    t = machine_ready[m]
+                t += d
+                job_ready[j] = t
+                machine_ready[m] = t
+                if m == last_machine:
+                    last_steps.append(s)
+                # 종료 시각 + 남은 job 작업량(makespan 하한)이 cutoff 이상이면 중단
+                if t >= limit:
+                    self.decoded_positions += p + 1 - pos
+                    self.pruned += 1
+                    return t + cutoff - limit, None
+        else:
+            interval = self.checkpoint_interval
+            for p in range(pos, len(seq)):
+                if record and p % interval == 0 and p // interval == len(self._checkpoints):
+                    self._checkpoints.append((job_ready[:], machine_ready[:], job_step[:], len(last_steps)))
+                j = job_of[seq[p]]
+                s = job_step[j]
+                job_step[j] = s + 1
+                m = machine_of[j][s]
+                t = job_ready[j]
+                if machine_ready[m] > t:
+                    t = machine_ready[m]
+                t += time_of[j][s]
+                job_ready[j] = t
+                machine_ready[m] = t
+                if m == last_machine:
+                    last_steps.append(s)
+        if not record:
+            self.decoded_positions += len(seq) - pos
+
+        # Individual.evaluate와 동일하게 마지막 machine의 MIO로 score 계산
+        return max(job_ready), machine_input_order_score(last_steps)
@@ -5,36 +5,61 @@ This script defines the Individual class, which represents a solution to the job
 It includes functionalities for interpreting solutions, evaluating makespan and fitness, 
 and generating machine order sequences.
 
+Search-time evaluations run without an event trace (the Monitor is replaced by a
+NullMonitor and nothing is kept on the individual). The trace of the final schedule
+is produced on demand with replay().
+
+Decoding and evaluation are lazy: job_seq, machine_order, makespan, fitness, MIO and score
+are computed on first access and recomputed automatically after seq is reassigned.
+Individual.evaluation_count counts the evaluations done in the process; evaluations are
+also added to Individual.evaluation_counter, the GAEngine whose evaluations are being
+counted (see GAEngine.counting), so every island keeps its own count.
+
+The chromosome is stored as a read-only NumPy int64 array. Reading seq returns that array
+without copying; to change a chromosome, build a new sequence (e.g. from seq.tolist())
+and assign it to seq, which takes the copy. Individuals are cheap to copy: the class uses
+__slots__, and clone() (also used by copy.copy) shares config, op_data, the chromosome
+and the decoded/evaluated results by reference. copy.deepcopy makes an independent deep
+copy of every attribute.
+Evaluation only produces makespan and mio_score; MIO_sorted and the MIO metrics (score)
+are computed when they are read, with the vectorized MachineInputOrder.utils.mio_metrics.
+
 Functions:
-    calculate_score(x_array, y_array): Calculates various scores between two arrays.
+    calculate_score(x_array, y_array): Calculates various scores between two arrays with scipy (reference for mio_metrics).
     swap_digits(num): Swaps the digits of a two-digit number.
     Individual.__init__(self, config=None, seq=None, solution_seq=None, op_data=None): Initializes an individual with the given parameters.
     Individual.__str__(self): Returns a string representation of the individual.
     Individual.calculate_fitness(self, target_makespan): Calculates the fitness of the individual.
     Individual.interpret_solution(self, s): Interprets a solution sequence by swapping digits.
+    Individual.is_evaluated(self): Returns True if makespan and mio_score belong to the current seq.
+    Individual.decode_seq(self): Updates job_seq, feasible_seq and machine_order from seq in one pass.
     Individual.get_repeatable(self): Generates a repeatable job sequence.
     Individual.get_feasible(self): Generates a feasible sequence.
     Individual.get_machine_order(self): Generates the machine order for the sequence.
-    Individual.evaluate(self, machine_order): Evaluates the makespan and MIO score for the individual.
+    Individual.count_evaluations(n): Counts evaluations in the process total and the active evaluation_counter.
+    Individual.evaluate(self, machine_order, trace=False): Evaluates the makespan and MIO score for the individual (fitness cache when trace is False).
+    Individual.simulate(self, machine_order, trace=False): Runs the schedule in the SimPy model.
+    Individual.replay(self): Re-runs the schedule in the SimPy model with a full event trace.
+    Individual.evaluate_array(self, machine_order): Evaluates the individual with the array decoder instead of SimPy.
+    Individual.clone(self): Returns a copy sharing config, op_data and the chromosome.
 """
 
 import sys
 import os
 import math
+import copy
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 import numpy as np
-import simpy
-from environment.Source import Source
-from environment.Sink import Sink
-from environment.Part import Job, Operation
-from environment.Process import Process
-from environment.Resource import Machine
-from environment.Monitor import Monitor
+from environment.Monitor import Monitor, NullMonitor
+from environment.Model import get_simulation_model
 from postprocessing.PostProcessing import *
 from visualization.Gantt import *
 from visualization.GUI import GUI
-from MachineInputOrder.utils import kendall_tau_distance, spearman_footrule_distance, spearman_rank_correlation, bubble_sort_distance, MSE
+from GAS.Decoder import decode_chromosome, decode_semi_active, decode_active, machine_input_order, machine_input_order_score
+from GAS.FitnessCache import get_fitness_cache, machine_order_key
+from Data.Dataset.ProblemInstance import ProblemInstance
+from MachineInputOrder.utils import kendall_tau_distance, spearman_footrule_distance, spearman_rank_correlation, bubble_sort_distance, MSE, mio_metrics
 
 def calculate_score(x_array, y_array):
     score = [0.0 for i in range(6)]
@@ -57,28 +82,196 @@ def swap_digits(num):
         return units * 10 + tens
 
 class Individual:
+    # 이 process에서 수행된 makespan 평가 횟수 (SimPy/array/batch 경로 모두 포함)
+    evaluation_count = 0
+    # 평가 횟수를 함께 세는 객체 (evaluations 속성, GAEngine.counting 참고), 없으면 None
+    evaluation_counter = None
+
+    __slots__ = ('config', 'op_data', 'monitor', 'scaled_fitness',
+                 '_seq', '_snapshots', '_fitness',
+                 '_job_seq', '_feasible_seq', '_machine_order',
+                 '_makespan', '_mio_score', '_MIO', '_score')
+
     def __init__(self, config=None, seq=None, solution_seq=None, op_data=None):
-        self.fitness = None
-        self.monitor = None  # Add monitor attribute
+        self.config = config
+        self.op_data = ProblemInstance.of(op_data)  # 모든 Individual이 같은 instance를 참조
+        self.monitor = None  # replay()로 생성한 event trace (탐색 중 평가에서는 None)
         if solution_seq is not None:
             self.seq = self.interpret_solution(solution_seq)
         else:
             self.seq = seq
-
-        self.config = config
-        self.op_data = op_data
-        self.MIO = []
-        self.MIO_sorted = []
-        self.job_seq = self.get_repeatable()
-        self.feasible_seq = self.get_feasible()
-        self.machine_order = self.get_machine_order()
-        self.makespan, self.mio_score = self.evaluate(self.machine_order)
-        self.score = calculate_score(self.MIO, self.MIO_sorted)
-        self.calculate_fitness(config.target_makespan)  # Ensure target_makespan is passed
+        # decoding과 평가는 job_seq, machine_order, makespan 등을 처음 읽을 때 수행 (lazy)
 
     def __str__(self):
         return f"Individual(makespan={self.makespan}, fitness={self.fitness})"
 
+    # ------------------------------------------------------------------
+    # seq가 재할당되면 아래 값들은 자동으로 무효화됨.
+    # 각 값은 계산 당시의 seq 배열을 함께 저장하고, 읽을 때 현재 seq와 같은 객체인지 비교함
+    # (seq는 읽기 전용이므로 in-place로 바뀌지 않음).
+    # ------------------------------------------------------------------
+    @property
+    def seq(self):
+        # 읽기 전용 배열을 그대로 반환 (복사하지 않음)
+        return self._seq
+
+    @seq.setter
+    def seq(self, seq):
+        if seq is not None:
+            # 새 배열로 복사한 뒤 고정 (이미 고정된 int64 배열이면 복사 없이 공유)
+            if not (isinstance(seq, np.ndarray) and seq.dtype == np.int64 and not seq.flags.writeable):
+                seq = np.array(seq, dtype=np.int64)
+                seq.setflags(write=False)
+        self._seq = seq
+        self._snapshots = {}
+        self._fitness = None
+
+    def _is_current(self, name):
+        return self._snapshots.get(name) is self._seq
+
+    def _mark_current(self, name):
+        self._snapshots[name] = self._seq
+
+    def clone(self):
+        """
+        Returns a copy of the individual.
+
+        config, op_data, the monitor, the chromosome and the decoded/evaluated results are
+        shared by reference (they are replaced, not changed in place).
+
+        Returns:
+            Individual: The copy.
+        """
+        cls = self.__class__
+        new = cls.__new__(cls)
+        for name in cls.__slots__:
+            try:
+                object.__setattr__(new, name, object.__getattribute__(self, name))
+            except AttributeError:
+                pass
+        new._snapshots = dict(self._snapshots)
+        return new
+
+    def __copy__(self):
+        return self.clone()
+
+    def __deepcopy__(self, memo):
+        # 모든 속성을 복제 (op_data는 불변이므로 ProblemInstance.__deepcopy__에 의해 공유됨)
+        cls = self.__class__
+        new = cls.__new__(cls)
+        memo[id(self)] = new
+        for name in cls.__slots__:
+            try:
+                value = object.__getattribute__(self, name)
+            except AttributeError:
+                continue
+            object.__setattr__(new, name, copy.deepcopy(value, memo))
+        if new._seq is not None:
+            # 복제된 배열은 쓰기 가능하므로 다시 고정 (snapshot도 memo를 통해 같은 객체를 가리킴)
+            new._seq.setflags(write=False)
+        return new
+
+    def is_evaluated(self):
+        """
+        Returns True if makespan and mio_score belong to the current seq.
+        """
+        return self._is_current('evaluated')
+
+    def _ensure_decoded(self):
+        if not self._is_current('decoded'):
+            self.decode_seq()
+
+    def _ensure_evaluated(self):
+        if not self._is_current('evaluated'):
+            self.makespan, self.mio_score = self.evaluate(self.machine_order)
+
+    @property
+    def job_seq(self):
+        self._ensure_decoded()
+        return self._job_seq
+
+    @job_seq.setter
+    def job_seq(self, job_seq):
+        self._ensure_decoded()
+        self._job_seq = job_seq
+
+    @property
+    def feasible_seq(self):
+        self._ensure_decoded()
+        return self._feasible_seq
+
+    @feasible_seq.setter
+    def feasible_seq(self, feasible_seq):
+        self._ensure_decoded()
+        self._feasible_seq = feasible_seq
+
+    @property
+    def machine_order(self):
+        self._ensure_decoded()
+        return self._machine_order
+
+    @machine_order.setter
+    def machine_order(self, machine_order):
+        self._ensure_decoded()
+        self._machine_order = machine_order
+
+    @property
+    def makespan(self):
+        self._ensure_evaluated()
+        return self._makespan
+
+    @makespan.setter
+    def makespan(self, makespan):
+        self._makespan = makespan
+        self._fitness = None
+        self._mark_current('evaluated')
+
+    @property
+    def mio_score(self):
+        self._ensure_evaluated()
+        return self._mio_score
+
+    @mio_score.setter
+    def mio_score(self, mio_score):
+        self._mio_score = mio_score
+
+    @property
+    def fitness(self):
+        if self._fitness is None or not self._is_current('evaluated'):
+            self.calculate_fitness(self.config.target_makespan)
+        return self._fitness
+
+    @fitness.setter
+    def fitness(self, fitness):
+        self._fitness = fitness
+
+    def _ensure_mio(self):
+        if not self._is_current('mio'):
+            # batch 평가처럼 MIO 없이 makespan만 계산된 경우 machine_order로부터 바로 구함
+            self.MIO = machine_input_order(self.machine_order, self.op_data)
+
+    @property
+    def MIO(self):
+        self._ensure_mio()
+        return self._MIO
+
+    @MIO.setter
+    def MIO(self, mio_list):
+        self._MIO = mio_list
+        self._mark_current('mio')
+
+    @property
+    def MIO_sorted(self):
+        return [np.sort(mio) for mio in self.MIO]
+
+    @property
+    def score(self):
+        # calculate_score(MIO, MIO_sorted)와 같은 값을 scipy 호출 없이 계산
+        if not self._is_current('score'):
+            self._score = mio_metrics(self.MIO).tolist()
+            self._mark_current('score')
+        return self._score
+
     def calculate_fitness(self, target_makespan):
         if self.makespan == 0:
             raise ValueError("Makespan is zero, which will cause division by zero error.")
@@ -89,78 +282,81 @@ class Individual:
         modified_list = [swap_digits(num) for num in s]
         return modified_list
 
+    def decode_seq(self):
+        # seq -> job_seq, feasible_seq, machine_order를 한 번의 선형 decoding으로 갱신
+        job_seq, feasible_seq, machine_flat, offsets = decode_chromosome(self._seq, self.op_data)
+        self._job_seq = job_seq.tolist()
+        self._feasible_seq = feasible_seq
+        if self.config.decoder == 'active':
+            # seq를 우선순위로 만든 active schedule의 machine order (평가는 semi-active와 동일 경로)
+            self._machine_order = decode_active(self._seq, self.op_data, self.config.active_delta).machine_order
+        else:
+            self._machine_order = [machine_flat[offsets[m]:offsets[m + 1]].tolist() for m in range(self.config.n_machine)]
+        self._mark_current('decoded')
+
     def get_repeatable(self):
-        cumul = 0
-        sequence_ = np.array(self.seq)
-        for i in range(self.config.n_job):
-            for j in range(self.config.n_machine):
-                sequence_ = np.where((sequence_ >= cumul) & (sequence_ < cumul + self.config.n_machine), i, sequence_)
-            cumul += self.config.n_machine
-        return sequence_.tolist()
+        return decode_chromosome(self._seq, self.op_data)[0].tolist()
 
     def get_feasible(self):
-        temp = 0
-        cumul = 0
-        sequence_ = np.array(self.seq)
-        for i in range(self.config.n_job):
-            idx = np.where((sequence_ >= cumul) & (sequence_ < cumul + self.config.n_machine))[0]
-            for j in range(min(len(idx), self.config.n_machine)):
-                sequence_[idx[j]] = temp
-                temp += 1
-            cumul += self.config.n_machine
-        return sequence_
+        return decode_chromosome(self._seq, self.op_data)[1]
 
     def get_machine_order(self):
-        m_list = []
-        for num in self.feasible_seq:
-            idx_j = num % self.config.n_machine
-            idx_i = num // self.config.n_machine
-            m_list.append(self.op_data[idx_i][idx_j][0])
-        m_list = np.array(m_list)
-
-        m_order = []
-        for num in range(self.config.n_machine):
-            idx = np.where((m_list == num))[0]
-            job_order = [self.job_seq[o] for o in idx]
-            m_order.append(job_order)
-        return m_order
-
-    def evaluate(self, machine_order):
+        if self.config.decoder == 'active':
+            return decode_active(self._seq, self.op_data, self.config.active_delta).machine_order
+        _, _, machine_flat, offsets = decode_chromosome(self._seq, self.op_data)
+        return [machine_flat[offsets[m]:offsets[m + 1]].tolist() for m in range(self.config.n_machine)]
+
+    @classmethod
+    def count_evaluations(cls, n=1):
+        """
+        Counts n evaluations in the process total and in the active evaluation_counter.
+
+        Parameters:
+            n (int): Number of evaluations (default is 1).
+        """
+        cls.evaluation_count += n
+        if cls.evaluation_counter is not None:
+            cls.evaluation_counter.evaluations += n
+
+    def evaluate(self, machine_order, trace=False):
+        Individual.count_evaluations()
+        if not trace:
+            # 탐색 중 평가는 evaluator와 관계없이 같은 machine_order의 결과를 cache에서 가져옴
+            cache = get_fitness_cache(self.config, self.op_data)
+            key = machine_order_key(machine_order) if cache is not None else None
+            cached = cache.get(key) if cache is not None else None
+            if cached is not None:
+                # MIO는 필요할 때 machine_order로부터 계산 (평가 경로에서는 만들지 않음)
+                self.monitor = None
+                self._snapshots.pop('mio', None)
+                return cached
+            if self.config.evaluator == 'array':
+                result = self.evaluate_array(machine_order)
+            else:
+                result = self.simulate(machine_order)
+            if cache is not None:
+                cache.put(key, result)
+            return result
+        return self.simulate(machine_order, trace=True)
+
+    def simulate(self, machine_order, trace=False):
         try:
             # Debug: machine_order 요약
             # print(f"Evaluating with machine_order: {machine_order[:2]} ...")  # 첫 두 개의 machine_order만 출력
 
-            env = simpy.Environment()
-            self.monitor = Monitor(self.config)
-            model = dict()
-            
-            # 모델 초기화
-            for i in range(self.config.n_job):
-                model['Source' + str(i)] = Source(env, 'Source' + str(i), model, self.monitor, part_type=i, op_data=self.op_data, config=self.config)
-
-            for j in range(self.config.n_machine):
-                model['Process' + str(j)] = Process(env, 'Process' + str(j), model, self.monitor, machine_order[j], self.config)
-                model['M' + str(j)] = Machine(env, j)
+            # 탐색 중 평가는 event를 기록하지 않음 (trace는 replay에서만 생성)
+            monitor = Monitor(self.config) if trace else NullMonitor(self.config)
+            self.monitor = monitor if trace else None
 
-            model['Sink'] = Sink(env, self.monitor, self.config)
+            # dataset/config별로 한 번 만든 모델을 reset하여 재사용, 모든 Part 완료 시 종료
+            model = get_simulation_model(self.config, self.op_data)
+            makespan, mio_list = model.run(machine_order, monitor)
 
-            # 시뮬레이션 실행
-            env.run(self.config.simul_time)
-            # print(f"Simulation completed.")
-
-            # Machine input/output 추적
-            self.MIO = []
-            self.MIO_sorted = []
-            
-            # MIO 계산
-            for i in range(self.config.n_machine):
-                mio = model['M' + str(i)].op_where
-                self.MIO.append(mio)
-                self.MIO_sorted.append(np.sort(mio))
+            # Machine input/output 추적 (MIO_sorted, score는 읽을 때 계산)
+            self.MIO = mio_list
 
             # MIO Score 및 Makespan 계산
-            mio_score = np.sum(np.abs(np.subtract(np.array(mio), np.array(sorted(mio)))))
-            makespan = model['Sink'].last_arrival
+            mio_score = machine_input_order_score(self.MIO[-1])
             
             # 간결한 결과 출력
             # print(f"Evaluation complete: Makespan = {makespan}, MIO Score = {mio_score}")
@@ -170,3 +366,26 @@ class Individual:
         except Exception as e:
             print(f"Error during evaluation: {e}")
             raise
+
+    def replay(self):
+        """
+        Re-runs the schedule of this individual in the SimPy model with a full event trace.
+
+        Use this once for the final (best) individual to produce the event log, machine log
+        and Gantt chart; all evaluations during the search run without a trace.
+
+        Returns:
+            Monitor: The recorded events (also stored in self.monitor).
+        """
+        self.evaluate(self.machine_order, trace=True)
+        return self.monitor
+
+    def evaluate_array(self, machine_order):
+        self.monitor = None
+        # SimPy 모델 없이 machine_order로부터 semi-active schedule을 바로 계산
+        schedule = decode_semi_active(machine_order, self.op_data)
+        makespan, mio_list = schedule.makespan, schedule.mio
+        # SimPy 경로와 동일하게 마지막 machine의 MIO로 score 계산
+        mio_score = machine_input_order_score(mio_list[-1])
+        self.MIO = mio_list
+        return makespan, mio_score
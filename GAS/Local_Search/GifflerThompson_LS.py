@@ -15,8 +15,13 @@ Functions:
     create_new_individual(individual, new_seq, config): Creates a new individual with the optimized sequence.
 """
 
-import copy
+import sys
+import os
 import random
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+import numpy as np
+from Data.Dataset.ProblemInstance import ProblemInstance
 
 class GifflerThompson_LS:
     """
@@ -50,7 +55,7 @@ class GifflerThompson_LS:
         Returns:
             Individual: The optimized individual.
         """
-        best_individual = copy.deepcopy(individual)
+        best_individual = individual.clone()
         best_individual.calculate_fitness(config.target_makespan)
         best_rule = "basic"
 
@@ -112,30 +117,24 @@ class GifflerThompson_LS:
         Returns:
             list: The sorted job sequence.
         """
-        def safe_get_op_data(x, idx):
-            try:
-                return op_data[x // config.n_machine][x % config.n_machine][idx]
-            except IndexError:
-                return float('inf') if idx == 1 else 0
-
         if priority_rule is None:
             return seq  # 우선순위 규칙을 적용하지 않은 경우
 
-        if priority_rule == 'SPT':
-            sorted_seq = sorted(seq, key=lambda x: safe_get_op_data(x, 1))
-        elif priority_rule == 'LPT':
-            sorted_seq = sorted(seq, key=lambda x: -safe_get_op_data(x, 1))
-        elif priority_rule == 'MWR':
-            sorted_seq = sorted(seq, key=lambda x: -sum(safe_get_op_data(x, 1) for i in range(config.n_machine)))
-        elif priority_rule == 'LWR':
-            sorted_seq = sorted(seq, key=lambda x: sum(safe_get_op_data(x, 1) for i in range(config.n_machine)))
-        elif priority_rule == 'MOR':
-            sorted_seq = sorted(seq, key=lambda x: -len([op for op in op_data[x // config.n_machine] if op[1] > 0]))
-        elif priority_rule == 'LOR':
-            sorted_seq = sorted(seq, key=lambda x: len([op for op in op_data[x // config.n_machine] if op[1] > 0]))
-        elif priority_rule == 'EDD':
-            sorted_seq = sorted(seq, key=lambda x: safe_get_op_data(x, 2))
-        return sorted_seq
+        instance = ProblemInstance.of(op_data)
+        keys = {
+            'SPT': instance.duration,
+            'LPT': -instance.duration,
+            'MWR': -instance.job_remaining_work,
+            'LWR': instance.job_remaining_work,
+            'MOR': -instance.job_remaining_ops,
+            'LOR': instance.job_remaining_ops,
+            'EDD': np.zeros(instance.n_op, dtype=np.int32),  # dataset에 due date가 없으므로 순서 유지
+        }.get(priority_rule)
+        if keys is None:
+            return seq
+        # sorted()와 같은 stable 정렬
+        order = np.argsort(keys[np.asarray(seq)], kind='stable')
+        return [seq[i] for i in order]
 
     def create_new_individual(self, individual, new_seq, config):
         """
@@ -149,10 +148,8 @@ class GifflerThompson_LS:
         Returns:
             Individual: The new individual with the optimized sequence.
         """
-        new_individual = copy.deepcopy(individual)
+        new_individual = individual.clone()
         new_individual.seq = new_seq
-        new_individual.job_seq = new_individual.get_repeatable()
-        new_individual.feasible_seq = new_individual.get_feasible()
-        new_individual.machine_order = new_individual.get_machine_order()
+        new_individual.decode_seq()  # job_seq, feasible_seq, machine_order 갱신
         new_individual.makespan, new_individual.mio_score = new_individual.evaluate(new_individual.machine_order)
         return new_individual
@@ -8,6 +8,10 @@ improves the job sequence to minimize the makespan and improve the fitness of th
 Classes:
     HillClimbing: A class to perform hill climbing local search optimization.
 
+Neighbors are evaluated with GAS/IncrementalEvaluator.py, so only the best neighbor of
+each iteration is turned into an Individual. With neighborhood='N5' or 'N6' only the
+critical-block moves of GAS/DisjunctiveGraph.py are tried instead of all position swaps.
+
 Functions:
     optimize(individual, config): Optimizes the job sequence using hill climbing.
     get_neighbors(individual, config): Generates neighboring solutions by swapping jobs.
@@ -15,7 +19,12 @@ Functions:
     ensure_valid_sequence(seq, config): Ensures that the job sequence is valid.
 """
 
-import copy
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from GAS.IncrementalEvaluator import IncrementalEvaluator
+from GAS.DisjunctiveGraph import DisjunctiveGraph
 
 class HillClimbing:
     """
@@ -23,17 +32,22 @@ class HillClimbing:
     
     Attributes:
         iterations (int): The number of iterations to perform.
+        neighborhood (str): 'swap' (all position swaps), 'N5' or 'N6' (critical-block moves).
         stop_search (bool): Flag to indicate when to stop the search.
     """
     
-    def __init__(self, iterations=30):
+    def __init__(self, iterations=30, neighborhood='swap'):
         """
         Initializes the HillClimbing class with the specified number of iterations.
         
         Parameters:
             iterations (int): The number of iterations to perform (default is 30).
+            neighborhood (str): 'swap', 'N5' or 'N6' (default is 'swap').
         """
+        if neighborhood not in ('swap', 'N5', 'N6'):
+            raise ValueError(f"Unknown neighborhood: {neighborhood}")
         self.iterations = iterations
+        self.neighborhood = neighborhood
         self.stop_search = False
 
     def optimize(self, individual, config):
@@ -48,26 +62,53 @@ class HillClimbing:
             Individual: The optimized individual.
         """
         print(f"HillClimbing 시작 - Initial Individual: {individual.seq}, Makespan: {individual.makespan}, Fitness: {individual.fitness}")        
-        best_solution = copy.deepcopy(individual)
-        best_makespan = individual.makespan
+        best_solution = individual.clone()
+        evaluator = IncrementalEvaluator(best_solution.seq, best_solution.op_data)
+        # 이웃과 같은 (semi-active) decoder의 값으로 비교 (decoder='active'에서는 individual.makespan과 다름)
+        best_makespan = evaluator.makespan
         iteration = 0
 
         while iteration < self.iterations:
-            neighbors = self.get_neighbors(best_solution, config)
-            current_solution = min(neighbors, key=lambda ind: ind.makespan)
-            current_makespan = current_solution.makespan
-
-            if current_makespan >= best_makespan:
+            # 모든 이웃을 incremental하게 평가하고 가장 좋은 이웃만 Individual로 생성
+            # 지금까지의 최선보다 나빠질 것이 확실한 이웃은 cutoff에서 decoding 중단
+            current = None
+            cutoff = best_makespan
+            if self.neighborhood == 'swap':
+                size = len(evaluator.seq)
+                moves = ((i, j) for i in range(size - 1) for j in range(i + 1, size))
+            else:
+                graph = DisjunctiveGraph.from_seq(evaluator.seq, evaluator.instance)
+                moves = graph.n5_moves() if self.neighborhood == 'N5' else graph.n6_moves()
+            for move in moves:
+                if self.neighborhood == 'swap':
+                    # swap 이웃의 seq는 선택된 경우에만 생성
+                    neighbor_seq = None
+                    makespan, mio_score = evaluator.evaluate_swap(move[0], move[1], cutoff)
+                else:
+                    neighbor_seq = graph.neighbor_seq(move)
+                    makespan, mio_score = evaluator.evaluate(neighbor_seq, cutoff=cutoff)
+                if mio_score is None:
+                    continue
+                current = (makespan, mio_score, neighbor_seq, move)
+                cutoff = makespan
+                if evaluator.is_optimal(makespan):
+                    break
+            if current is None:
                 break
+            current_makespan, current_mio_score, current_seq, current_move = current
 
+            if current_seq is None:
+                current_seq = evaluator.swap(*current_move)
+            evaluator.accept(current_seq)
+            current_solution = evaluator.create_individual(best_solution, current_seq, current_makespan, current_mio_score, config)
             best_solution = current_solution
             best_makespan = current_makespan
             iteration += 1
             print(f"Iteration {iteration} - Current Solution: {current_solution.seq}, Makespan: {current_makespan}, Fitness: {current_solution.fitness}")
 
-            # 목표 Makespan에 도달하면 Local Search 종료
-            if best_solution.fitness >= 1.0:
-                print(f"Stopping early as fitness {best_solution.fitness} is 1.0 or higher.")
+            # 목표 Makespan 또는 instance lower bound에 도달하면 Local Search 종료
+            if best_solution.fitness >= 1.0 or evaluator.is_optimal(best_makespan):
+                print(f"Stopping early as fitness {best_solution.fitness} is 1.0 or higher or makespan {best_makespan} reached the lower bound.")
                 self.stop_search = True
                 return best_solution
 
@@ -86,7 +127,7 @@ class HillClimbing:
             list: A list of neighboring individuals.
         """
         neighbors = []
-        seq = individual.seq
+        seq = individual.seq.tolist()
         for i in range(len(seq) - 1):
             for j in range(i + 1, len(seq)):
                 neighbor_seq = seq[:]
@@ -107,11 +148,9 @@ class HillClimbing:
         Returns:
             Individual: The new individual with the optimized sequence.
         """
-        new_individual = copy.deepcopy(individual)
+        new_individual = individual.clone()
         new_individual.seq = new_seq
-        new_individual.job_seq = new_individual.get_repeatable()
-        new_individual.feasible_seq = new_individual.get_feasible()
-        new_individual.machine_order = new_individual.get_machine_order()
+        new_individual.decode_seq()  # job_seq, feasible_seq, machine_order 갱신
         new_individual.makespan, new_individual.mio_score = new_individual.evaluate(new_individual.machine_order)
         new_individual.calculate_fitness(config.target_makespan)
         return new_individual
@@ -1,4 +1,3 @@
-import copy
 import math
 import random
 
@@ -12,8 +11,8 @@ class SimulatedAnnealing:
         self.stop_search = False
 
     def optimize(self, individual, config):
-        best_solution = copy.deepcopy(individual)
-        current_solution = copy.deepcopy(individual)
+        best_solution = individual.clone()
+        current_solution = individual.clone()
         best_makespan = best_solution.makespan
         current_makespan = current_solution.makespan
         temp = self.initial_temp
@@ -27,12 +26,12 @@ class SimulatedAnnealing:
             neighbor_makespan = neighbor.makespan
 
             if neighbor_makespan < best_makespan:
-                best_solution = copy.deepcopy(neighbor)
+                best_solution = neighbor.clone()
                 best_makespan = neighbor_makespan
 
             if neighbor_makespan < current_makespan or \
                     math.exp((current_makespan - neighbor_makespan) / temp) > random.random():
-                current_solution = copy.deepcopy(neighbor)
+                current_solution = neighbor.clone()
                 current_makespan = neighbor_makespan
 
             temp *= self.cooling_rate
@@ -46,7 +45,7 @@ class SimulatedAnnealing:
         return best_solution
 
     def get_random_neighbor(self, individual, config):  # config 매개변수 추가
-        new_seq = copy.deepcopy(individual.seq)
+        new_seq = individual.seq.tolist()
         size = len(new_seq)
 
         # 염색체 길이에 대한 상대적 비율로 교환 횟수 결정
@@ -73,10 +72,8 @@ class SimulatedAnnealing:
         Returns:
             Individual: The new individual with the optimized sequence.
         """
-        new_individual = copy.deepcopy(individual)
+        new_individual = individual.clone()
         new_individual.seq = new_seq
-        new_individual.job_seq = new_individual.get_repeatable()
-        new_individual.feasible_seq = new_individual.get_feasible()
-        new_individual.machine_order = new_individual.get_machine_order()
+        new_individual.decode_seq()  # job_seq, feasible_seq, machine_order 갱신
         new_individual.makespan, new_individual.mio_score = new_individual.evaluate(new_individual.machine_order)
         return new_individual
@@ -1,6 +1,10 @@
-import copy
+import sys
+import os
 import math
 import random
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from GAS.IncrementalEvaluator import IncrementalEvaluator
 
 class SimulatedAnnealing_insert:
     def __init__(self, initial_temp=1000, cooling_rate=0.95, min_temp=1, min_insert_ratio=0.05, max_insert_ratio=0.5):
@@ -12,41 +16,49 @@ class SimulatedAnnealing_insert:
         self.stop_search = False
 
     def optimize(self, individual, config):
-        best_solution = copy.deepcopy(individual)
-        current_solution = copy.deepcopy(individual)
+        best_solution = individual.clone()
         best_makespan = best_solution.makespan
-        current_makespan = current_solution.makespan
+        current_makespan = individual.makespan
         temp = self.initial_temp
         iteration = 0
 
         # Run_Config의 simulated_annealing_iterations 사용
         iterations = config.simulated_annealing_iterations
 
+        # 현재 해를 base로 checkpoint를 유지하여 이웃은 바뀐 위치 이후만 decoding
+        evaluator = IncrementalEvaluator(individual.seq, individual.op_data)
+
         while temp > self.min_temp and iteration < iterations:
-            neighbor = self.get_random_neighbor(current_solution, config)  # config 추가
-            neighbor_makespan = neighbor.makespan
+            neighbor_seq, start = self.get_random_neighbor_seq(evaluator.seq)
+            neighbor_makespan, neighbor_mio_score = evaluator.evaluate(neighbor_seq, start)
 
             if neighbor_makespan < best_makespan:
-                best_solution = copy.deepcopy(neighbor)
+                best_solution = evaluator.create_individual(individual, neighbor_seq, neighbor_makespan, neighbor_mio_score, config)
                 best_makespan = neighbor_makespan
 
             if neighbor_makespan < current_makespan or \
                     math.exp((current_makespan - neighbor_makespan) / temp) > random.random():
-                current_solution = copy.deepcopy(neighbor)
+                evaluator.accept(neighbor_seq, start)
                 current_makespan = neighbor_makespan
 
             temp *= self.cooling_rate
             iteration += 1
 
-            if best_solution.fitness >= 1.0:
-                print(f"Stopping early as fitness {best_solution.fitness} is 1.0 or higher.")
+            if best_solution.fitness >= 1.0 or evaluator.is_optimal(best_makespan):
+                print(f"Stopping early as fitness {best_solution.fitness} is 1.0 or higher or makespan {best_makespan} reached the lower bound.")
                 self.stop_search = True
                 break
 
         return best_solution
 
-    def get_random_neighbor(self, individual, config):  # config 매개변수 추가
-        new_seq = copy.deepcopy(individual.seq)
+    def get_random_neighbor_seq(self, seq):
+        """
+        Applies a random number of insert moves to a copy of seq.
+
+        Returns:
+            tuple: (new_seq, start) where start is the first position that may have changed.
+        """
+        new_seq = list(seq)
         size = len(new_seq)
 
         # 염색체 길이에 대한 상대적 비율로 삽입 횟수 결정
@@ -54,11 +66,16 @@ class SimulatedAnnealing_insert:
         max_inserts = min(size, int(size * self.max_insert_ratio))
         num_inserts = random.randint(min_inserts, max_inserts)
 
+        start = size
         for _ in range(num_inserts):
             i, j = random.sample(range(size), 2)
             job = new_seq.pop(i)
             new_seq.insert(j, job)
-        
+            start = min(start, i, j)
+        return new_seq, start
+
+    def get_random_neighbor(self, individual, config):  # config 매개변수 추가
+        new_seq, _ = self.get_random_neighbor_seq(individual.seq)
         neighbor = self.create_new_individual(individual, new_seq, config)  # config 전달
         return neighbor
 
@@ -74,10 +91,8 @@ class SimulatedAnnealing_insert:
         Returns:
             Individual: The new individual with the optimized sequence.
         """
-        new_individual = copy.deepcopy(individual)
+        new_individual = individual.clone()
         new_individual.seq = new_seq
-        new_individual.job_seq = new_individual.get_repeatable()
-        new_individual.feasible_seq = new_individual.get_feasible()
-        new_individual.machine_order = new_individual.get_machine_order()
+        new_individual.decode_seq()  # job_seq, feasible_seq, machine_order 갱신
         new_individual.makespan, new_individual.mio_score = new_individual.evaluate(new_individual.machine_order)
         return new_individual
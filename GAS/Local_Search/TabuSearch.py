@@ -9,16 +9,27 @@ moves to avoid cycling.
 Classes:
     TabuSearch: A class to perform tabu search local search optimization.
 
+Neighbors are evaluated with GAS/IncrementalEvaluator.py instead of being built and
+simulated as full Individuals. With neighborhood='N5' or 'N6' the search walks the
+critical-block neighborhoods of GAS/DisjunctiveGraph.py instead of position swaps.
+
 Functions:
     optimize(individual, config): Optimizes the job sequence using tabu search.
+    optimize_critical(individual, config): Tabu search over the N5/N6 critical-block neighborhood.
+    get_neighbor_moves(size): Returns the swap moves (i, j) that define the neighborhood.
     get_neighbors(individual, config): Generates neighboring solutions by swapping jobs.
     create_new_individual(individual, new_seq, config): Creates a new individual with the optimized sequence.
     ensure_valid_sequence(seq, config): Ensures that the job sequence is valid.
 """
 
-import copy
+import sys
+import os
 from collections import deque
 import random
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from GAS.IncrementalEvaluator import IncrementalEvaluator
+from GAS.DisjunctiveGraph import DisjunctiveGraph
 
 class TabuSearch:
     """
@@ -28,10 +39,11 @@ class TabuSearch:
         tabu_tenure (int): The number of iterations a move remains tabu.
         iterations (int): The number of iterations to perform.
         max_neighbors (int): The maximum number of neighbors to consider.
+        neighborhood (str): 'swap' (position swaps), 'N5' or 'N6' (critical-block moves).
         stop_search (bool): Flag to indicate when to stop the search.
     """
     
-    def __init__(self, tabu_tenure=5, iterations=10, max_neighbors=10):
+    def __init__(self, tabu_tenure=5, iterations=10, max_neighbors=10, neighborhood='swap'):
         """
         Initializes the TabuSearch class with the specified parameters.
         
@@ -39,10 +51,14 @@ class TabuSearch:
             tabu_tenure (int): The number of iterations a move remains tabu (default is 5).
             iterations (int): The number of iterations to perform (default is 10).
             max_neighbors (int): The maximum number of neighbors to consider (default is 10).
+            neighborhood (str): 'swap', 'N5' or 'N6' (default is 'swap').
         """
+        if neighborhood not in ('swap', 'N5', 'N6'):
+            raise ValueError(f"Unknown neighborhood: {neighborhood}")
         self.tabu_tenure = tabu_tenure
         self.iterations = iterations
         self.max_neighbors = max_neighbors  # 최대 이웃 개수를 추가
+        self.neighborhood = neighborhood
         self.stop_search = False  # 종료 조건 플래그 추가
 
     def optimize(self, individual, config):
@@ -56,37 +72,129 @@ class TabuSearch:
         Returns:
             Individual: The optimized individual.
         """
-        best_solution = copy.deepcopy(individual)
-        best_makespan = individual.makespan
+        if self.neighborhood != 'swap':
+            return self.optimize_critical(individual, config)
+
+        best_solution = individual.clone()
         tabu_list = []
-        tabu_list.append(copy.deepcopy(individual.seq))
+        tabu_list.append(individual.seq.tolist())
+
+        evaluator = IncrementalEvaluator(individual.seq, individual.op_data)
+        # 이웃과 같은 (semi-active) decoder의 값으로 비교 (decoder='active'에서는 individual.makespan과 다름)
+        best_makespan = evaluator.makespan
 
         for iteration in range(self.iterations):
-            neighbors = self.get_neighbors(individual, config)
-            neighbors = [n for n in neighbors if n.seq not in tabu_list]
+            # 이웃은 seq와 평가값만 계산하고, best가 갱신될 때만 Individual 생성
+            # 현재 최선의 이웃보다 나빠질 것이 확실하면 cutoff에서 decoding 중단
+            current = None
+            for i, j in self.get_neighbor_moves(len(evaluator.seq)):
+                neighbor_seq = evaluator.swap(i, j)
+                if neighbor_seq in tabu_list:
+                    continue
+                makespan, mio_score = evaluator.evaluate(neighbor_seq, i, current[0] if current else None)
+                if mio_score is None:
+                    continue
+                current = (makespan, mio_score, neighbor_seq)
+                if evaluator.is_optimal(makespan):
+                    break
 
-            if not neighbors:
+            if current is None:
                 break
 
-            current_solution = min(neighbors, key=lambda ind: ind.makespan)
-            current_makespan = current_solution.makespan
+            current_makespan, current_mio_score, current_seq = current
 
             if current_makespan < best_makespan:
-                best_solution = copy.deepcopy(current_solution)
+                best_solution = evaluator.create_individual(individual, current_seq, current_makespan, current_mio_score, config)
                 best_makespan = current_makespan
 
-            tabu_list.append(copy.deepcopy(current_solution.seq))
+            tabu_list.append(current_seq)
             if len(tabu_list) > self.tabu_tenure:
                 tabu_list.pop(0)
 
-            # 목표 Makespan에 도달하면 Local Search 종료
-            if best_solution.fitness >= 1.0:
-                print(f"Stopping early as fitness {best_solution.fitness} is 1.0 or higher.")
+            # 목표 Makespan 또는 instance lower bound에 도달하면 Local Search 종료
+            if best_solution.fitness >= 1.0 or evaluator.is_optimal(best_makespan):
+                print(f"Stopping early as fitness {best_solution.fitness} is 1.0 or higher or makespan {best_makespan} reached the lower bound.")
                 self.stop_search = True
                 return best_solution
 
         return best_solution
 
+    def optimize_critical(self, individual, config):
+        """
+        Tabu search over the N5/N6 critical-block neighborhood.
+        
+        Each iteration moves to the best non-tabu neighbor of the current solution. A move
+        that puts operation v before u makes "u before v" tabu for tabu_tenure iterations;
+        tabu moves are still taken if they improve on the best makespan (aspiration).
+        
+        Parameters:
+            individual (Individual): The individual to optimize.
+            config: Configuration object with simulation settings.
+        
+        Returns:
+            Individual: The best individual found.
+        """
+        best_solution = individual.clone()
+        evaluator = IncrementalEvaluator(individual.seq, individual.op_data)
+        best_makespan = evaluator.makespan  # 이웃과 같은 (semi-active) decoder의 값
+        tabu_list = deque(maxlen=self.tabu_tenure)
+
+        for iteration in range(self.iterations):
+            graph = DisjunctiveGraph.from_seq(evaluator.seq, evaluator.instance)
+            moves = graph.n5_moves() if self.neighborhood == 'N5' else graph.n6_moves()
+
+            current = None
+            for move in moves:
+                u, v, _ = move
+                # tabu 이동은 best를 갱신할 때(aspiration)만 필요하므로 cutoff를 best_makespan으로 제한
+                cutoff = current[0] if current else None
+                if (v, u) in tabu_list:
+                    cutoff = best_makespan if cutoff is None else min(cutoff, best_makespan)
+                neighbor_seq = graph.neighbor_seq(move)
+                makespan, mio_score = evaluator.evaluate(neighbor_seq, cutoff=cutoff)
+                if mio_score is None:
+                    continue
+                current = (makespan, mio_score, neighbor_seq, move)
+                if evaluator.is_optimal(makespan):
+                    break
+
+            if current is None:
+                break
+
+            current_makespan, current_mio_score, current_seq, (u, v, _) = current
+            evaluator.accept(current_seq)
+            tabu_list.append((u, v))  # u를 다시 v 앞으로 되돌리는 이동을 금지
+
+            if current_makespan < best_makespan:
+                best_solution = evaluator.create_individual(individual, current_seq, current_makespan, current_mio_score, config)
+                best_makespan = current_makespan
+
+            # 목표 Makespan 또는 instance lower bound에 도달하면 Local Search 종료
+            if best_solution.fitness >= 1.0 or evaluator.is_optimal(best_makespan):
+                print(f"Stopping early as fitness {best_solution.fitness} is 1.0 or higher or makespan {best_makespan} reached the lower bound.")
+                self.stop_search = True
+                return best_solution
+
+        return best_solution
+
+    def get_neighbor_moves(self, size):
+        """
+        Returns the swap moves (i, j) that define the neighborhood.
+        
+        Parameters:
+            size (int): Length of the job sequence.
+        
+        Returns:
+            list: Up to max_neighbors (i, j) pairs with i < j.
+        """
+        moves = []
+        for i in range(size - 1):
+            for j in range(i + 1, size):
+                if len(moves) >= self.max_neighbors:  # 최대 이웃 개수 조건 추가
+                    return moves
+                moves.append((i, j))
+        return moves
+
     def get_neighbors(self, individual, config):
         """
         Generates neighboring solutions by swapping jobs.
@@ -99,7 +207,7 @@ class TabuSearch:
             list: A list of neighboring individuals.
         """
         neighbors = []
-        seq = individual.seq
+        seq = individual.seq.tolist()
         for i in range(len(seq) - 1):
             for j in range(i + 1, len(seq)):
                 if len(neighbors) >= self.max_neighbors:  # 최대 이웃 개수 조건 추가
@@ -122,11 +230,9 @@ class TabuSearch:
         Returns:
             Individual: The new individual with the optimized sequence.
         """
-        new_individual = copy.deepcopy(individual)
+        new_individual = individual.clone()
         new_individual.seq = new_seq
-        new_individual.job_seq = new_individual.get_repeatable()
-        new_individual.feasible_seq = new_individual.get_feasible()
-        new_individual.machine_order = new_individual.get_machine_order()
+        new_individual.decode_seq()  # job_seq, feasible_seq, machine_order 갱신
         new_individual.makespan, new_individual.mio_score = new_individual.evaluate(new_individual.machine_order)
         new_individual.calculate_fitness(config.target_makespan)
         return new_individual
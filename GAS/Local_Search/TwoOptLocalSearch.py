@@ -1,5 +1,10 @@
+import sys
+import os
 import copy
 import random
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from GAS.IncrementalEvaluator import IncrementalEvaluator
 
 class TwoOptLocalSearch:
     def __init__(self, iterations=None, max_swaps=None):
@@ -12,14 +17,13 @@ class TwoOptLocalSearch:
         if self.max_swaps is None:
             self.max_swaps = 40
 
-        best_solution_seq = individual.seq[:]
-        best_makespan = individual.makespan
+        best_solution_seq = individual.seq.tolist()  # 변경할 시퀀스는 list로 복사
         no_improvement_count = 0
-        
-        # best_job_seq, best_feasible_seq, best_machine_order 초기화
-        best_job_seq = individual.job_seq  # 초기값 설정
-        best_feasible_seq = individual.feasible_seq  # 초기값 설정
-        best_machine_order = individual.machine_order  # 초기값 설정
+
+        # best_solution_seq를 base로 checkpoint를 유지하여 이웃은 바뀐 위치 이후만 decoding
+        evaluator = IncrementalEvaluator(best_solution_seq, individual.op_data)
+        # 이웃과 같은 (semi-active) decoder의 값으로 비교 (decoder='active'에서는 individual.makespan과 다름)
+        best_makespan, best_mio_score = evaluator.makespan, evaluator.mio_score
         
         size = len(individual.seq)
         num_jobs = individual.config.n_job  # Job 수 가져오기
@@ -28,6 +32,9 @@ class TwoOptLocalSearch:
         job_indices = [i // individual.config.n_machine for i in range(size)]
         
         for iteration in range(self.iterations):
+            # instance lower bound에 도달하면 더 개선할 수 없음
+            if evaluator.is_optimal(best_makespan):
+                break
             improved = False
             used_i = set()
             swaps = 0
@@ -50,26 +57,18 @@ class TwoOptLocalSearch:
                         used_j.add(j)
 
                         new_seq = self.swap(best_solution_seq, i, j)
-                        # 기존 개체의 seq만 변경하고, 새로운 개체를 생성하지 않음
-                        individual.seq = new_seq
-                        individual.job_seq = individual.get_repeatable()
-                        individual.feasible_seq = individual.get_feasible()
-                        individual.machine_order = individual.get_machine_order()
-                        new_makespan, _ = individual.evaluate(individual.machine_order)
+                        # 개체를 만들지 않고 i 이후만 incremental하게 평가 (best보다 나빠지면 중단)
+                        new_makespan, new_mio_score = evaluator.evaluate(new_seq, min(i, j), best_makespan + 1)
 
                         if new_makespan == best_makespan:
                             best_solution_seq[:] = new_seq
-                            best_makespan = new_makespan
-                            best_job_seq = individual.job_seq  # job_seq도 업데이트
-                            best_feasible_seq = individual.feasible_seq  # feasible_seq도 업데이트
-                            best_machine_order = individual.machine_order  # machine_order도 업데이트
+                            best_makespan, best_mio_score = new_makespan, new_mio_score
+                            evaluator.accept(new_seq, min(i, j))
 
                         if new_makespan < best_makespan:
                             best_solution_seq[:] = new_seq
-                            best_makespan = new_makespan
-                            best_job_seq = individual.job_seq  # job_seq도 업데이트
-                            best_feasible_seq = individual.feasible_seq  # feasible_seq도 업데이트
-                            best_machine_order = individual.machine_order  # machine_order도 업데이트
+                            best_makespan, best_mio_score = new_makespan, new_mio_score
+                            evaluator.accept(new_seq, min(i, j))
                             improved = True
                             print(f"    >> Improvement found! New Best Makespan: {best_makespan}")
                             break
@@ -103,26 +102,18 @@ class TwoOptLocalSearch:
                         used_j.add(j)
 
                         new_seq = self.two_opt_swap(best_solution_seq, i, j)
-                        # 기존 개체의 seq만 변경하고, 새로운 개체를 생성하지 않음
-                        individual.seq = new_seq
-                        individual.job_seq = individual.get_repeatable()
-                        individual.feasible_seq = individual.get_feasible()
-                        individual.machine_order = individual.get_machine_order()
-                        new_makespan, _ = individual.evaluate(individual.machine_order)
+                        # 개체를 만들지 않고 i 이후만 incremental하게 평가 (best보다 나빠지면 중단)
+                        new_makespan, new_mio_score = evaluator.evaluate(new_seq, min(i, j), best_makespan + 1)
 
                         if new_makespan == best_makespan:
                             best_solution_seq[:] = new_seq
-                            best_makespan = new_makespan
-                            best_job_seq = individual.job_seq  # job_seq도 업데이트
-                            best_feasible_seq = individual.feasible_seq  # feasible_seq도 업데이트
-                            best_machine_order = individual.machine_order  # machine_order도 업데이트
+                            best_makespan, best_mio_score = new_makespan, new_mio_score
+                            evaluator.accept(new_seq, min(i, j))
 
                         if new_makespan < best_makespan:
                             best_solution_seq[:] = new_seq
-                            best_makespan = new_makespan
-                            best_job_seq = individual.job_seq  # job_seq도 업데이트
-                            best_feasible_seq = individual.feasible_seq  # feasible_seq도 업데이트
-                            best_machine_order = individual.machine_order  # machine_order도 업데이트
+                            best_makespan, best_mio_score = new_makespan, new_mio_score
+                            evaluator.accept(new_seq, min(i, j))
                             improved = True
                             print(f"    >> Improvement found! New Best Makespan: {best_makespan}")
                             break  # 개선이 있으면 해당 Iteration 종료
@@ -137,12 +128,11 @@ class TwoOptLocalSearch:
                 print(f"Iteration {iteration+1}/{self.iterations} - Best Makespan: {best_makespan}")
                 break
         
-        # 최종적으로 best_solution_seq로 individual 업데이트 (machine_order 포함)
+        # 최종적으로 best_solution_seq로 individual 업데이트 (job_seq, machine_order 등은 읽을 때 다시 decoding)
         individual.seq = best_solution_seq
-        individual.makespan = best_makespan
-        individual.job_seq = best_job_seq  # job_seq 업데이트
-        individual.feasible_seq = best_feasible_seq  # feasible_seq 업데이트
-        individual.machine_order = best_machine_order  # machine_order 업데이트
+        if individual.config.decoder == 'semi-active':
+            individual.makespan, individual.mio_score = best_makespan, best_mio_score
+        individual.monitor = None
         
         return individual
 
@@ -12,7 +12,7 @@ class TwoOptLocalSearch_insert:
         if self.max_swaps is None:
             self.max_swaps = len(individual.seq) * (len(individual.seq) - 1) / 10
 
-        best_solution = copy.deepcopy(individual)
+        best_solution = individual.clone()
         best_makespan = best_solution.makespan
         no_improvement_count = 0  # 개선되지 않은 연속 횟수 추적 
 
@@ -29,7 +29,7 @@ class TwoOptLocalSearch_insert:
                 while j == i:
                     j = random.randint(0, len(individual.seq) - 1)
 
-                new_seq = self.insertion(best_solution.seq, i, j)
+                new_seq = self.insertion(best_solution.seq.tolist(), i, j)
                 # print(f"After insert between {i} and {j}: {new_seq}")
                 # new_solution = self.create_new_individual(individual, new_seq)
 
@@ -37,12 +37,12 @@ class TwoOptLocalSearch_insert:
                 new_makespan = new_solution.makespan
                 # <=로 바꿈
                 if new_makespan == best_makespan:
-                    best_solution = copy.deepcopy(new_solution)
+                    best_solution = new_solution.clone()
                     best_makespan = new_makespan
                     # print(f"Improvement found: Makespan {best_makespan}")
                 
                 if new_makespan < best_makespan:
-                    best_solution = copy.deepcopy(new_solution)
+                    best_solution = new_solution.clone()
                     best_makespan = new_makespan
                     improved = True
                     # print(f"Improvement found: Makespan {best_makespan}")                
@@ -75,10 +75,8 @@ class TwoOptLocalSearch_insert:
         return new_seq
 
     def create_new_individual(self, individual, new_seq, config):
-        new_individual = copy.deepcopy(individual)
+        new_individual = individual.clone()
         new_individual.seq = new_seq
-        new_individual.job_seq = new_individual.get_repeatable()
-        new_individual.feasible_seq = new_individual.get_feasible()
-        new_individual.machine_order = new_individual.get_machine_order()
+        new_individual.decode_seq()  # job_seq, feasible_seq, machine_order 갱신
         new_individual.makespan, new_individual.mio_score = new_individual.evaluate(new_individual.machine_order)
         return new_individual
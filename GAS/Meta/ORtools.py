@@ -13,8 +13,12 @@ Functions:
     create_new_individual(individual, new_seq, config): Creates a new individual with the optimized sequence.
 """
 
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
 from ortools.sat.python import cp_model
-import copy
+from Data.Dataset.ProblemInstance import ProblemInstance
 
 class ORToolsOptimizer:
     """
@@ -47,13 +51,14 @@ class ORToolsOptimizer:
         print("OR-Tools 시작")
         best_individual = self.create_new_individual(individual, individual.seq, config)
 
+        instance = ProblemInstance.of(individual.op_data)
         model = cp_model.CpModel()
-        horizon = sum(task[1] for job in config.op_data for task in job)
+        horizon = instance.horizon
 
         all_tasks = {}
         machine_to_intervals = {}
 
-        for job_id, job in enumerate(config.op_data):
+        for job_id, job in enumerate(instance):
             for task_id, task in enumerate(job):
                 machine, duration = task
 
@@ -71,12 +76,12 @@ class ORToolsOptimizer:
         for machine in machine_to_intervals:
             model.AddNoOverlap(machine_to_intervals[machine])
 
-        for job_id, job in enumerate(config.op_data):
+        for job_id, job in enumerate(instance):
             for task_id in range(len(job) - 1):
                 model.Add(all_tasks[job_id, task_id + 1][0] >= all_tasks[job_id, task_id][1])
 
         obj_var = model.NewIntVar(0, horizon, 'makespan')
-        model.AddMaxEquality(obj_var, [all_tasks[job_id, len(job) - 1][1] for job_id, job in enumerate(config.op_data)])
+        model.AddMaxEquality(obj_var, [all_tasks[job_id, len(job) - 1][1] for job_id, job in enumerate(instance)])
 
         model.Minimize(obj_var)
 
@@ -85,7 +90,7 @@ class ORToolsOptimizer:
 
         if status == cp_model.OPTIMAL or status == cp_model.FEASIBLE:
             new_seq = []
-            for job_id, job in enumerate(config.op_data):
+            for job_id, job in enumerate(instance):
                 job_schedule = sorted((solver.Value(all_tasks[job_id, task_id][0]), task_id) for task_id in range(len(job)))
                 new_seq.extend(job_id * config.n_machine + task_id for _, task_id in job_schedule)
 
@@ -107,11 +112,9 @@ class ORToolsOptimizer:
         Returns:
             Individual: The new individual with the optimized sequence.
         """
-        new_individual = copy.deepcopy(individual)
+        new_individual = individual.clone()
         new_individual.seq = new_seq
-        new_individual.job_seq = new_individual.get_repeatable()
-        new_individual.feasible_seq = new_individual.get_feasible()
-        new_individual.machine_order = new_individual.get_machine_order()
+        new_individual.decode_seq()  # job_seq, feasible_seq, machine_order 갱신
         new_individual.makespan, new_individual.mio_score = new_individual.evaluate(new_individual.machine_order)
         new_individual.calculate_fitness(config.target_makespan)
         return new_individual
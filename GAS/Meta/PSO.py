@@ -15,7 +15,6 @@ Functions:
     ensure_valid_sequence(seq, config): Ensures that the job sequence is valid.
 """
 
-import copy
 import random
 import numpy as np
 
@@ -62,7 +61,7 @@ class PSO:
         print("PSO 시작")
         particles = [self.create_new_individual(individual, individual.seq, config) for _ in range(self.num_particles)]
         velocities = [np.random.uniform(-1, 1, len(individual.seq)) for _ in range(self.num_particles)]
-        personal_best_positions = [copy.deepcopy(p.seq) for p in particles]
+        personal_best_positions = [p.seq for p in particles]
         personal_best_fitness = [p.fitness for p in particles]
         
         global_best_particle = min(particles, key=lambda p: p.fitness)
@@ -93,7 +92,7 @@ class PSO:
 
                 # Global best 업데이트
                 if new_individual.fitness < global_best_fitness:
-                    global_best_particle = copy.deepcopy(new_individual)
+                    global_best_particle = new_individual.clone()
                     global_best_position = new_individual.seq[:]
                     global_best_fitness = new_individual.fitness
 
@@ -121,11 +120,9 @@ class PSO:
         Returns:
             Individual: The new individual with the optimized sequence.
         """
-        new_individual = copy.deepcopy(individual)
+        new_individual = individual.clone()
         new_individual.seq = new_seq
-        new_individual.job_seq = new_individual.get_repeatable()
-        new_individual.feasible_seq = new_individual.get_feasible()
-        new_individual.machine_order = new_individual.get_machine_order()
+        new_individual.decode_seq()  # job_seq, feasible_seq, machine_order 갱신
         new_individual.makespan, new_individual.mio_score = new_individual.evaluate(new_individual.machine_order)
         new_individual.calculate_fitness(config.target_makespan)
         return new_individual
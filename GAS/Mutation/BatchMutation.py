@@ -0,0 +1,334 @@
+"""
+Batch Mutation
+
+This script defines batched versions of the mutation operators in GAS/Mutation. Each
+function mutates the rows of a (P x n_op) chromosome matrix in place and returns a
+boolean mask of the rows whose chromosome actually changed, so that only those rows
+lose their evaluation.
+
+The random numbers of a whole population are drawn together: which rows mutate, how
+many moves each of them makes and every position / length of those moves are arrays of
+shape (P,) or (P, max_moves). The moves themselves are applied in rounds; round t
+applies the t-th move of every row that makes more than t moves with one fancy-indexing
+operation, so a pop/insert or a slice reversal never runs per row in Python. Segment
+moves (shift, insertion, displacement) are rotations of the window between the old and
+the new position; only that window is touched.
+
+The move distributions are those of the corresponding classes (number of moves, segment
+lengths, positions), including the ratios given to their constructors. The only difference
+is in InsertionMutation: a segment inserted past the end of the list is appended in
+reverse order by its insert loop, while the batched version keeps the segment order.
+
+Functions:
+    swap_positions(seqs, rows, i, j): Swaps positions i and j of the given rows.
+    reverse_segments(seqs, rows, start, length): Reverses seqs[r, start:start + length].
+    move_segments(seqs, rows, start, length, target): Moves a segment so that it starts at target.
+    swap_mutation(seqs, pm, min_ratio, max_ratio, block, rng): SwapMutation / ReciprocalExchangeMutation.
+    inversion_mutation(seqs, pm, min_ratio, max_ratio, rng): InversionMutation.
+    shift_mutation(seqs, pm, min_shifts, max_shifts, min_range, max_range, rng): ShiftMutation.
+    insertion_mutation(seqs, pm, min_ratio, max_ratio, rng): InsertionMutation.
+    displacement_mutation(seqs, pm, min_ratio, max_ratio, rng): DisplacementMutation.
+    general_mutation(seqs, pm, rng): GeneralMutation (per-gene swaps).
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+
+def _rng(rng):
+    return np.random.mtrand._rand if rng is None else rng
+
+
+def _integers(rng, low, high, size):
+    # [low, high] 범위의 정수 (low, high는 배열도 가능), Generator와 RandomState 모두 지원
+    low, high = np.asarray(low), np.asarray(high)
+    return low + np.minimum((rng.random(size) * (high - low + 1)).astype(np.int64), high - low)
+
+
+def _flat(seqs):
+    if not seqs.flags.c_contiguous:
+        raise ValueError("seqs must be a C-contiguous matrix to be changed in place.")
+    return seqs.reshape(-1)
+
+
+def _window(seqs, rows, start, width):
+    # 각 row의 [start, start + width) 구간을 이어 붙인 (구간 시작의 flat index, 구간 폭, 구간 내 offset)
+    first = np.repeat(rows * seqs.shape[1] + start, width)
+    offset = np.arange(len(first)) - np.repeat(np.cumsum(width) - width, width)
+    return first, np.repeat(width, width), offset
+
+
+def swap_positions(seqs, rows, i, j):
+    """
+    Swaps positions i and j of the given rows in place.
+
+    Parameters:
+        seqs (np.ndarray): Chromosome matrix of shape (P, n_op).
+        rows (np.ndarray): Row indices (distinct).
+        i (np.ndarray): First position of each row.
+        j (np.ndarray): Second position of each row.
+    """
+    a, b = seqs[rows, i], seqs[rows, j]
+    seqs[rows, i], seqs[rows, j] = b, a
+
+
+def reverse_segments(seqs, rows, start, length):
+    """
+    Reverses seqs[r, start:start + length] of the given rows in place.
+
+    Parameters:
+        seqs (np.ndarray): Chromosome matrix of shape (P, n_op).
+        rows (np.ndarray): Row indices (distinct).
+        start (np.ndarray): Start of the segment of each row.
+        length (np.ndarray): Length of the segment of each row.
+    """
+    if len(rows) == 0:
+        return
+    flat = _flat(seqs)
+    first, width, offset = _window(seqs, rows, start, length)
+    flat[first + offset] = flat[first + width - 1 - offset]
+
+
+def move_segments(seqs, rows, start, length, target):
+    """
+    Moves seqs[r, start:start + length] of the given rows in place so that it starts at
+    target, shifting the genes in between (as del + insert on a list).
+
+    Parameters:
+        seqs (np.ndarray): Chromosome matrix of shape (P, n_op).
+        rows (np.ndarray): Row indices (distinct).
+        start (np.ndarray): Start of the segment of each row.
+        length (np.ndarray): Length of the segment of each row.
+        target (np.ndarray): Start of the segment after the move, in [0, n_op - length].
+    """
+    moved = target != start
+    rows, start, length, target = rows[moved], start[moved], length[moved], target[moved]
+    if len(rows) == 0:
+        return
+    # [min(start, target), max(start, target) + length) 구간을 회전
+    low = np.minimum(start, target)
+    width = np.abs(target - start) + length
+    shift = np.repeat(np.where(target > start, length, width - length), width)
+    flat = _flat(seqs)
+    first, width, offset = _window(seqs, rows, low, width)
+    source = offset + shift
+    source -= np.where(source >= width, width, 0)
+    flat[first + offset] = flat[first + source]
+
+
+def _changed(seqs, rows, before):
+    changed = np.zeros(len(seqs), dtype=bool)
+    changed[rows] = (seqs[rows] != before).any(axis=1)
+    return changed
+
+
+def _mutated_rows(rng, n_rows, pm):
+    return np.flatnonzero(rng.random(n_rows) < pm)
+
+
+def _ratio_bounds(size, min_ratio, max_ratio):
+    return max(1, int(size * min_ratio)), min(size, int(size * max_ratio))
+
+
+def _apply_rounds(seqs, rows, n_moves, move):
+    # t번째 round에서는 move 수가 t보다 많은 row들의 t번째 move를 한 번에 적용
+    for t in range(int(n_moves.max(initial=0))):
+        active = n_moves > t
+        move(rows[active], active, t)
+
+
+def swap_mutation(seqs, pm, min_ratio=0.02, max_ratio=0.2, block=1, rng=None):
+    """
+    Swaps pairs of positions (SwapMutation with block=n_machine, ReciprocalExchangeMutation
+    with block=1). Each row mutates with probability pm and makes
+    randint(max(1, int(n_op * min_ratio)), min(n_op, int(n_op * max_ratio))) swaps; the
+    second position of a swap lies outside the block of block positions of the first one.
+
+    Parameters:
+        seqs (np.ndarray): Chromosome matrix of shape (P, n_op), changed in place.
+        pm (float): Probability that a row mutates.
+        min_ratio (float): Minimum number of swaps relative to n_op (default is 0.02).
+        max_ratio (float): Maximum number of swaps relative to n_op (default is 0.2).
+        block (int): Size of the position blocks a swap must leave (default is 1).
+        rng: numpy Generator or RandomState (default is the global np.random state).
+
+    Returns:
+        np.ndarray: Boolean mask of the rows that changed.
+    """
+    rng = _rng(rng)
+    size = seqs.shape[1]
+    rows = _mutated_rows(rng, len(seqs), pm)
+    if len(rows) == 0 or size <= block:
+        return np.zeros(len(seqs), dtype=bool)
+    before = seqs[rows]
+    low, high = _ratio_bounds(size, min_ratio, max_ratio)
+    n_moves = _integers(rng, low, high, len(rows))
+    first = _integers(rng, 0, size - 1, (len(rows), high))
+    second = _integers(rng, 0, size - block - 1, (len(rows), high))
+    # first가 속한 block을 건너뛰도록 second를 이동
+    block_start = first // block * block
+    second += np.where(second >= block_start, block, 0)
+    second = np.minimum(second, size - 1)
+    _apply_rounds(seqs, rows, n_moves, lambda r, a, t: swap_positions(seqs, r, first[a, t], second[a, t]))
+    return _changed(seqs, rows, before)
+
+
+def inversion_mutation(seqs, pm, min_ratio=0.02, max_ratio=0.1, rng=None):
+    """
+    Reverses segments (InversionMutation). Each row mutates with probability pm and
+    reverses randint(max(1, int(n_op * min_ratio)), min(n_op, int(n_op * max_ratio)))
+    segments of length randint(max(2, int(n_op * min_ratio)), min(n_op - 1, int(n_op * max_ratio))).
+
+    Parameters:
+        seqs (np.ndarray): Chromosome matrix of shape (P, n_op), changed in place.
+        pm (float): Probability that a row mutates.
+        min_ratio (float): Minimum number and length of inversions relative to n_op (default is 0.02).
+        max_ratio (float): Maximum number and length of inversions relative to n_op (default is 0.1).
+        rng: numpy Generator or RandomState (default is the global np.random state).
+
+    Returns:
+        np.ndarray: Boolean mask of the rows that changed.
+    """
+    rng = _rng(rng)
+    size = seqs.shape[1]
+    rows = _mutated_rows(rng, len(seqs), pm)
+    if len(rows) == 0:
+        return np.zeros(len(seqs), dtype=bool)
+    before = seqs[rows]
+    low, high = _ratio_bounds(size, min_ratio, max_ratio)
+    n_moves = _integers(rng, low, high, len(rows))
+    length = _integers(rng, max(2, int(size * min_ratio)), min(size - 1, int(size * max_ratio)), (len(rows), high))
+    start = _integers(rng, 0, size - length, length.shape)
+    _apply_rounds(seqs, rows, n_moves, lambda r, a, t: reverse_segments(seqs, r, start[a, t], length[a, t]))
+    return _changed(seqs, rows, before)
+
+
+def shift_mutation(seqs, pm, min_shifts=1, max_shifts=5, min_range=0.02, max_range=0.2, rng=None):
+    """
+    Moves single genes (ShiftMutation). Each row mutates with probability pm and makes
+    randint(min_shifts, min(max_shifts, n_op // 2)) shifts; a shift moves the gene at a
+    random position by randint(-s, s) positions (cyclically), s = int(n_op * uniform(min_range, max_range)).
+
+    Parameters:
+        seqs (np.ndarray): Chromosome matrix of shape (P, n_op), changed in place.
+        pm (float): Probability that a row mutates.
+        min_shifts (int): Minimum number of shifts (default is 1).
+        max_shifts (int): Maximum number of shifts (default is 5).
+        min_range (float): Minimum shift range relative to n_op (default is 0.02).
+        max_range (float): Maximum shift range relative to n_op (default is 0.2).
+        rng: numpy Generator or RandomState (default is the global np.random state).
+
+    Returns:
+        np.ndarray: Boolean mask of the rows that changed.
+    """
+    rng = _rng(rng)
+    size = seqs.shape[1]
+    rows = _mutated_rows(rng, len(seqs), pm)
+    high = min(max_shifts, size // 2)
+    if len(rows) == 0 or high < min_shifts:
+        return np.zeros(len(seqs), dtype=bool)
+    before = seqs[rows]
+    n_moves = _integers(rng, min_shifts, high, len(rows))
+    position = _integers(rng, 0, size - 1, (len(rows), high))
+    reach = (size * (min_range + rng.random((len(rows), high)) * (max_range - min_range))).astype(np.int64)
+    target = (position + _integers(rng, -reach, reach, reach.shape)) % size
+    ones = np.ones(len(rows), dtype=np.int64)
+    _apply_rounds(seqs, rows, n_moves, lambda r, a, t: move_segments(seqs, r, position[a, t], ones[a], target[a, t]))
+    return _changed(seqs, rows, before)
+
+
+def insertion_mutation(seqs, pm, min_ratio=0.02, max_ratio=0.1, rng=None):
+    """
+    Moves segments (InsertionMutation). Each row mutates with probability pm and makes
+    randint(2, 10) insertions of a segment of length
+    randint(max(1, int(n_op * min_ratio)), min(n_op // 2, int(n_op * max_ratio))) to another
+    position that does not overlap its old place (clamped to the end of the sequence).
+
+    Parameters:
+        seqs (np.ndarray): Chromosome matrix of shape (P, n_op), changed in place.
+        pm (float): Probability that a row mutates.
+        min_ratio (float): Minimum segment length relative to n_op (default is 0.02).
+        max_ratio (float): Maximum segment length relative to n_op (default is 0.1).
+        rng: numpy Generator or RandomState (default is the global np.random state).
+
+    Returns:
+        np.ndarray: Boolean mask of the rows that changed.
+    """
+    rng = _rng(rng)
+    size = seqs.shape[1]
+    rows = _mutated_rows(rng, len(seqs), pm)
+    min_length, max_length = max(1, int(size * min_ratio)), min(size // 2, int(size * max_ratio))
+    if len(rows) == 0 or max_length < min_length:
+        return np.zeros(len(seqs), dtype=bool)
+    before = seqs[rows]
+    n_moves = _integers(rng, 2, 10, len(rows))
+    length = _integers(rng, min_length, max_length, (len(rows), 10))
+    start = _integers(rng, 0, size - length, length.shape)
+    target = _integers(rng, 0, size - length, length.shape)
+    # 원래 구간 뒤로 밀린 위치는 segment를 뺀 list의 끝을 넘지 않도록 제한 (list.insert와 동일)
+    target = np.minimum(np.where(target >= start, target + length, target), size - length)
+    _apply_rounds(seqs, rows, n_moves, lambda r, a, t: move_segments(seqs, r, start[a, t], length[a, t], target[a, t]))
+    return _changed(seqs, rows, before)
+
+
+def displacement_mutation(seqs, pm, min_ratio=0.02, max_ratio=0.3, rng=None):
+    """
+    Moves segments (DisplacementMutation). Each row mutates with probability pm and makes
+    randint(d_min, d_max) displacements, d_min = max(1, int(n_op * min_ratio)) and
+    d_max = min(n_op, int(n_op * max_ratio)), of a segment of length randint(d_min, d_max)
+    to a uniformly chosen position.
+
+    Parameters:
+        seqs (np.ndarray): Chromosome matrix of shape (P, n_op), changed in place.
+        pm (float): Probability that a row mutates.
+        min_ratio (float): Minimum number and length of displacements relative to n_op (default is 0.02).
+        max_ratio (float): Maximum number and length of displacements relative to n_op (default is 0.3).
+        rng: numpy Generator or RandomState (default is the global np.random state).
+
+    Returns:
+        np.ndarray: Boolean mask of the rows that changed.
+    """
+    rng = _rng(rng)
+    size = seqs.shape[1]
+    rows = _mutated_rows(rng, len(seqs), pm)
+    low, high = _ratio_bounds(size, min_ratio, max_ratio)
+    if len(rows) == 0 or high < low:
+        return np.zeros(len(seqs), dtype=bool)
+    before = seqs[rows]
+    n_moves = _integers(rng, low, high, len(rows))
+    length = _integers(rng, low, high, (len(rows), high))
+    start = _integers(rng, 0, size - length, length.shape)
+    target = _integers(rng, 0, size - length, length.shape)
+    _apply_rounds(seqs, rows, n_moves, lambda r, a, t: move_segments(seqs, r, start[a, t], length[a, t], target[a, t]))
+    return _changed(seqs, rows, before)
+
+
+def general_mutation(seqs, pm, rng=None):
+    """
+    Swaps every position with probability pm with a uniformly chosen position, from left
+    to right (GeneralMutation).
+
+    Parameters:
+        seqs (np.ndarray): Chromosome matrix of shape (P, n_op), changed in place.
+        pm (float): Probability that a position is swapped.
+        rng: numpy Generator or RandomState (default is the global np.random state).
+
+    Returns:
+        np.ndarray: Boolean mask of the rows that changed.
+    """
+    rng = _rng(rng)
+    n_rows, size = seqs.shape
+    swapped = rng.random((n_rows, size)) < pm
+    rows = np.flatnonzero(swapped.any(axis=1))
+    if len(rows) == 0:
+        return np.zeros(n_rows, dtype=bool)
+    before = seqs[rows]
+    partner = _integers(rng, 0, size - 1, (n_rows, size))
+    # position 순서대로 swap해야 하므로 position마다 한 번, 모든 row를 함께 처리
+    for i in np.flatnonzero(swapped.any(axis=0)):
+        active = np.flatnonzero(swapped[:, i])
+        swap_positions(seqs, active, np.full(len(active), i), partner[active, i])
+    return _changed(seqs, rows, before)
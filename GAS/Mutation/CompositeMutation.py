@@ -2,6 +2,7 @@ import sys
 import os
 import random
 import copy
+import numpy as np
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
@@ -19,4 +20,18 @@ class CompositeMutation:
         if random.random() < self.pm:
             mutation = random.choice(self.mutations)  # 무작위로 mutation 방식 선택
             mutation.mutate(individual)  # 선택된 mutation 실행
-        return individual
\ No newline at end of file
+        return individual
+
+    def mutate_batch(self, seqs, config, rng=None):
+        # row마다 pm 확률로 mutation 방식을 무작위로 고르고, 방식별로 묶어서 한 번에 실행
+        rng = np.random.mtrand._rand if rng is None else rng
+        changed = np.zeros(len(seqs), dtype=bool)
+        chosen = np.where(rng.random(len(seqs)) < self.pm,
+                          np.minimum((rng.random(len(seqs)) * len(self.mutations)).astype(int), len(self.mutations) - 1), -1)
+        for k, mutation in enumerate(self.mutations):
+            rows = np.flatnonzero(chosen == k)
+            if len(rows):
+                subset = seqs[rows]
+                changed[rows] = mutation.mutate_batch(subset, config, rng)
+                seqs[rows] = subset
+        return changed
@@ -1,11 +1,11 @@
 import sys
 import os
 import random
-import copy
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from GAS.Mutation.base import Mutation
 from GAS.Individual import Individual
+from GAS.Mutation.BatchMutation import displacement_mutation
 
 class DisplacementMutation:
     def __init__(self, pm, min_displacement_ratio=0.02, max_displacement_ratio=0.3):
@@ -15,8 +15,8 @@ class DisplacementMutation:
 
     def mutate(self, individual):
         if random.random() < self.pm:
-            original_seq = copy.deepcopy(individual.seq)  # 원래 시퀀스를 깊은 복사하여 비교에 사용
-            seq = individual.seq
+            original_seq = individual.seq  # 원래 시퀀스 (읽기 전용이므로 복사 없이 비교에 사용)
+            seq = individual.seq.tolist()  # 변경할 시퀀스는 list로 복사
             size = len(seq)
 
             # 염색체 길이에 대한 상대적 비율로 변위 횟수 결정
@@ -41,5 +41,10 @@ class DisplacementMutation:
 
                 # 새로운 위치에 삽입
                 seq[insert_pos:insert_pos] = sub_seq
+            individual.seq = seq
 
         return individual
+
+    def mutate_batch(self, seqs, config, rng=None):
+        # 모든 row에 대해 구간 변위를 한 번에 수행하고, 바뀐 row mask 반환
+        return displacement_mutation(seqs, self.pm, self.min_displacement_ratio, self.max_displacement_ratio, rng)
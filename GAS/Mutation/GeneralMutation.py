@@ -19,6 +19,7 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from GAS.Mutation.base import Mutation
 from GAS.Individual import Individual
+from GAS.Mutation.BatchMutation import general_mutation
 
 class GeneralMutation(Mutation):
     """
@@ -47,9 +48,24 @@ class GeneralMutation(Mutation):
         Returns:
             Individual: The mutated individual.
         """
-        seq = individual.seq[:]
+        seq = individual.seq.tolist()
         for i in range(len(seq)):
             if random.random() < self.pm:
                 j = random.randint(0, len(seq) - 1)
                 seq[i], seq[j] = seq[j], seq[i]
         return Individual(config=individual.config, seq=seq, op_data=individual.op_data)
+
+    def mutate_batch(self, seqs, config, rng=None):
+        """
+        Performs the general mutation on every row of a chromosome matrix in place
+        (see GAS/Mutation/BatchMutation.py).
+
+        Parameters:
+            seqs (np.ndarray): Chromosome matrix of shape (P, n_op).
+            config: Configuration object with simulation settings.
+            rng: numpy Generator or RandomState (default is the global np.random state).
+
+        Returns:
+            np.ndarray: Boolean mask of the rows that changed.
+        """
+        return general_mutation(seqs, self.pm, rng)
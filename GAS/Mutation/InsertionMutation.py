@@ -6,6 +6,7 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from GAS.Mutation.base import Mutation
 from GAS.Individual import Individual
+from GAS.Mutation.BatchMutation import insertion_mutation
 
 class InsertionMutation:
     def __init__(self, pm, min_insert_ratio=0.02, max_insert_ratio=0.1):
@@ -16,8 +17,8 @@ class InsertionMutation:
     def mutate(self, individual):
         if random.random() < self.pm:
             print(f'InsertionMutation')
-            original_seq = copy.deepcopy(individual.seq)  # 원래 시퀀스를 깊은 복사하여 비교에 사용
-            seq = copy.deepcopy(individual.seq)  # 깊은 복사로 시퀀스의 일관성 유지
+            original_seq = individual.seq  # 원래 시퀀스 (읽기 전용이므로 복사 없이 비교에 사용)
+            seq = individual.seq.tolist()  # 변경할 시퀀스는 list로 복사
             size = len(seq)
 
             # 삽입 횟수를 비율로 결정
@@ -56,3 +57,7 @@ class InsertionMutation:
             # print(f"원래 시퀀스: {original_seq}")
             # print(f"수정된 시퀀스: {seq}")
         return individual
+
+    def mutate_batch(self, seqs, config, rng=None):
+        # 모든 row에 대해 구간 삽입을 한 번에 수행하고, 바뀐 row mask 반환
+        return insertion_mutation(seqs, self.pm, self.min_insert_ratio, self.max_insert_ratio, rng)
@@ -1,11 +1,11 @@
 import sys
 import os
 import random
-import copy
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from GAS.Mutation.base import Mutation
 from GAS.Individual import Individual
+from GAS.Mutation.BatchMutation import inversion_mutation
 
 class InversionMutation:
     def __init__(self, pm, min_inverse_ratio=0.02, max_inverse_ratio=0.1):
@@ -15,7 +15,7 @@ class InversionMutation:
 
     def mutate(self, individual):
         if random.random() < self.pm:
-            original_seq = copy.deepcopy(individual.seq)  # 깊은 복사로 원래 시퀀스를 보존
+            original_seq = individual.seq.tolist()  # 변경할 시퀀스는 list로 복사 (원래 시퀀스는 보존)
             size = len(original_seq)
 
             # 역위 횟수를 비율로 결정
@@ -33,10 +33,14 @@ class InversionMutation:
                 end = start + inverse_length
                 original_seq[start:end] = reversed(original_seq[start:end])
 
-            # 깊은 복사로 새로운 시퀀스로 개체 생성
-            new_individual = copy.deepcopy(individual)
+            # 복사한 개체에 새로운 시퀀스를 할당
+            new_individual = individual.clone()
             new_individual.seq = original_seq
 
             return new_individual
 
         return individual
+
+    def mutate_batch(self, seqs, config, rng=None):
+        # 모든 row에 대해 구간 역위를 한 번에 수행하고, 바뀐 row mask 반환
+        return inversion_mutation(seqs, self.pm, self.min_inverse_ratio, self.max_inverse_ratio, rng)
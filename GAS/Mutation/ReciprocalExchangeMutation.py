@@ -1,11 +1,11 @@
 import sys
 import os
 import random
-import copy
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from GAS.Mutation.base import Mutation
 from GAS.Individual import Individual
+from GAS.Mutation.BatchMutation import swap_mutation as batch_swap
 
 class ReciprocalExchangeMutation:
     def __init__(self, pm, min_reciprocal_ratio=0.02, max_reciprocal_ratio=0.1):
@@ -15,8 +15,8 @@ class ReciprocalExchangeMutation:
 
     def mutate(self, individual):
         if random.random() < self.pm:
-            original_seq = copy.deepcopy(individual.seq)  # 원래 시퀀스를 깊은 복사하여 비교에 사용
-            seq = individual.seq
+            original_seq = individual.seq  # 원래 시퀀스 (읽기 전용이므로 복사 없이 비교에 사용)
+            seq = individual.seq.tolist()  # 변경할 시퀀스는 list로 복사
             size = len(seq)
             
             # 교환 횟수를 비율로 결정
@@ -28,6 +28,7 @@ class ReciprocalExchangeMutation:
             for _ in range(num_reciprocal):
                 pos1, pos2 = random.sample(range(size), 2)
                 seq[pos1], seq[pos2] = seq[pos2], seq[pos1]
+            individual.seq = seq
             
             # 디버깅을 위한 원래와 수정된 시퀀스 출력
             # print(f"원래 시퀀스: {original_seq}")
@@ -35,3 +36,6 @@ class ReciprocalExchangeMutation:
 
         return individual
 
+    def mutate_batch(self, seqs, config, rng=None):
+        # 모든 row에 대해 임의의 두 위치 교환을 한 번에 수행하고, 바뀐 row mask 반환
+        return batch_swap(seqs, self.pm, self.min_reciprocal_ratio, self.max_reciprocal_ratio, 1, rng)
@@ -81,7 +81,7 @@ class SelectiveMutation(Mutation):
         Returns:
             Individual: The mutated individual.
         """
-        seq = individual.seq[:]
+        seq = individual.seq.tolist()
         if lower_bits:
             # 염색체의 하위 부분에 돌연변이를 적용합니다.
             start, end = sorted(random.sample(range(len(seq)//2), 2))
@@ -1,11 +1,11 @@
 import sys
 import os
 import random
-import copy
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from GAS.Mutation.base import Mutation
 from GAS.Individual import Individual
+from GAS.Mutation.BatchMutation import shift_mutation
 #  기존  min_shift_range=0.02, max_shift_range=0.3
 # min_shifts=1, max_shifts=10, min_shift_range=0.02, max_shift_range=0.3
 # 2개 10개
@@ -20,8 +20,8 @@ class ShiftMutation:
     def mutate(self, individual):        
         if random.random() < self.pm:
             # print(f'ShiftMutation')
-            original_seq = copy.deepcopy(individual.seq)  # 원래 시퀀스를 깊은 복사하여 비교에 사용
-            seq = individual.seq
+            original_seq = individual.seq  # 원래 시퀀스 (읽기 전용이므로 복사 없이 비교에 사용)
+            seq = individual.seq.tolist()  # 변경할 시퀀스는 list로 복사
             size = len(seq)
             
             # 수행할 이동 횟수 결정
@@ -38,8 +38,13 @@ class ShiftMutation:
                 gene = seq.pop(pos)
                 new_pos = (pos + shift) % size
                 seq.insert(new_pos, gene)
+            individual.seq = seq
             
             # 디버깅을 위한 원래와 수정된 시퀀스 출력
             # print(f"원래 시퀀스: {original_seq}")
             # print(f"수정된 시퀀스: {seq}")
         return individual
+
+    def mutate_batch(self, seqs, config, rng=None):
+        # 모든 row에 대해 gene 이동을 한 번에 수행하고, 바뀐 row mask 반환
+        return shift_mutation(seqs, self.pm, self.min_shifts, self.max_shifts, self.min_shift_range, self.max_shift_range, rng)
@@ -6,6 +6,7 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from GAS.Mutation.base import Mutation
 from GAS.Individual import Individual
+from GAS.Mutation.BatchMutation import swap_mutation as batch_swap
 
 class SwapMutation:
     def __init__(self, pm, min_swap_ratio=0.02, max_swap_ratio=0.2):
@@ -16,7 +17,7 @@ class SwapMutation:
     def mutate(self, individual):
         if random.random() < self.pm:
             # original_seq = copy.deepcopy(individual.seq)  # 원래 시퀀스를 깊은 복사하여 비교에 사용
-            seq = individual.seq
+            seq = individual.seq.tolist()  # 변경할 시퀀스는 list로 복사
             size = len(seq)
             num_jobs = individual.config.n_job  # Job 수 가져오기
             
@@ -38,8 +39,13 @@ class SwapMutation:
                 if different_job_indices:
                     j = random.choice(different_job_indices)
                     seq[i], seq[j] = seq[j], seq[i]
+            individual.seq = seq
             
             # 디버깅을 위한 원래와 수정된 시퀀스 출력
             # print(f"Original sequence: {original_seq}")
             # print(f"Modified sequence: {seq}")
         return individual
+
+    def mutate_batch(self, seqs, config, rng=None):
+        # 모든 row에 대해 다른 Job 구간의 위치와 swap을 한 번에 수행하고, 바뀐 row mask 반환
+        return batch_swap(seqs, self.pm, self.min_swap_ratio, self.max_swap_ratio, config.n_machine, rng)
@@ -16,11 +16,18 @@ Functions:
     print_console: A flag for enabling/disabling console output.
 """
 
-import copy
 import numpy as np
 import random
 from GAS.Individual import Individual
+from GAS.BatchDecoder import evaluate_population_cached
+from GAS.FitnessCache import get_fitness_cache
+from GAS.GenotypeIndex import GenotypeIndex, genotype_hashes, individual_machine_orders
+from GAS.Ranking import Ranking
+from GAS.Mutation.BatchMutation import swap_mutation
+from GAS.Selection import VectorizedSelection
+from MachineInputOrder.utils import mio_metrics
 from Data.Dataset.Dataset import Dataset
+from Data.Dataset.ProblemInstance import ProblemInstance
 
 print_console = False
 
@@ -215,7 +222,7 @@ class GifflerThompson:
         Returns:
             Individual: The optimized individual.
         """
-        best_individual = copy.deepcopy(individual)
+        best_individual = individual.clone()
         best_individual.calculate_fitness(config.target_makespan)
         best_rule = "basic"
 
@@ -272,29 +279,22 @@ class GifflerThompson:
         Returns:
             list: Sorted sequence of operations.
         """
-        def safe_get_op_data(x, idx):
-            try:
-                return op_data[x // config.n_machine][x % config.n_machine][idx]
-            except IndexError:
-                return float('inf') if idx == 1 else 0
-
-        if priority_rule == 'SPT':
-            sorted_seq = sorted(seq, key=lambda x: safe_get_op_data(x, 1))
-        elif priority_rule == 'LPT':
-            sorted_seq = sorted(seq, key=lambda x: -safe_get_op_data(x, 1))
-        elif priority_rule == 'MWR':
-            sorted_seq = sorted(seq, key=lambda x: -sum(safe_get_op_data(x, 1) for i in range(config.n_machine)))
-        elif priority_rule == 'LWR':
-            sorted_seq = sorted(seq, key=lambda x: sum(safe_get_op_data(x, 1) for i in range(config.n_machine)))
-        elif priority_rule == 'MOR':
-            sorted_seq = sorted(seq, key=lambda x: -len([op for op in op_data[x // config.n_machine] if op[1] > 0]))
-        elif priority_rule == 'LOR':
-            sorted_seq = sorted(seq, key=lambda x: len([op for op in op_data[x // config.n_machine] if op[1] > 0]))
-        elif priority_rule == 'EDD':
-            sorted_seq = sorted(seq, key=lambda x: safe_get_op_data(x, 2))
-        else:
-            sorted_seq = seq  # 기본값으로 정렬하지 않음
-        return sorted_seq
+        instance = ProblemInstance.of(op_data)
+        keys = {
+            'SPT': instance.duration,
+            'LPT': -instance.duration,
+            'MWR': -instance.job_remaining_work,
+            'LWR': instance.job_remaining_work,
+            'MOR': -instance.job_remaining_ops,
+            'LOR': instance.job_remaining_ops,
+            'EDD': np.zeros(instance.n_op, dtype=np.int32),  # dataset에 due date가 없으므로 순서 유지
+        }.get(priority_rule)
+
+        if keys is None:
+            return seq  # 기본값으로 정렬하지 않음
+        # sorted()와 같은 stable 정렬
+        order = np.argsort(keys[np.asarray(seq)], kind='stable')
+        return [seq[i] for i in order]
 
     def create_new_individual(self, individual, new_seq, config):
         """
@@ -308,17 +308,20 @@ class GifflerThompson:
         Returns:
             Individual: The new individual.
         """
-        new_individual = copy.deepcopy(individual)
+        new_individual = individual.clone()
         new_individual.seq = new_seq
-        new_individual.job_seq = new_individual.get_repeatable()
-        new_individual.feasible_seq = new_individual.get_feasible()
-        new_individual.machine_order = new_individual.get_machine_order()
+        new_individual.decode_seq()  # job_seq, feasible_seq, machine_order 갱신
         new_individual.makespan, new_individual.mio_score = new_individual.evaluate(new_individual.machine_order)
         return new_individual
 
 class Population:
     """
     Manages a population of individuals for the genetic algorithm.
+
+    The population keeps a ranking index (GAS/Ranking.py) of its rows by makespan; the
+    rows themselves are never reordered. It is built by evaluate and updated by replace;
+    assigning a new list to individuals drops it. Code that puts an individual at a row
+    must use replace, since evaluate returns at once when nothing changed.
     
     Attributes:
         config: Configuration object for the job shop.
@@ -327,11 +330,22 @@ class Population:
     """
     def __init__(self, config, op_data, random_seed=None):
         self.config = config
-        self.op_data = op_data
+        self.op_data = ProblemInstance.of(op_data)
         if random_seed is not None:
             random.seed(random_seed)
             np.random.seed(random_seed)        
-        self.individuals = [Individual(config, seq=random.sample(range(config.n_op), config.n_op), op_data=op_data) for _ in range(config.population_size)]
+        self.individuals = [Individual(config, seq=random.sample(range(config.n_op), config.n_op), op_data=self.op_data) for _ in range(config.population_size)]
+
+    @property
+    def individuals(self):
+        return self._individuals
+
+    @individuals.setter
+    def individuals(self, individuals):
+        self._individuals = individuals
+        self._ranking = None
+        # 마지막 evaluate의 target_makespan (그 뒤 개체가 바뀌면 None)
+        self._evaluated_target = None
 
     ##############################################  
     #               MIO를 위한거                  #
@@ -355,8 +369,8 @@ class Population:
         if random_seed is not None:
             random.seed(random_seed)
             np.random.seed(random_seed)
-        individuals = [Individual(config, seq=jssp.get_seq(), op_data=dataset.op_data) for _ in range(config.population_size)]
-        population = cls(config, dataset.op_data)  # Create the Population instance with required arguments
+        individuals = [Individual(config, seq=jssp.get_seq(), op_data=op_data) for _ in range(config.population_size)]
+        population = cls(config, op_data)  # Create the Population instance with required arguments
         population.individuals = individuals
         return population
 
@@ -385,10 +399,10 @@ class Population:
             np.random.seed(random_seed)
         individuals = []
         for _ in range(config.population_size):
-            random_individual = Individual(config, seq=random.sample(range(config.n_op), config.n_op), op_data=dataset.op_data)
+            random_individual = Individual(config, seq=random.sample(range(config.n_op), config.n_op), op_data=op_data)
             optimized_individual = giffler_thompson.optimize(random_individual, config)
             individuals.append(optimized_individual)
-        population = cls(config, dataset.op_data)
+        population = cls(config, op_data)
         population.individuals = individuals
         return population
 
@@ -399,10 +413,46 @@ class Population:
         Parameters:
             target_makespan (int): Target makespan for fitness calculation.
         """
+        # seq가 바뀐 개체만, 같은 genotype(machine order → 같은 schedule)은 한 번만 평가 (나머지는 결과를 복사)
+        pending_rows = [row for row, individual in enumerate(self.individuals) if not individual.is_evaluated()]
+        ranked = self._ranking is not None and len(self._ranking) == len(self.individuals)
+        if not pending_rows and ranked and self._evaluated_target == target_makespan:
+            # 바뀐 개체가 없으면 fitness, ranking, scaling 모두 그대로 유효
+            return
+        pending = [self.individuals[row] for row in pending_rows]
+        groups, group_rows = [], []
+        if pending:
+            # machine order는 한 번만 계산하여 genotype index와 cache key에 함께 사용
+            machine_orders = individual_machine_orders(pending, self.config, self.op_data)
+            index = GenotypeIndex(genotype_hashes(machine_orders), machine_orders)
+            group_rows = index.groups()
+            groups = [[pending[i] for i in rows.tolist()] for rows in group_rows]
+
+        if groups and self.config.evaluator == 'array' and self.config.decoder == 'semi-active':
+            # 평가할 개체 전체를 (N x n_op) 행렬로 한 번에 decode (cache에 없는 행만)
+            seq_matrix = np.array([group[0].seq for group in groups])
+            makespans, mio_scores = evaluate_population_cached(seq_matrix, self.op_data, get_fitness_cache(self.config, self.op_data),
+                                                               machine_orders[[rows[0] for rows in group_rows]])
+            Individual.count_evaluations(len(groups))
+            for group, makespan, mio_score in zip(groups, makespans, mio_scores):
+                for individual in group:
+                    individual.makespan, individual.mio_score = makespan, mio_score
+        else:
+            for group in groups:
+                representative = group[0]
+                representative.makespan, representative.mio_score = representative.evaluate(representative.machine_order)
+                for individual in group[1:]:
+                    individual.makespan, individual.mio_score = representative.makespan, representative.mio_score
+
         for individual in self.individuals:
-            individual.makespan, individual.mio_score = individual.evaluate(individual.machine_order)
             individual.calculate_fitness(target_makespan)
-        self.individuals.sort(key=lambda x: x.fitness, reverse=True)
+        # 개체의 행 순서는 그대로 두고 ranking index만 갱신 (평가한 행이 적으면 그 행만 이동)
+        if ranked and len(pending_rows) * 8 <= len(self.individuals):
+            for row in pending_rows:
+                self._ranking.update(row, self.individuals[row].makespan)
+        else:
+            self._ranking = Ranking([individual.makespan for individual in self.individuals])
+        self._evaluated_target = target_makespan
         # 스케일링 방법 선택 (Rank Scaling, Sigma Scaling, Boltzmann Scaling)
         scaling_method = 'min-max'  # 'min-max', 'sigma', 'boltzmann' 등을 사용할 수 있습니다.
 
@@ -415,42 +465,157 @@ class Population:
         elif scaling_method == 'boltzmann':
             self.boltzmann_scaling()
 
-    def min_max_scaling(self):
+    def ranking(self):
         """
-        Applies min-max scaling to the fitness values.
+        Returns the ranking index of the rows by makespan (built now if evaluate did not).
+
+        Returns:
+            Ranking: The index (see GAS/Ranking.py).
+        """
+        if self._ranking is None or len(self._ranking) != len(self.individuals):
+            self._ranking = Ranking([individual.makespan for individual in self.individuals])
+        return self._ranking
+
+    def best(self):
+        """
+        Returns the individual with the smallest makespan (the first one on ties).
+
+        Returns:
+            Individual: The best individual.
+        """
+        return self.individuals[self.ranking().best(1)[0]]
+
+    def top(self, k):
+        """
+        Returns the k individuals with the smallest makespans, best first.
+
+        Parameters:
+            k (int): Number of individuals.
+
+        Returns:
+            list: The individuals (not copies).
+        """
+        return [self.individuals[row] for row in self.ranking().best(k)]
+
+    def replace(self, row, individual):
+        """
+        Puts an individual at a row and updates the ranking index in O(log N).
+
+        Parameters:
+            row (int): Row index.
+            individual (Individual): The new individual.
+        """
+        self.individuals[row] = individual
+        self._evaluated_target = None
+        if self._ranking is not None:
+            if individual.is_evaluated():
+                self._ranking.update(row, individual.makespan)
+            else:
+                # 평가되지 않은 개체는 다음 evaluate에서 한꺼번에 평가하고 ranking도 그때 생성
+                self._ranking = None
+
+    def reseed(self, n_keep):
+        """
+        Keeps the n_keep best individuals and replaces the rest with random chromosomes
+        (partial restart of a stagnating population).
+
+        Parameters:
+            n_keep (int): Number of individuals kept.
+
+        Returns:
+            int: Number of replaced individuals.
+        """
+        kept = self.top(n_keep)
+        n_op = self.config.n_op
+        reseeded = [Individual(config=self.config, seq=random.sample(range(n_op), n_op), op_data=self.op_data)
+                    for _ in range(len(self.individuals) - len(kept))]
+        self.individuals = kept + reseeded
+        return len(reseeded)
+
+    def mio_metrics(self):
+        """
+        Calculates the MIO metrics of all individuals at once.
+
+        Returns:
+            np.ndarray: Scores of shape (population_size, 6), one row per individual in the
+                        order of self.individuals (columns as in MachineInputOrder.utils.MIO_METRICS).
+        """
+        return mio_metrics(np.array([individual.MIO for individual in self.individuals]))
+
+    def genotype_index(self):
+        """
+        Builds the genotype index (GAS/GenotypeIndex.py) of the current individuals.
+
+        Returns:
+            GenotypeIndex: The index, one row per individual.
+        """
+        return GenotypeIndex.from_individuals(self.individuals, self.config, self.op_data)
+
+    def uniqueness_ratio(self):
+        """
+        Returns the number of distinct genotypes divided by the population size.
+
+        Returns:
+            float: Ratio in (0, 1].
         """
-        fitness_values = [ind.fitness for ind in self.individuals]
-        min_fitness = min(fitness_values)
-        max_fitness = max(fitness_values)
+        return self.genotype_index().uniqueness_ratio()
+
+    def replace_duplicates(self, policy='random'):
+        """
+        Replaces every individual whose genotype already occurs earlier in the population.
+
+        Parameters:
+            policy (str): 'random' (a new random chromosome), 'mutate' (the duplicate after
+                          2-10% random swaps) or 'keep' (nothing is replaced).
+
+        Returns:
+            int: Number of replaced individuals.
 
-        if max_fitness - min_fitness > 0:
-            for individual in self.individuals:
-                individual.scaled_fitness = (individual.fitness - min_fitness) / (max_fitness - min_fitness)
+        Raises:
+            ValueError: If policy is unknown.
+        """
+        if policy not in ('keep', 'random', 'mutate'):
+            raise ValueError(f"Unknown duplicate policy: {policy}")
+        duplicates = self.genotype_index().duplicates().tolist() if policy != 'keep' else []
+        if not duplicates:
+            return 0
+        n_op = self.config.n_op
+        if policy == 'random':
+            seqs = [random.sample(range(n_op), n_op) for _ in duplicates]
         else:
-            for individual in self.individuals:
-                individual.scaled_fitness = 1.0  # In case all fitness values are the same
+            matrix = np.array([self.individuals[i].seq for i in duplicates])
+            swap_mutation(matrix, 1.0, 0.02, 0.1)
+            seqs = matrix.tolist()
+        for i, seq in zip(duplicates, seqs):
+            self.individuals[i] = Individual(config=self.config, seq=seq, op_data=self.op_data)
+        self._ranking = None
+        return len(duplicates)
+
+    def _fitness_vector(self):
+        return np.array([ind.fitness for ind in self.individuals], dtype=float)
+
+    def _set_scaled_fitness(self, scaled):
+        for individual, value in zip(self.individuals, scaled.tolist()):
+            individual.scaled_fitness = value
+
+    def min_max_scaling(self):
+        """
+        Applies min-max scaling to the fitness values.
+        """
+        self._set_scaled_fitness(VectorizedSelection.min_max_scaling(self._fitness_vector()))
 
     def rank_scaling(self):
         """
         Applies rank scaling to the fitness values.
         """
-        sorted_individuals = sorted(self.individuals, key=lambda ind: ind.fitness, reverse=True)
-        for rank, individual in enumerate(sorted_individuals):
-            individual.scaled_fitness = rank + 1  # 순위를 적합도로 사용
+        # 순위를 적합도로 사용 (best가 1)
+        self._set_scaled_fitness(VectorizedSelection.rank_scaling(self._fitness_vector()).astype(int))
 
     def sigma_scaling(self):
         """
         Applies sigma scaling to the fitness values.
         """
-        fitness_values = [ind.fitness for ind in self.individuals]
-        mean_fitness = np.mean(fitness_values)
-        std_fitness = np.std(fitness_values)
-        
-        for individual in self.individuals:
-            if std_fitness > 0:
-                individual.scaled_fitness = 1 + (individual.fitness - mean_fitness) / (2 * std_fitness)
-            else:
-                individual.scaled_fitness = 1  # 표준편차가 0인 경우
+        self._set_scaled_fitness(VectorizedSelection.sigma_scaling(self._fitness_vector()))
 
     def boltzmann_scaling(self, T=1.0):
         """
@@ -459,32 +624,56 @@ class Population:
         Parameters:
             T (float): Temperature parameter for Boltzmann scaling.
         """
-        fitness_values = [ind.fitness for ind in self.individuals]
-        exp_values = np.exp(fitness_values / T)
-        sum_exp_values = np.sum(exp_values)
-        
-        for individual in self.individuals:
-            individual.scaled_fitness = exp_values[self.individuals.index(individual)] / sum_exp_values
+        self._set_scaled_fitness(VectorizedSelection.boltzmann_scaling(self._fitness_vector(), T))
 
     def select(self, selection):
-        # 선택 과정 시작 출력
-        # print("Selection results:")
-        
+        """
+        Replaces the population by population_size selected individuals.
+
+        Operators with select_indices (GAS/Selection/VectorizedSelection.py) draw all parent
+        indices at once from the fitness vector; other operators are called once per parent.
+
+        Parameters:
+            selection: A selection operator from GAS/Selection.
+        """
+        if hasattr(selection, 'select_indices'):
+            indices = selection.select_indices(self._fitness_vector(), self.config.population_size)
+            # clone은 seq를 copy-on-write로 공유하므로 같은 부모가 여러 번 뽑혀도 저렴
+            self.individuals = [self.individuals[i].clone() for i in indices.tolist()]
+            return
+
         new_individuals = []
         
         # population size만큼 개별 개체를 선택하고 리스트에 추가
         for _ in range(self.config.population_size):
             selected = selection.select(self.individuals)
-            new_individuals.append(copy.deepcopy(selected))
-            
-            # 선택된 개체 출력
-            # print(f"  Selected individual: Seq: {selected.seq}, Makespan: {selected.makespan}")
+            new_individuals.append(selected.clone())
         
         # 최종적으로 새로운 개체 리스트로 population을 대체
         self.individuals = new_individuals
 
 
     def crossover(self, crossover):
+        """
+        Replaces the population by the children of the pairs (0, 1), (2, 3), ...
+
+        Operators with cross_batch (GAS/Crossover/BatchCrossover.py) cross all pairs at once
+        on a chromosome matrix, and only the rows that changed become new Individuals; other
+        operators are called pair by pair.
+
+        Parameters:
+            crossover: A crossover operator from GAS/Crossover.
+        """
+        if hasattr(crossover, 'cross_batch'):
+            parents = self.individuals[:len(self.individuals) - len(self.individuals) % 2]
+            seqs = np.array([individual.seq for individual in parents])
+            children = np.empty_like(seqs)
+            children[0::2], children[1::2], _ = crossover.cross_batch(seqs[0::2], seqs[1::2])
+            changed = (children != seqs).any(axis=1).tolist()
+            self.individuals = [Individual(config=parent.config, seq=child, op_data=parent.op_data) if is_changed else parent
+                                for parent, child, is_changed in zip(parents, children.tolist(), changed)]
+            return
+
         # print("Crossover results:")
         next_generation = []
 
@@ -506,14 +695,30 @@ class Population:
 
 
     def mutate(self, mutation):
-        # print("Mutation results:")
+        """
+        Applies a mutation operator to every individual.
+
+        Operators with mutate_batch (GAS/Mutation/BatchMutation.py) mutate a chromosome matrix
+        of the whole population at once, and only the individuals whose rows changed get a
+        new seq (and lose their evaluation); other operators are called per individual.
+
+        Parameters:
+            mutation: A mutation operator from GAS/Mutation.
+        """
+        if hasattr(mutation, 'mutate_batch'):
+            seqs = np.array([individual.seq for individual in self.individuals])
+            changed = mutation.mutate_batch(seqs, self.config)
+            for i in np.flatnonzero(changed).tolist():
+                self.individuals[i].seq = seqs[i]
+            self._ranking = None
+            return
+
         for i, individual in enumerate(self.individuals):
-            original_seq = copy.deepcopy(individual.seq)
-            mutation.mutate(individual)
-            # if original_seq != individual.seq:
-            #     print(f"  Mutation on individual {i}:")
-            #     print(f"    Before: {original_seq}")
-            #     print(f"    After:  {individual.seq}")
+            # in-place로 seq를 바꾸는 mutation과 새 개체를 반환하는 mutation 모두 반영
+            mutated = mutation.mutate(individual)
+            if mutated is not None:
+                self.individuals[i] = mutated
+        self._ranking = None
 
     def preserve_elites(self, elites):
         """
@@ -523,3 +728,4 @@ class Population:
             elites (list): List of elite individuals to preserve.
         """
         self.individuals[:len(elites)] = elites
+        self._ranking = None
@@ -0,0 +1,124 @@
+"""
+Population Ranking
+
+This script defines the ranking index of a Population: the rows of the population kept in
+ascending order of makespan, ties broken by row (as sorted(), min() and max() on the list
+of individuals). GAEngine asks for the best individual, the elites, the top 10 percent for
+migration and the local search candidates several times per generation; with the index
+these are O(k) reads instead of a sort or a scan of the population each.
+
+The index is a sorted list of (makespan, row) keys; the individuals themselves stay in
+their rows. Population.evaluate builds it once after a new generation (or updates the rows
+it evaluated), and Population.replace updates it in O(log N) comparisons (bisect) plus one
+list memmove, instead of sorting again.
+
+Classes:
+    Ranking: Rows of a population ordered by makespan.
+"""
+
+from bisect import bisect_left, insort
+
+
+class Ranking:
+    """
+    Rows of a population ordered by makespan (best first).
+
+    Attributes:
+        keys (list): (makespan, row) of every row, sorted.
+        makespan (list): Makespan of every row.
+    """
+
+    def __init__(self, makespans):
+        """
+        Builds the index.
+
+        Parameters:
+            makespans (list): Makespan of every row.
+        """
+        self.makespan = list(makespans)
+        self.keys = sorted((makespan, row) for row, makespan in enumerate(self.makespan))
+
+    def __len__(self):
+        return len(self.keys)
+
+    def best(self, k=1):
+        """
+        Returns the rows of the k best individuals, best first.
+
+        Parameters:
+            k (int): Number of rows (default is 1).
+
+        Returns:
+            list: Row indices.
+        """
+        return [row for _, row in self.keys[:max(k, 0)]]
+
+    def worst(self, k=1):
+        """
+        Returns the rows of the k worst individuals, worst first (the first row on ties, as max()).
+
+        Parameters:
+            k (int): Number of rows (default is 1).
+
+        Returns:
+            list: Row indices.
+        """
+        keys = self.keys
+        k = max(min(k, len(keys)), 0)
+        rows = []
+        end = len(keys)
+        # makespan이 같은 묶음 단위로 뒤에서부터, 묶음 안에서는 앞 row부터
+        while len(rows) < k:
+            start = bisect_left(keys, (keys[end - 1][0], -1))
+            rows.extend(row for _, row in keys[start:min(end, start + k - len(rows))])
+            end = start
+        return rows
+
+    def order(self, start=0, stop=None):
+        """
+        Returns the rows ranked start to stop-1 (0 is the best).
+
+        Parameters:
+            start (int): First rank (default is 0).
+            stop (int): Rank after the last one (default is the population size).
+
+        Returns:
+            list: Row indices.
+        """
+        return [row for _, row in self.keys[start:stop]]
+
+    def rank(self, row):
+        """
+        Returns the rank of a row (0 for the best).
+
+        Parameters:
+            row (int): Row index.
+
+        Returns:
+            int: Rank.
+        """
+        return bisect_left(self.keys, (self.makespan[row], row))
+
+    def percentile(self, q):
+        """
+        Returns the makespan at quantile q (0 is the best, 1 the worst, nearest rank).
+
+        Parameters:
+            q (float): Quantile in [0, 1].
+
+        Returns:
+            float: Makespan.
+        """
+        return self.keys[round(q * (len(self.keys) - 1))][0]
+
+    def update(self, row, makespan):
+        """
+        Moves a row to the position of its new makespan.
+
+        Parameters:
+            row (int): Row index.
+            makespan (float): New makespan of the row.
+        """
+        del self.keys[bisect_left(self.keys, (self.makespan[row], row))]
+        self.makespan[row] = makespan
+        insort(self.keys, (makespan, row))
@@ -10,15 +10,16 @@ Classes:
 
 Functions:
     select(population): Selects an individual from the population based on roulette wheel selection.
+    select_indices(fitness, n, rng): Selects n individual indices at once (GAS/Selection/VectorizedSelection.py).
 """
 
 import sys
 import os
 import random
-import copy
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from GAS.Individual import Individual
+from GAS.Selection.VectorizedSelection import roulette_indices
 
 # class RouletteSelection:
 #     """
@@ -73,8 +74,12 @@ class RouletteSelection:
             current += individual.fitness
             if current >= pick:
                 # 다른 곳에서 `seq` 같은 속성을 사용할 수 있도록
-                # `copy.deepcopy`로 개체 반환
-                return copy.deepcopy(individual)
+                # `clone()`으로 복사한 개체 반환
+                return individual.clone()
         
         # 6) 혹시 누락이 있다면 마지막 개체 반환 (fallback)
-        return copy.deepcopy(population[-1])
+        return population[-1].clone()
+
+    def select_indices(self, fitness, n, rng=None):
+        # 누적 적합도에 대한 searchsorted로 n개를 한 번에 선택
+        return roulette_indices(fitness, n, rng)
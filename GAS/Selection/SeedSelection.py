@@ -1,5 +1,9 @@
 import random
-import copy
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from GAS.Selection.VectorizedSelection import seed_indices
 
 class SeedSelection:
     def __init__(self):
@@ -14,11 +18,15 @@ class SeedSelection:
 
         # 확률적으로 best_individual 또는 다른 개체 선택
         if random.random() < 0.5:  # 50% 확률로 best_individual 선택
-            return copy.deepcopy(best_individual)
+            return best_individual.clone()
         else:
             # 나머지 50% 확률로 다른 개체 무작위 선택
             other_individuals = sorted_population[1:]
             if other_individuals:
-                return copy.deepcopy(random.choice(other_individuals))
+                return random.choice(other_individuals).clone()
             else:
-                return copy.deepcopy(best_individual)
\ No newline at end of file
+                return best_individual.clone()
+
+    def select_indices(self, fitness, n, rng=None):
+        # 50% 확률로 best, 나머지는 다른 개체를 무작위로 n개 한 번에 선택
+        return seed_indices(fitness, n, rng)
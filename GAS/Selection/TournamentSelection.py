@@ -1,10 +1,10 @@
 import random
-import copy
 import sys
 import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from GAS.Individual import Individual
+from GAS.Selection.VectorizedSelection import tournament_indices
 
 class TournamentSelection:
     def __init__(self, tournament_size=2):
@@ -18,4 +18,8 @@ class TournamentSelection:
         winner = min(tournament, key=lambda ind: ind.makespan)
         
         # 선택된 개체의 복사본을 반환
-        return copy.deepcopy(winner)
\ No newline at end of file
+        return winner.clone()
+
+    def select_indices(self, fitness, n, rng=None):
+        # n개의 토너먼트를 한 번에 진행하여 승자의 index 반환 (복사 없음)
+        return tournament_indices(fitness, n, self.tournament_size, rng)
@@ -0,0 +1,219 @@
+"""
+Vectorized Selection
+
+This script defines selection and fitness scaling on fitness vectors. Each selection
+function draws all parent indices of a generation in one call with array operations,
+instead of calling an operator population_size times on a list of individuals and
+copying each winner. The selection classes in this package expose the same functions
+through select_indices(fitness, n), which Population.select and ArrayPopulation.select use.
+
+Higher fitness is better (fitness = target_makespan / makespan). Random numbers come
+from the given numpy Generator/RandomState, or from the global np.random state (seeded
+by Population(random_seed=...)).
+
+Functions:
+    min_max_scaling(fitness): Scales fitness to [0, 1].
+    rank_scaling(fitness): Replaces fitness by its rank (1 for the best).
+    sigma_scaling(fitness): Applies sigma scaling 1 + (f - mean) / (2 * std).
+    boltzmann_scaling(fitness, T): Applies Boltzmann scaling exp(f / T) / sum(exp(f / T)).
+    tournament_indices(fitness, n, tournament_size, rng): k-tournament selection.
+    roulette_indices(fitness, n, rng): Fitness-proportionate (roulette wheel) selection.
+    sus_indices(fitness, n, rng): Stochastic universal sampling.
+    rank_indices(fitness, n, rng): Linear rank selection.
+    seed_indices(fitness, n, rng): Seed selection (the best with probability 1/2, otherwise another one).
+"""
+
+import numpy as np
+
+
+def _rng(rng):
+    return np.random.mtrand._rand if rng is None else rng
+
+
+def _integers(rng, high, size):
+    # Generator(integers)와 RandomState(randint) 모두에서 동작하도록 random()으로 생성
+    return np.minimum((rng.random(size) * high).astype(np.int64), high - 1)
+
+
+def min_max_scaling(fitness):
+    """
+    Scales fitness to [0, 1] (all ones if every fitness is equal).
+
+    Parameters:
+        fitness (array-like): Fitness values.
+
+    Returns:
+        np.ndarray: Scaled fitness.
+    """
+    fitness = np.asarray(fitness, dtype=float)
+    low, high = fitness.min(), fitness.max()
+    if high - low > 0:
+        return (fitness - low) / (high - low)
+    return np.ones(len(fitness))
+
+
+def rank_scaling(fitness):
+    """
+    Replaces fitness by its rank in descending order, 1 for the best (as Population.rank_scaling).
+
+    Parameters:
+        fitness (array-like): Fitness values.
+
+    Returns:
+        np.ndarray: Ranks.
+    """
+    order = np.argsort(-np.asarray(fitness, dtype=float), kind='stable')
+    ranks = np.empty(len(order), dtype=float)
+    ranks[order] = np.arange(1, len(order) + 1)
+    return ranks
+
+
+def sigma_scaling(fitness):
+    """
+    Applies sigma scaling 1 + (f - mean) / (2 * std) (all ones if std is zero).
+
+    Parameters:
+        fitness (array-like): Fitness values.
+
+    Returns:
+        np.ndarray: Scaled fitness.
+    """
+    fitness = np.asarray(fitness, dtype=float)
+    std = fitness.std()
+    if std > 0:
+        return 1 + (fitness - fitness.mean()) / (2 * std)
+    return np.ones(len(fitness))
+
+
+def boltzmann_scaling(fitness, T=1.0):
+    """
+    Applies Boltzmann scaling exp(f / T) / sum(exp(f / T)).
+
+    Parameters:
+        fitness (array-like): Fitness values.
+        T (float): Temperature (default is 1.0).
+
+    Returns:
+        np.ndarray: Scaled fitness.
+    """
+    exp_values = np.exp(np.asarray(fitness, dtype=float) / T)
+    return exp_values / exp_values.sum()
+
+
+def tournament_indices(fitness, n, tournament_size=2, rng=None):
+    """
+    Draws n winners of k-tournaments. The contestants of a tournament are distinct
+    (as random.sample in TournamentSelection) and the fittest one wins.
+
+    Parameters:
+        fitness (array-like): Fitness values.
+        n (int): Number of parents.
+        tournament_size (int): Contestants per tournament (default is 2).
+        rng: numpy Generator or RandomState (default is the global np.random state).
+
+    Returns:
+        np.ndarray: Parent indices, shape (n,).
+    """
+    rng = _rng(rng)
+    fitness = np.asarray(fitness, dtype=float)
+    size = len(fitness)
+    k = min(tournament_size, size)
+    contestants = _integers(rng, size, (n, k))
+    # 같은 개체가 두 번 뽑힌 tournament만 다시 추첨
+    while k > 1:
+        ordered = np.sort(contestants, axis=1)
+        repeated = np.flatnonzero((ordered[:, 1:] == ordered[:, :-1]).any(axis=1))
+        if len(repeated) == 0:
+            break
+        contestants[repeated] = _integers(rng, size, (len(repeated), k))
+    winners = np.argmax(fitness[contestants], axis=1)
+    return contestants[np.arange(n), winners]
+
+
+def roulette_indices(fitness, n, rng=None):
+    """
+    Draws n parents with probability proportional to fitness (roulette wheel).
+
+    Parameters:
+        fitness (array-like): Non-negative fitness values.
+        n (int): Number of parents.
+        rng: numpy Generator or RandomState (default is the global np.random state).
+
+    Returns:
+        np.ndarray: Parent indices, shape (n,).
+
+    Raises:
+        ValueError: If the total fitness is zero.
+    """
+    rng = _rng(rng)
+    cumulative = np.cumsum(np.asarray(fitness, dtype=float))
+    if cumulative[-1] <= 0:
+        raise ValueError("Total fitness of the population is zero.")
+    picks = rng.random(n) * cumulative[-1]
+    return np.minimum(np.searchsorted(cumulative, picks, side='left'), len(cumulative) - 1)
+
+
+def sus_indices(fitness, n, rng=None):
+    """
+    Draws n parents by stochastic universal sampling: n equally spaced pointers with one
+    random offset on the cumulative fitness. The result is shuffled so that consecutive
+    parents (crossover pairs) are not neighbours on the wheel.
+
+    Parameters:
+        fitness (array-like): Non-negative fitness values.
+        n (int): Number of parents.
+        rng: numpy Generator or RandomState (default is the global np.random state).
+
+    Returns:
+        np.ndarray: Parent indices, shape (n,).
+
+    Raises:
+        ValueError: If the total fitness is zero.
+    """
+    rng = _rng(rng)
+    cumulative = np.cumsum(np.asarray(fitness, dtype=float))
+    if cumulative[-1] <= 0:
+        raise ValueError("Total fitness of the population is zero.")
+    step = cumulative[-1] / n
+    pointers = rng.random() * step + step * np.arange(n)
+    indices = np.minimum(np.searchsorted(cumulative, pointers, side='right'), len(cumulative) - 1)
+    return indices[rng.permutation(n)]
+
+
+def rank_indices(fitness, n, rng=None):
+    """
+    Draws n parents by linear rank selection: the best of N gets weight N, the worst 1.
+
+    Parameters:
+        fitness (array-like): Fitness values.
+        n (int): Number of parents.
+        rng: numpy Generator or RandomState (default is the global np.random state).
+
+    Returns:
+        np.ndarray: Parent indices, shape (n,).
+    """
+    ranks = rank_scaling(fitness)
+    return roulette_indices(len(ranks) + 1 - ranks, n, rng)
+
+
+def seed_indices(fitness, n, rng=None):
+    """
+    Draws n parents as SeedSelection does: the best with probability 1/2, otherwise one
+    of the other individuals uniformly at random.
+
+    Parameters:
+        fitness (array-like): Fitness values.
+        n (int): Number of parents.
+        rng: numpy Generator or RandomState (default is the global np.random state).
+
+    Returns:
+        np.ndarray: Parent indices, shape (n,).
+    """
+    rng = _rng(rng)
+    fitness = np.asarray(fitness, dtype=float)
+    best = int(np.argmax(fitness))
+    if len(fitness) == 1:
+        return np.zeros(n, dtype=np.int64)
+    others = _integers(rng, len(fitness) - 1, n)
+    others += others >= best
+    return np.where(rng.random(n) < 0.5, best, others)
@@ -0,0 +1,225 @@
+"""
+Steady-State Replacement
+
+This script defines the steady-state / (mu + lambda) replacement mode of GAEngine
+(Run_Config(replacement='steady-state')). Instead of rebuilding and re-evaluating the
+whole population every generation, each step breeds offspring_size children from parents
+selected in the current population, evaluates only those children and inserts every child
+that is better than the individual it replaces:
+
+    'worst'   : the worst individual of the population (replace-worst).
+    'similar' : the individual with the most similar machine order, i.e. the fewest
+                differing positions (replace-most-similar, keeps the population diverse).
+
+The worst individual is found with a max-heap on makespan, so a replacement costs
+O(log N) instead of a scan of the population. Heap entries of replaced rows are not
+removed; they are recognized as stale (the makespan of a row only decreases) and skipped.
+A child whose genotype (GAS/GenotypeIndex.py) is already in the population is rejected,
+so replace-worst does not fill the population with clones of the best individual.
+
+Since an individual is only ever replaced by a better one, the best individual survives
+every step and no separate elite bookkeeping is needed.
+
+Classes:
+    SteadyStateReplacement: Breeds and inserts children into a Population step by step.
+"""
+
+import sys
+import os
+import copy
+import heapq
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+from GAS.GenotypeIndex import genotype_hashes, individual_machine_orders
+
+REPLACE_POLICIES = ('worst', 'similar')
+
+
+class SteadyStateReplacement:
+    """
+    Breeds and inserts children into a Population step by step.
+
+    The index is built from the evaluated population once per generation, so changes
+    made to population.individuals between generations (local search, migration) are
+    picked up.
+
+    Attributes:
+        population (Population): The population (individuals are replaced in place).
+        policy (str): Replacement policy, 'worst' or 'similar'.
+        makespan (np.ndarray): Makespan of every row.
+        fitness (np.ndarray): Fitness of every row (used for selection).
+        orders (np.ndarray): Flattened machine order of every row, shape (N, n_op).
+        evaluations (int): Number of children evaluated.
+        replacements (int): Number of children inserted.
+    """
+
+    def __init__(self, population, policy='worst'):
+        """
+        Builds the heap and the genotype index of an evaluated population.
+
+        Parameters:
+            population (Population): The evaluated population.
+            policy (str): Replacement policy, 'worst' or 'similar' (default is 'worst').
+
+        Raises:
+            ValueError: If policy is unknown.
+        """
+        if policy not in REPLACE_POLICIES:
+            raise ValueError(f"Unknown replace policy: {policy}")
+        self.population = population
+        self.policy = policy
+        individuals = population.individuals
+        self.makespan = np.array([individual.makespan for individual in individuals], dtype=float)
+        self.fitness = np.array([individual.fitness for individual in individuals], dtype=float)
+        self.orders = individual_machine_orders(individuals, population.config, population.op_data).reshape(len(individuals), -1)
+        self.hashes = genotype_hashes(self.orders).tolist()
+        self.genotypes = {}
+        for h in self.hashes:
+            self.genotypes[h] = self.genotypes.get(h, 0) + 1
+        self._heap = []
+        self._rebuild_heap()
+        self.evaluations = 0
+        self.replacements = 0
+
+    def _rebuild_heap(self):
+        # (-makespan, row): heap의 top이 가장 나쁜 개체
+        self._heap = [(-makespan, row) for row, makespan in enumerate(self.makespan.tolist())]
+        heapq.heapify(self._heap)
+
+    def worst(self):
+        """
+        Returns the row of the worst individual in O(log N) (amortized).
+
+        Returns:
+            int: Row index.
+        """
+        heap = self._heap
+        # 교체된 row의 entry는 makespan이 달라져 있으므로 버림
+        while -heap[0][0] != self.makespan[heap[0][1]]:
+            heapq.heappop(heap)
+        return heap[0][1]
+
+    def best(self):
+        """
+        Returns the best individual of the population.
+
+        Returns:
+            Individual: The individual with the smallest makespan.
+        """
+        return self.population.individuals[int(np.argmin(self.makespan))]
+
+    def breed(self, selection, crossover, mutation, n):
+        """
+        Breeds and evaluates n children (rounded up to an even number).
+
+        Parents are drawn from the fitness vector when the selection operator has
+        select_indices, and the children are produced with Population.crossover and
+        Population.mutate on a population that holds only the parents.
+
+        Parameters:
+            selection: A selection operator from GAS/Selection.
+            crossover: A crossover operator from GAS/Crossover.
+            mutation: A mutation operator from GAS/Mutation.
+            n (int): Number of children.
+
+        Returns:
+            list: The evaluated children.
+        """
+        n += n % 2
+        individuals = self.population.individuals
+        if hasattr(selection, 'select_indices'):
+            parents = [individuals[i].clone() for i in selection.select_indices(self.fitness, n).tolist()]
+        else:
+            parents = [selection.select(individuals).clone() for _ in range(n)]
+        brood = copy.copy(self.population)
+        brood.individuals = parents
+        brood.crossover(crossover)
+        brood.mutate(mutation)
+        pending = sum(not child.is_evaluated() for child in brood.individuals)
+        brood.evaluate(self.population.config.target_makespan)
+        self.evaluations += pending
+        return brood.individuals
+
+    def insert(self, children):
+        """
+        Inserts every child that is better than the individual it would replace.
+
+        Parameters:
+            children (list): Evaluated children.
+
+        Returns:
+            int: Number of inserted children.
+        """
+        if not children:
+            return 0
+        population = self.population
+        orders = individual_machine_orders(children, population.config, population.op_data).reshape(len(children), -1)
+        hashes = genotype_hashes(orders).tolist()
+        inserted = 0
+        for child, order, h in zip(children, orders, hashes):
+            if h in self.genotypes:
+                continue
+            if self.policy == 'worst':
+                row = self.worst()
+            else:
+                row = int(np.argmin((self.orders != order).sum(axis=1)))
+            if not child.makespan < self.makespan[row]:
+                continue
+            self._replace(row, child, order, h)
+            inserted += 1
+        self.replacements += inserted
+        return inserted
+
+    def _replace(self, row, child, order, h):
+        old = self.hashes[row]
+        self.genotypes[old] -= 1
+        if self.genotypes[old] == 0:
+            del self.genotypes[old]
+        self.genotypes[h] = self.genotypes.get(h, 0) + 1
+        self.hashes[row] = h
+        self.population.replace(row, child)
+        self.makespan[row] = child.makespan
+        self.fitness[row] = child.fitness
+        self.orders[row] = order
+        heapq.heappush(self._heap, (-child.makespan, row))
+        # 버려진 entry가 쌓이면 heap을 다시 만듦
+        if len(self._heap) > 2 * len(self.makespan):
+            self._rebuild_heap()
+
+    def step(self, selection, crossover, mutation, n):
+        """
+        Breeds n children and inserts them (one steady-state step).
+
+        Parameters:
+            selection: A selection operator from GAS/Selection.
+            crossover: A crossover operator from GAS/Crossover.
+            mutation: A mutation operator from GAS/Mutation.
+            n (int): Number of children (lambda).
+
+        Returns:
+            int: Number of inserted children.
+        """
+        return self.insert(self.breed(selection, crossover, mutation, n))
+
+    def run(self, selection, crossover, mutation, n, evaluations):
+        """
+        Runs steps until the given number of children has been evaluated.
+
+        Parameters:
+            selection: A selection operator from GAS/Selection.
+            crossover: A crossover operator from GAS/Crossover.
+            mutation: A mutation operator from GAS/Mutation.
+            n (int): Number of children per step (lambda).
+            evaluations (int): Number of children to evaluate (e.g. population_size for one generation).
+
+        Returns:
+            int: Number of inserted children.
+        """
+        inserted = 0
+        bred = 0
+        while bred < evaluations:
+            children = self.breed(selection, crossover, mutation, min(n, evaluations - bred))
+            bred += len(children)
+            inserted += self.insert(children)
+        return inserted
@@ -129,14 +129,14 @@ def run_ga_engine(args):
         pm = best_mutation.pm
 
         now = datetime.datetime.now().strftime('%Y-%m-%d-%H-%M-%S')
-        log_path = os.path.join(result_txt_path, f'log_GA{index+1}_{now}_{crossover_name}_{mutation_name}_{selection_name}_{local_search_name}_{pso_name}_pc{pc}_pm{pm}.csv')
+        log_path = os.path.join(result_txt_path, f'log_GA{index+1}_{now}_{crossover_name}_{mutation_name}_{selection_name}_{local_search_name}_{pso_name}_pc{pc}_pm{pm}.{ga_engine.config.trace_format}')
         machine_log_path = os.path.join(result_txt_path, f'machine_log_GA{index+1}_{now}_{crossover_name}_{mutation_name}_{selection_name}_{local_search_name}_{pso_name}_pc{pc}_pm{pm}.csv')
         generations_path = os.path.join(ga_generations_path, f'ga_generations_GA{index+1}_{now}_{crossover_name}_{mutation_name}_{selection_name}_{local_search_name}_{pso_name}_pc{pc}_pm{pm}.csv')
 
-        if best is not None and hasattr(best, 'monitor'):
+        if best is not None and (best.monitor is not None or best.replay() is not None):  # trace가 없으면 best 개체만 다시 실행
             best.monitor.save_event_tracer(log_path)
             ga_engine.config.filename['log'] = log_path
-            generated_log_df = generate_machine_log(ga_engine.config)
+            generated_log_df = generate_machine_log(ga_engine.config, best.monitor)
             generated_log_df.to_csv(machine_log_path, index=False)
             ga_engine.save_csv(all_generations, execution_time, generations_path)
         else:
@@ -257,7 +257,7 @@ def main():
         print(f"Selected Initialization GA mode for GA{i+1}: {initialization_mode}")
 
         config = copy.deepcopy(base_config)
-        config.filename['log'] = os.path.join(result_txt_path, f'GA{i+1}_{config.now}.csv')
+        config.filename['log'] = os.path.join(result_txt_path, f'GA{i+1}_{config.now}.{config.trace_format}')
         config.filename['machine'] = os.path.join(result_txt_path, f'GA{i+1}_{config.now}_machine.csv')
         config.filename['gantt'] = os.path.join(result_gantt_path, f'GA{i+1}_{config.now}.png')
         config.filename['csv'] = os.path.join(ga_generations_path, f'GA{i+1}_{config.now}.csv')
@@ -318,8 +318,8 @@ def main():
                     elite_population[index] = best
 
                     # 세대가 끝날 때마다 상위 10% 개체를 new_populations에 저장
-                    top_individuals = sorted(ga_engines[index].population.individuals, key=lambda ind: ind.makespan)[:max(1, len(ga_engines[index].population.individuals) // 10)]
-                    new_populations[index] = [copy.deepcopy(ind) for ind in top_individuals]
+                    top_individuals = ga_engines[index].population.top(max(1, len(ga_engines[index].population.individuals) // 10))
+                    new_populations[index] = [ind.clone() for ind in top_individuals]
 
                     # 추가: new_populations이 제대로 저장되고 있는지 확인하기 위해 로그 출력
                     # print(f"GA{index+1} 세대 {sync_generation[index]}의 상위 10% 개체: {[ind.seq for ind in new_populations[index]]}")
@@ -333,14 +333,14 @@ def main():
                     pso_name = ga_engines[index].pso.__class__.__name__ if ga_engines[index].pso else 'None'
                     pc = best_crossover.pc
                     pm = best_mutation.pm
-                    log_path = os.path.join(result_txt_path, f'log_GA{index+1}_{crossover_name}_{mutation_name}_{selection_name}_{local_search_name}_{pso_name}_pc{pc}_pm{pm}.csv')
+                    log_path = os.path.join(result_txt_path, f'log_GA{index+1}_{crossover_name}_{mutation_name}_{selection_name}_{local_search_name}_{pso_name}_pc{pc}_pm{pm}.{ga_engines[index].config.trace_format}')
                     machine_log_path = os.path.join(result_txt_path, f'machine_log_GA{index+1}_{crossover_name}_{mutation_name}_{selection_name}_{local_search_name}_{pso_name}_pc{pc}_pm{pm}.csv')
                     generations_path = os.path.join(ga_generations_path, f'ga_generations_GA{index+1}_{crossover_name}_{mutation_name}_{selection_name}_{local_search_name}_{pso_name}_pc{pc}_pm{pm}.csv')
 
-                    if best is not None and hasattr(best, 'monitor'):
+                    if best is not None and (best.monitor is not None or best.replay() is not None):  # trace가 없으면 best 개체만 다시 실행
                         best.monitor.save_event_tracer(log_path)
                         ga_engines[index].config.filename['log'] = log_path
-                        generated_log_df = generate_machine_log(ga_engines[index].config)
+                        generated_log_df = generate_machine_log(ga_engines[index].config, best.monitor)
                         generated_log_df.to_csv(machine_log_path, index=False)
                         ga_engines[index].save_csv(all_generations, execution_time, generations_path)
                     else:
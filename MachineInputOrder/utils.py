@@ -6,6 +6,11 @@ between two sequences. These include Kendall's tau distance, Spearman's rank
 correlation, Spearman's footrule distance, bubble sort distance, positional 
 distance, and mean squared error (MSE).
 
+The scalar functions call scipy once per sequence. For a whole population the
+machine-input-order (MIO) metrics are computed at once with mio_metrics, which
+vectorizes over individuals and machines and counts discordant pairs with a
+bottom-up merge sort (O(n log n) per row) instead of per-row scipy calls.
+
 Functions:
     kendall_tau_distance(x, y): Calculates Kendall's tau distance between two sequences.
     spearman_rank_correlation(x, y): Calculates Spearman's rank correlation between two sequences.
@@ -13,6 +18,9 @@ Functions:
     bubble_sort_distance(x): Calculates the bubble sort distance for a sequence.
     positional_distance(x, y): Calculates the positional distance between two sequences.
     MSE(x, y): Calculates the mean squared error (MSE) between two sequences.
+    inversion_counts(rows): Counts the inversions of every row with a vectorized merge sort.
+    kendall_distance(x, y): Counts the discordant pairs between rows of x and y.
+    mio_metrics(mio): Calculates the MIO scores of one or many individuals at once.
 """
 
 import numpy as np
@@ -108,3 +116,133 @@ def MSE(x, y):
     mse = np.square(np.subtract(x, y)).mean()
 
     return mse
+
+
+# mio_metrics의 열 순서 (GAS/Individual.py의 calculate_score와 동일)
+MIO_METRICS = ('kendall_tau', 'spearman_rho', 'spearman_footrule', 'MSE', 'bubble_sort', 'pearson')
+
+
+def inversion_counts(rows):
+    """
+    Counts the inversions (pairs i < j with row[i] > row[j]) of every row.
+
+    All rows are sorted together bottom-up: at each level the sorted left and right
+    halves of every block are merged, and each element of a right half adds the number
+    of left-half elements that are greater than it.
+
+    Parameters:
+        rows (array-like): Sequences along the last axis, shape (..., n).
+
+    Returns:
+        np.ndarray: Inversion counts, shape (...).
+    """
+    rows = np.asarray(rows)
+    shape, n = rows.shape[:-1], rows.shape[-1]
+    counts = np.zeros(int(np.prod(shape)), dtype=np.int64)
+    if n < 2:
+        return counts.reshape(shape)
+
+    # stable rank으로 바꾸면 같은 값은 위치 순서가 되어 inversion으로 세지 않음
+    ranks = np.argsort(np.argsort(rows.reshape(-1, n), axis=1, kind='stable'), axis=1, kind='stable')
+    size = 1 << (n - 1).bit_length()
+    if size > n:
+        # 뒤에 큰 값을 채우면 inversion이 생기지 않음
+        ranks = np.concatenate([ranks, np.broadcast_to(np.arange(n, size), (len(ranks), size - n))], axis=1)
+
+    width = 1
+    while width < size:
+        blocks = ranks.reshape(len(ranks), -1, 2 * width)
+        order = np.argsort(blocks, axis=2)
+        from_left = order < width
+        left_before = np.cumsum(from_left, axis=2) - from_left
+        counts += np.where(from_left, 0, width - left_before).sum(axis=(1, 2))
+        ranks = np.take_along_axis(blocks, order, axis=2).reshape(len(ranks), size)
+        width *= 2
+    return counts.reshape(shape)
+
+
+def kendall_distance(x, y):
+    """
+    Counts the discordant pairs (x[i] - x[j]) * (y[i] - y[j]) < 0 between x and y.
+
+    Parameters:
+        x (array-like): First sequences along the last axis, shape (..., n).
+        y (array-like): Second sequences, same shape as x.
+
+    Returns:
+        np.ndarray: Numbers of discordant pairs, shape (...).
+    """
+    x, y = np.broadcast_arrays(np.asarray(x), np.asarray(y))
+    # y 순으로 (y가 같으면 x 순으로) 정렬한 뒤 x의 strict inversion을 셈
+    order = np.lexsort((x, y), axis=-1)
+    return inversion_counts(np.take_along_axis(x, order, axis=-1))
+
+
+def _runs(*sorted_rows):
+    # 정렬된 row에서 같은 값(여러 row가 주어지면 모두 같은 값)이 연속된 구간의 시작/끝 위치
+    first = sorted_rows[0]
+    n = first.shape[-1]
+    idx = np.arange(n)
+    change = np.zeros(first.shape[:-1] + (n - 1,), dtype=bool)
+    for rows in sorted_rows:
+        change |= rows[..., 1:] != rows[..., :-1]
+    new = np.concatenate([np.ones(first.shape[:-1] + (1,), dtype=bool), change], axis=-1)
+    last = np.concatenate([change, np.ones(first.shape[:-1] + (1,), dtype=bool)], axis=-1)
+    start = np.maximum.accumulate(np.where(new, idx, 0), axis=-1)
+    end = np.flip(np.minimum.accumulate(np.flip(np.where(last, idx, n), axis=-1), axis=-1), axis=-1)
+    return start, end
+
+
+def _pearson(x, y):
+    x = x - x.mean(axis=-1, keepdims=True)
+    y = y - y.mean(axis=-1, keepdims=True)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return (x * y).sum(axis=-1) / np.sqrt((x * x).sum(axis=-1) * (y * y).sum(axis=-1))
+
+
+def mio_metrics(mio):
+    """
+    Calculates the MIO scores of one or many individuals at once.
+
+    For every machine the MIO is compared with its sorted order, and each score is
+    summed over the machines, giving the same values as calculate_score(MIO, MIO_sorted)
+    in GAS/Individual.py (columns in MIO_METRICS order) without calling scipy per row.
+
+    Parameters:
+        mio (array-like): Machine input orders, shape (n_machine, n_job) for one individual
+                          or (N, n_machine, n_job) for a population.
+
+    Returns:
+        np.ndarray: Scores, shape (6,) or (N, 6).
+    """
+    x = np.asarray(mio)
+    n = x.shape[-1]
+    y = np.sort(x, axis=-1)
+    positions = np.arange(n)
+
+    # Kendall tau-b (scipy.stats.kendalltau와 같은 식): y는 x를 정렬한 것이므로 x, y의 tie 수가 같음
+    order = np.argsort(x, axis=-1, kind='stable')
+    y_by_x = np.take_along_axis(y, order, axis=-1)
+    discordant = inversion_counts(y_by_x)
+    start, end = _runs(y)
+    ties = (positions - start).sum(axis=-1)
+    joint_ties = (positions - _runs(y, y_by_x)[0]).sum(axis=-1)
+    total = n * (n - 1) // 2
+    with np.errstate(divide='ignore', invalid='ignore'):
+        tau = (total - 2 * ties + joint_ties - 2 * discordant) / (total - ties).astype(float)
+        tau = np.where(ties == total, np.nan, np.clip(tau, -1.0, 1.0))
+
+    # Spearman rho: 평균 rank의 Pearson 상관계수
+    y_rank = (start + end) / 2 + 1
+    x_rank = np.empty_like(y_rank)
+    np.put_along_axis(x_rank, order, y_rank, axis=-1)
+    rho = _pearson(x_rank, y_rank)
+
+    footrule = np.abs(np.argsort(x, axis=-1) - np.argsort(y, axis=-1)).sum(axis=-1)
+    mse = np.square(x - y).mean(axis=-1)
+    bubble = np.where(x != y, positions, 0).sum(axis=-1)
+    pearson = _pearson(x.astype(float), y.astype(float))
+
+    scores = np.stack([tau, rho, footrule, mse, bubble, pearson], axis=-1)
+    return scores.sum(axis=-2)
+
@@ -0,0 +1,359 @@
+"""
+Benchmarks
+
+This script collects the benchmarks of the optimized modules in GAS, so that the modules
+themselves only contain the code used by the GA. Run it from the repository root:
+
+    python benchmarks/run_benchmarks.py [name ...]
+
+Without names every benchmark is run with its default arguments (the large instances,
+e.g. ta71, take a while).
+
+Functions:
+    benchmark_cloning(filename, n): Compares Individual.clone() against copy.deepcopy.
+    benchmark_memory(filename, population_size): Compares the memory of a list population and an ArrayPopulation.
+    benchmark_batch_decoder(filenames, population_size, repeat): Compares evaluations/sec of the batch decoder against the per-individual path.
+    benchmark_decoding(filenames, repeat): Compares decode_chromosome against the previous per-job scans.
+    benchmark_decoders(targets, evaluation_budget, runs, delta): Compares the semi-active and active decoders in a GA at a fixed evaluation budget.
+    benchmark_mutation(filename, population_size, pm): Compares the batched and per-individual mutations.
+    benchmark_crossover(n_op, n_pairs, trials, random_seed): Checks and times the batched crossover kernels.
+"""
+
+import sys
+import os
+import copy
+import time
+import random
+import argparse
+import tracemalloc
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+from Data.Dataset.Dataset import Dataset
+from Config.Run_Config import Run_Config
+from GAS import BatchDecoder
+from GAS.Individual import Individual
+from GAS.Population import Population
+from GAS.ArrayPopulation import ArrayPopulation
+from GAS.Decoder import decode_chromosome
+from GAS.Crossover.BatchCrossover import BATCH_CROSSOVERS, batch_crossover, valid_permutations
+from GAS.Crossover.OrderCrossover import OrderCrossover
+from GAS.Mutation.CompositeMutation import CompositeMutation
+from GAS.Mutation.SwapMutation import SwapMutation
+from GAS.Mutation.ReciprocalExchangeMutation import ReciprocalExchangeMutation
+from GAS.Mutation.InversionMutation import InversionMutation
+from GAS.Mutation.ShiftMutation import ShiftMutation
+from GAS.Mutation.InsertionMutation import InsertionMutation
+from GAS.Mutation.DisplacementMutation import DisplacementMutation
+from GAS.Selection.TournamentSelection import TournamentSelection
+
+
+def benchmark_cloning(filename='ta71.txt', n=2000):
+    """
+    Compares clone() against copy.deepcopy of an evaluated individual.
+
+    Reports clones per second and the memory allocated per copy (tracemalloc).
+
+    Parameters:
+        filename (str): Dataset file in Data/Dataset (default is 'ta71.txt').
+        n (int): Number of copies per measurement (default is 2000).
+    """
+    dataset = Dataset(filename)
+    config = Run_Config(dataset.n_job, dataset.n_machine, dataset.n_op, 1, 1, evaluator='array')
+    config.target_makespan = 1
+    individual = Individual(config, seq=random.sample(range(dataset.n_op), dataset.n_op), op_data=dataset.instance)
+    individual.fitness, individual.MIO
+
+    for name, copier in (('deep copy', copy.deepcopy), ('clone', Individual.clone)):
+        start = time.perf_counter()
+        copies = [copier(individual) for _ in range(n)]
+        rate = n / (time.perf_counter() - start)
+        del copies
+
+        tracemalloc.start()
+        copies = [copier(individual) for _ in range(n)]
+        size = tracemalloc.get_traced_memory()[0] / n
+        tracemalloc.stop()
+        del copies
+        print(f"{filename} {name}: {rate:.0f} copies/s, {size / 1024:.2f} KB per copy")
+
+
+def benchmark_memory(filename='ta71.txt', population_size=1000):
+    """
+    Compares the memory of a list-based Population and an ArrayPopulation after evaluation.
+
+    Parameters:
+        filename (str): Dataset file in Data/Dataset (default is 'ta71.txt').
+        population_size (int): Number of chromosomes (default is 1000).
+    """
+    dataset = Dataset(filename)
+    config = Run_Config(dataset.n_job, dataset.n_machine, dataset.n_op, population_size, 1,
+                        evaluator='array', fitness_cache_mb=0)
+    config.target_makespan = 1
+
+    tracemalloc.start()
+    population = Population(config, dataset.instance)
+    population.evaluate(config.target_makespan)
+    list_size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del population
+
+    tracemalloc.start()
+    array_population = ArrayPopulation(config, dataset.instance)
+    array_population.evaluate(config.target_makespan)
+    array_size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    print(f"{filename} N={population_size}: list {list_size / 2 ** 20:.1f} MB, "
+          f"array {array_size / 2 ** 20:.1f} MB (arrays {array_population.nbytes / 2 ** 20:.2f} MB, "
+          f"dtype {array_population.seqs.dtype})")
+
+
+def benchmark_batch_decoder(filenames, population_size=100, repeat=3):
+    """
+    Compares evaluations/sec of the batch decoder against the per-individual path.
+
+    Parameters:
+        filenames (list): Dataset files in Data/Dataset.
+        population_size (int): Number of chromosomes per batch (default is 100).
+        repeat (int): Number of timed batches (default is 3).
+    """
+    for filename in filenames:
+        dataset = Dataset(filename)
+        config = Run_Config(dataset.n_job, dataset.n_machine, dataset.n_op, population_size, 1, fitness_cache_mb=0)
+        config.target_makespan = 1
+        seqs = [random.sample(range(dataset.n_op), dataset.n_op) for _ in range(population_size)]
+        individuals = [Individual(config, seq=seq, op_data=dataset.instance) for seq in seqs]
+
+        rates = {}
+        for evaluator in ('simpy', 'array'):
+            config.evaluator = evaluator
+            start = time.perf_counter()
+            for _ in range(repeat):
+                for individual in individuals:
+                    individual.evaluate(individual.machine_order)
+            rates[evaluator] = repeat * population_size / (time.perf_counter() - start)
+
+        seq_matrix = np.array(seqs)
+        start = time.perf_counter()
+        for _ in range(repeat):
+            BatchDecoder.evaluate_population(seq_matrix, dataset.instance)
+        rates['batch'] = repeat * population_size / (time.perf_counter() - start)
+
+        print(f"{filename} ({dataset.n_job}x{dataset.n_machine}, N={population_size}): "
+              + ", ".join(f"{name} {rate:.0f} eval/s" for name, rate in rates.items()))
+
+
+def _reference_decode(seq, op_data, n_job, n_machine):
+    # 이전 Individual.get_repeatable / get_feasible / get_machine_order 구현 (benchmark 비교용)
+    cumul = 0
+    job_seq = np.array(seq)
+    for i in range(n_job):
+        for j in range(n_machine):
+            job_seq = np.where((job_seq >= cumul) & (job_seq < cumul + n_machine), i, job_seq)
+        cumul += n_machine
+    job_seq = job_seq.tolist()
+
+    temp = 0
+    cumul = 0
+    feasible_seq = np.array(seq)
+    for i in range(n_job):
+        idx = np.where((feasible_seq >= cumul) & (feasible_seq < cumul + n_machine))[0]
+        for j in range(min(len(idx), n_machine)):
+            feasible_seq[idx[j]] = temp
+            temp += 1
+        cumul += n_machine
+
+    m_list = np.array([op_data[num // n_machine][num % n_machine][0] for num in feasible_seq])
+    machine_order = [[job_seq[o] for o in np.where(m_list == m)[0]] for m in range(n_machine)]
+    return job_seq, feasible_seq, machine_order
+
+
+def benchmark_decoding(filenames, repeat=20):
+    """
+    Compares decode_chromosome against the previous per-job scans and checks that both agree.
+
+    Parameters:
+        filenames (list): Dataset files in Data/Dataset.
+        repeat (int): Number of random chromosomes decoded per instance (default is 20).
+    """
+    for filename in filenames:
+        dataset = Dataset(filename)
+        instance = dataset.instance
+        seqs = [random.sample(range(instance.n_op), instance.n_op) for _ in range(repeat)]
+
+        start = time.perf_counter()
+        reference = [_reference_decode(seq, instance, instance.n_job, instance.n_machine) for seq in seqs]
+        reference_time = (time.perf_counter() - start) / repeat
+
+        start = time.perf_counter()
+        decoded = [decode_chromosome(seq, instance) for seq in seqs]
+        decode_time = (time.perf_counter() - start) / repeat
+
+        for (job_seq, feasible_seq, machine_order), (job_arr, feasible_arr, flat, offsets) in zip(reference, decoded):
+            assert job_seq == job_arr.tolist()
+            assert np.array_equal(feasible_seq, feasible_arr)
+            assert machine_order == [flat[offsets[m]:offsets[m + 1]].tolist() for m in range(instance.n_machine)]
+
+        print(f"{filename} ({instance.n_job}x{instance.n_machine}): previous {reference_time * 1000:.3f} ms, "
+              f"single-pass {decode_time * 1000:.3f} ms, speedup x{reference_time / decode_time:.0f}")
+
+
+def benchmark_decoders(targets, evaluation_budget=20000, runs=3, delta=1.0, population_size=100):
+    """
+    Compares the semi-active and the active decoder in the same GA at a fixed evaluation budget.
+
+    Both decoders run the same generational GA (tournament selection, order crossover,
+    composite mutation, 10% elites, array evaluator) with the same seeds until
+    evaluation_budget evaluations are used, and the best makespan and the number of
+    evaluations needed to reach the target are reported.
+
+    Parameters:
+        targets (dict): Dataset file -> target makespan (e.g. {'la16.txt': 945}).
+        evaluation_budget (int): Evaluations per run (default is 20000).
+        runs (int): Runs (seeds) per decoder and instance (default is 3).
+        delta (float): Look-ahead of the active decoder (default is 1.0).
+        population_size (int): Population size (default is 100).
+    """
+    for filename, target in targets.items():
+        dataset = Dataset(filename)
+        for decoder in ('semi-active', 'active'):
+            bests, hits = [], []
+            for run in range(runs):
+                config = Run_Config(dataset.n_job, dataset.n_machine, dataset.n_op, population_size, 0,
+                                    evaluator='array', decoder=decoder, active_delta=delta)
+                config.target_makespan = target
+                population = Population(config, dataset.instance, random_seed=run)
+                crossover, mutation, selection = OrderCrossover(pc=0.7), CompositeMutation(pm=0.5), TournamentSelection()
+                start_count = Individual.evaluation_count
+                best, evals_to_target = None, None
+                while Individual.evaluation_count - start_count < evaluation_budget:
+                    population.evaluate(target)
+                    generation_best = population.best().makespan
+                    if best is None or generation_best < best:
+                        best = generation_best
+                    if evals_to_target is None and best <= target:
+                        evals_to_target = Individual.evaluation_count - start_count
+                        break
+                    elites = population.top(population_size // 10)
+                    population.select(selection)
+                    population.crossover(crossover)
+                    population.mutate(mutation)
+                    population.preserve_elites(elites)
+                bests.append(best)
+                hits.append(evals_to_target)
+
+            reached = [hit for hit in hits if hit is not None]
+            print(f"{filename} (target {target}) {decoder:>11}: best {min(bests)}, mean {np.mean(bests):.1f}, "
+                  f"reached {len(reached)}/{runs}"
+                  + (f" after {np.mean(reached):.0f} evals on average" if reached else ""))
+
+
+def benchmark_mutation(filename='ta71.txt', population_size=500, pm=0.5):
+    """
+    Compares the batched mutations with the per-individual mutation classes on a random
+    population, and checks that every mutated row is still a permutation.
+
+    Parameters:
+        filename (str): Dataset file in Data/Dataset (default is 'ta71.txt').
+        population_size (int): Number of chromosomes (default is 500).
+        pm (float): Mutation probability (default is 0.5).
+
+    Returns:
+        dict: (batched seconds, per-individual seconds) per mutation class.
+    """
+    dataset = Dataset(filename)
+    config = Run_Config(dataset.n_job, dataset.n_machine, dataset.n_op, population_size, 1)
+    seqs = np.argsort(np.random.default_rng(0).random((population_size, dataset.n_op)), axis=1)
+    results = {}
+    for mutation in (SwapMutation(pm), ReciprocalExchangeMutation(pm), InversionMutation(pm),
+                     ShiftMutation(pm), InsertionMutation(pm), DisplacementMutation(pm)):
+        batch = seqs.copy()
+        start = time.perf_counter()
+        changed = mutation.mutate_batch(batch, config)
+        batched = time.perf_counter() - start
+        if not valid_permutations(batch).all():
+            raise ValueError(f"{type(mutation).__name__} returned a row that is not a permutation.")
+        if (changed != (batch != seqs).any(axis=1)).any():
+            raise ValueError(f"{type(mutation).__name__} returned a wrong changed mask.")
+
+        individuals = [Individual(config, seq=seq, op_data=dataset.op_data) for seq in seqs.tolist()]
+        random.seed(0)
+        start = time.perf_counter()
+        # InsertionMutation.mutate는 호출마다 출력하므로 stdout을 잠시 막음
+        stdout, sys.stdout = sys.stdout, open(os.devnull, 'w')
+        try:
+            for individual in individuals:
+                mutation.mutate(individual)
+        finally:
+            sys.stdout.close()
+            sys.stdout = stdout
+        single = time.perf_counter() - start
+        results[type(mutation).__name__] = (batched, single)
+        print(f"{type(mutation).__name__:28s} batched {batched * 1000:8.1f} ms ({changed.sum()} rows changed), "
+              f"per individual {single * 1000:8.1f} ms")
+    return results
+
+
+def benchmark_crossover(n_op=100, n_pairs=500, trials=20, random_seed=0):
+    """
+    Checks that every kernel of GAS/Crossover/BatchCrossover.py returns valid permutations
+    on random parents, and prints the time per pair of each kernel.
+
+    Parameters:
+        n_op (int): Chromosome length (default is 100).
+        n_pairs (int): Number of pairs per trial (default is 500).
+        trials (int): Number of trials per operator (default is 20).
+        random_seed (int): Seed of the random parents and cut points (default is 0).
+
+    Returns:
+        dict: Number of children checked per operator.
+
+    Raises:
+        ValueError: If a kernel returns a row that is not a permutation.
+    """
+    rng = np.random.default_rng(random_seed)
+    checked = {}
+    for method in BATCH_CROSSOVERS:
+        elapsed = 0.0
+        for trial in range(trials):
+            # 작은 n_op도 섞어서 segment가 양 끝에 걸리는 경우를 확인
+            length = n_op if trial % 2 == 0 else int(rng.integers(2, 8))
+            parents1 = np.argsort(rng.random((n_pairs, length)), axis=1)
+            parents2 = np.argsort(rng.random((n_pairs, length)), axis=1)
+            if trial % 4 == 1:
+                parents2[: n_pairs // 2] = parents1[: n_pairs // 2]
+            start = time.perf_counter()
+            children1, children2, _ = batch_crossover(parents1, parents2, method, 1.0, rng)
+            elapsed += time.perf_counter() - start
+            for children in (children1, children2):
+                invalid = np.flatnonzero(~valid_permutations(children))
+                if len(invalid):
+                    raise ValueError(f"{method}: child {invalid[0]} is not a permutation: {children[invalid[0]].tolist()}")
+            checked[method] = checked.get(method, 0) + 2 * n_pairs
+        print(f"{method:>4}: {checked[method]} children valid, {elapsed / (trials * n_pairs) * 1e6:.1f} us/pair")
+    return checked
+
+
+BENCHMARKS = {
+    'cloning': lambda: benchmark_cloning(),
+    'memory': lambda: benchmark_memory(),
+    'batch_decoder': lambda: benchmark_batch_decoder(['la01.txt', 'ta41.txt', 'ta71.txt']),
+    'decoding': lambda: benchmark_decoding(['la01.txt', 'la16.txt', 'ta21.txt', 'ta41.txt', 'ta71.txt']),
+    'decoders': lambda: benchmark_decoders({'la16.txt': 945, 'la17.txt': 784, 'la18.txt': 848, 'la19.txt': 842,
+                                            'la20.txt': 902, 'ta21.txt': 1642}),
+    'mutation': lambda: benchmark_mutation(),
+    'crossover': lambda: benchmark_crossover(),
+}
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Benchmarks of the optimized GA modules.')
+    parser.add_argument('names', nargs='*', help=f"Benchmarks to run, of {', '.join(BENCHMARKS)} (default is all).")
+    names = parser.parse_args().names or list(BENCHMARKS)
+    unknown = [name for name in names if name not in BENCHMARKS]
+    if unknown:
+        parser.error(f"Unknown benchmark: {', '.join(unknown)}")
+    for name in names:
+        print(f"== {name}")
+        BENCHMARKS[name]()
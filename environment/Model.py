@@ -0,0 +1,121 @@
+"""
+Simulation Model Template
+
+This script defines the SimulationModel class, which builds the SimPy model graph
+(Sources, Processes, Machines and the Sink) once per dataset and configuration and
+re-runs it for each machine order. Instead of constructing every object again, each
+run creates a fresh simpy.Environment and resets the existing components onto it.
+
+A run ends as soon as the Sink has received all n_job parts, so the makespan is never
+truncated by a fixed horizon (config.simul_time). The horizon is only used as a safety
+limit: a machine order that has not finished by then is reported as an error.
+
+Classes:
+    SimulationModel: Reusable SimPy model of a job shop instance.
+
+Functions:
+    get_simulation_model(config, op_data): Returns the process-local model for a config and instance.
+"""
+
+import simpy
+
+from environment.Source import Source
+from environment.Sink import Sink
+from environment.Process import Process
+from environment.Resource import Machine
+
+# (instance, IAT, dispatch_mode, print_console, trace_object) -> SimulationModel
+_models = {}
+
+
+class SimulationModel(object):
+    """
+    Reusable SimPy model of a job shop instance.
+
+    Attributes:
+        config: Configuration object with simulation settings.
+        op_data: Operation data (ProblemInstance or nested lists).
+        env: The environment of the last run.
+        model (dict): The model components by name ('Source<i>', 'Process<j>', 'M<j>', 'Sink').
+        time_limit (float): Safety limit on the simulated time of a run.
+    """
+
+    def __init__(self, config, op_data):
+        """
+        Builds the model components once.
+
+        Parameters:
+            config: Configuration object with simulation settings.
+            op_data: Operation data (ProblemInstance or nested lists).
+        """
+        self.config = config
+        self.op_data = op_data
+        self.env = simpy.Environment()
+        self.model = dict()
+        empty_order = []
+
+        for i in range(config.n_job):
+            self.model['Source' + str(i)] = Source(self.env, 'Source' + str(i), self.model, None, part_type=i, op_data=op_data, config=config)
+        for j in range(config.n_machine):
+            self.model['Process' + str(j)] = Process(self.env, 'Process' + str(j), self.model, None, empty_order, config)
+            self.model['M' + str(j)] = Machine(self.env, j)
+        self.model['Sink'] = Sink(self.env, None, config)
+
+        # 모든 process time의 합은 IAT가 없을 때 어떤 semi-active schedule보다도 긺
+        total_time = sum(op[1] for job in op_data for op in job)
+        self.time_limit = total_time + config.simul_time
+
+    def run(self, machine_order, monitor):
+        """
+        Resets the model onto a new environment and simulates one machine order.
+
+        Parameters:
+            machine_order (list): For each machine, the order in which jobs are processed.
+            monitor: Monitor (or NullMonitor) recording the events.
+
+        Returns:
+            tuple: (makespan, MIO) where MIO[m] lists the steps processed by machine m in order.
+
+        Raises:
+            ValueError: If not all parts reach the Sink within time_limit (e.g. a deadlocking machine order).
+        """
+        env = self.env = simpy.Environment()
+        config, model = self.config, self.model
+
+        for i in range(config.n_job):
+            model['Source' + str(i)].reset(env, monitor)
+        for j in range(config.n_machine):
+            model['Process' + str(j)].reset(env, monitor, machine_order[j])
+            model['M' + str(j)].reset(env)
+        sink = model['Sink']
+        sink.reset(env, monitor)
+
+        # 모든 Part가 Sink에 도착하면 바로 종료 (고정 horizon까지 돌리지 않음)
+        env.run(until=env.any_of([sink.all_parts_done, env.timeout(self.time_limit)]))
+        if not sink.all_parts_done.triggered:
+            raise ValueError(f"Only {sink.parts_rec} of {config.n_job} parts finished within {self.time_limit}.")
+
+        mio = [model['M' + str(j)].op_where for j in range(config.n_machine)]
+        return sink.last_arrival, mio
+
+
+def get_simulation_model(config, op_data):
+    """
+    Returns the process-local model for a config and instance.
+
+    Models are shared between configs that simulate the same way, so deep copies of
+    a config (e.g. inside copied individuals) reuse the same model.
+
+    Parameters:
+        config: Configuration object with simulation settings.
+        op_data: Operation data (ProblemInstance or nested lists).
+
+    Returns:
+        SimulationModel: The shared model.
+    """
+    key = (id(op_data), config.n_job, config.n_machine, str(config.IAT), config.dispatch_mode,
+           config.print_console, config.trace_object, config.simul_time)
+    entry = _models.get(key)
+    if entry is None or entry[0] is not op_data:
+        entry = _models[key] = (op_data, SimulationModel(config, op_data))
+    return entry[1]
@@ -4,16 +4,32 @@ Monitor and Console Output
 This script defines the Monitor class, which is used to record and save events during
 a simulation, and functions to print events to the console based on different modes.
 
+The Monitor is columnar: every operation event is stored as integers (time, event code,
+job id, operation step, machine id) in NumPy buffers preallocated from the number of
+operations, instead of five lists of strings. The trace is saved as a compact .npz file
+(or Parquet when pyarrow is available); the previous CSV format is still available as an
+opt-in converter.
+
 Classes:
     Monitor: A class to monitor and save events during the simulation.
+    NullMonitor: A monitor that discards all events (used for search-time evaluations).
 
 Functions:
+    event_tracer_from_columns: Converts integer-coded event columns to the CSV event log format.
+    load_event_tracer: Loads the columns of a saved trace (.npz, .parquet or .csv).
     monitor_by_console: Prints events to the console based on the mode.
     print_by_machine: Prints the current state of the machine to the console.
 """
 
+import os
+import numpy as np
 import pandas as pd
 
+# Monitor.event에 저장되는 event code
+EVENTS = ('Started', 'Finished')
+STARTED, FINISHED = 0, 1
+_EVENT_CODES = {name: code for code, name in enumerate(EVENTS)}
+
 # region Monitor
 class Monitor(object):
     """
@@ -21,30 +37,91 @@ class Monitor(object):
     
     Attributes:
         config: Configuration object with simulation settings.
-        time (list): List to store event times.
-        event (list): List to store event types.
-        part (list): List to store part names.
-        process_name (list): List to store process names.
-        machine_name (list): List to store machine names.
+        size (int): Number of recorded events.
+        time (np.ndarray): Event times (float64).
+        event (np.ndarray): Event codes, indices into EVENTS (int8).
+        job (np.ndarray): Job ids (int32).
+        step (np.ndarray): Operation steps within the job (int32, -1 if unknown).
+        machine (np.ndarray): Machine ids (int32).
     """
     
-    def __init__(self, config):
+    def __init__(self, config, capacity=None):
         """
         Initializes the Monitor class with the given configuration.
         
         Parameters:
             config: Configuration object with simulation settings.
+            capacity (int): Initial number of event slots (default is 2 * config.n_op, a start and a finish per operation).
         """
         self.config = config  # Event tracer 저장 경로
-        self.time = []
-        self.event = []
-        self.part = []
-        self.process_name = []
-        self.machine_name = []
+        if capacity is None:
+            capacity = 2 * getattr(config, 'n_op', 0) or 64
+        self.size = 0
+        self._time = np.empty(capacity, dtype=np.float64)
+        self._event = np.empty(capacity, dtype=np.int8)
+        self._job = np.empty(capacity, dtype=np.int32)
+        self._step = np.empty(capacity, dtype=np.int32)
+        self._machine = np.empty(capacity, dtype=np.int32)
+
+    def __len__(self):
+        return self.size
+
+    # 기록된 부분만 잘라낸 view (복사 없음)
+    @property
+    def time(self):
+        return self._time[:self.size]
+
+    @property
+    def event(self):
+        return self._event[:self.size]
+
+    @property
+    def job(self):
+        return self._job[:self.size]
+
+    @property
+    def step(self):
+        return self._step[:self.size]
+
+    @property
+    def machine(self):
+        return self._machine[:self.size]
+
+    def _grow(self):
+        capacity = 2 * len(self._time)
+        for name in ('_time', '_event', '_job', '_step', '_machine'):
+            old = getattr(self, name)
+            new = np.empty(capacity, dtype=old.dtype)
+            new[:self.size] = old[:self.size]
+            setattr(self, name, new)
+
+    def record_operation(self, time, event, job, step, machine):
+        """
+        Records an operation event as integers.
+        
+        Parameters:
+            time: The time of the event.
+            event (int): The event code (STARTED or FINISHED).
+            job (int): The job id.
+            step (int): The step of the operation within the job.
+            machine (int): The machine id.
+        """
+        i = self.size
+        if i == len(self._time):
+            self._grow()
+        self._time[i] = time
+        self._event[i] = event
+        self._job[i] = job
+        self._step[i] = step
+        self._machine[i] = machine
+        self.size = i + 1
 
     def record(self, time, process, machine, part_name=None, event=None):
         """
-        Records an event with the given parameters.
+        Records an event with the given parameters (string interface).
+        
+        Only machine events ('Started'/'Finished' on 'M<id>' by 'Part<job>_<id>') are kept,
+        as before; events without a machine are ignored.
         
         Parameters:
             time: The time of the event.
@@ -53,37 +130,148 @@ class Monitor(object):
             part_name: The name of the part (default is None).
             event: The type of event (default is None).
         """
-        if time is not None and process is not None and machine is not None:
-            self.time.append(time)
-            self.event.append(event)
-            self.part.append(part_name)  # string
-            self.process_name.append(process)
-            self.machine_name.append(machine)
+        if time is not None and process is not None and machine is not None and event in _EVENT_CODES:
+            job = int(part_name[4:].split('_')[0]) if part_name else -1
+            self.record_operation(time, _EVENT_CODES[event], job, -1, int(str(machine).lstrip('M')))
+
+    def columns(self):
+        """
+        Returns the recorded events as a dict of NumPy views.
+        
+        Returns:
+            dict: 'time', 'event', 'job', 'step' and 'machine' arrays of length size.
+        """
+        return {'time': self.time, 'event': self.event, 'job': self.job, 'step': self.step, 'machine': self.machine}
+
+    def to_dataframe(self):
+        """
+        Returns the recorded events as an integer-coded DataFrame without copying the buffers.
+        
+        Returns:
+            DataFrame: Columns 'time', 'event', 'job', 'step' and 'machine'.
+        """
+        return pd.DataFrame(self.columns(), copy=False)
+
+    def to_event_tracer(self):
+        """
+        Converts the recorded events to the string format of the CSV event log.
+        
+        Returns:
+            DataFrame: Columns 'Time', 'Event', 'Part', 'Process' and 'Machine'.
+        """
+        return event_tracer_from_columns(self.columns())
+
+    def save_npz(self, file_path):
+        """
+        Saves the recorded events to a compressed .npz file.
+        
+        Parameters:
+            file_path: The path of the .npz file.
+        """
+        np.savez_compressed(file_path, **self.columns())
 
     def save_event_tracer(self, file_path=None):
         """
-        Saves the recorded events to a CSV file.
+        Saves the recorded events if config.save_log is set.
+        
+        The format follows the file extension: '.npz' (binary, default of Run_Config),
+        '.parquet' (requires pyarrow) or anything else as the previous CSV event log.
         
         Parameters:
-            file_path: The path to save the CSV file (default is None).
+            file_path: The path to save the trace (default is config.filename['log']).
         
         Returns:
             event_tracer: A DataFrame containing the recorded events.
         """
-        event_tracer = pd.DataFrame({
-            'Time': self.time,
-            'Event': self.event,
-            'Part': self.part,
-            'Process': self.process_name,
-            'Machine': self.machine_name
-        })
+        if file_path is None:
+            file_path = self.config.filename['log']
+        extension = os.path.splitext(file_path)[1].lower()
+        if extension in ('.npz', '.parquet'):
+            event_tracer = self.to_dataframe()
+        else:
+            event_tracer = self.to_event_tracer()
+
         if self.config.save_log:
-            if file_path:
-                event_tracer.to_csv(file_path, index=False)
+            if extension == '.npz':
+                self.save_npz(file_path)
+            elif extension == '.parquet':
+                event_tracer.to_parquet(file_path, index=False)
             else:
-                event_tracer.to_csv(self.config.filename['log'], index=False)
+                event_tracer.to_csv(file_path, index=False)
 
         return event_tracer
+
+
+class NullMonitor(object):
+    """
+    A monitor that discards all events.
+
+    It has the same interface as Monitor, so the simulation model can run unchanged
+    when no event trace is needed (e.g. for fitness evaluations during the search).
+    """
+
+    def __init__(self, config=None):
+        self.config = config
+
+    def record(self, time, process, machine, part_name=None, event=None):
+        pass
+
+    def record_operation(self, time, event, job, step, machine):
+        pass
+
+
+def event_tracer_from_columns(columns):
+    """
+    Converts integer-coded event columns to the string format of the CSV event log.
+    
+    Parameters:
+        columns (dict): 'time', 'event', 'job' and 'machine' arrays.
+    
+    Returns:
+        DataFrame: Columns 'Time', 'Event', 'Part', 'Process' and 'Machine'.
+    """
+    job = np.asarray(columns['job']).astype(str)
+    machine = np.asarray(columns['machine']).astype(str)
+    time = np.asarray(columns['time'])
+    if np.all(time == np.round(time)):
+        time = time.astype(np.int64)  # 정수 시각은 기존 log와 같이 정수로 기록
+    # 각 Source는 Part를 하나만 생성하므로 (IAT = inf) Part 이름은 Part<job>_0
+    return pd.DataFrame({
+        'Time': time,
+        'Event': np.asarray(EVENTS, dtype=object)[np.asarray(columns['event'], dtype=np.intp)],
+        'Part': np.char.add(np.char.add('Part', job), '_0'),
+        'Process': np.char.add('Process', machine),
+        'Machine': np.char.add('M', machine)
+    })
+
+
+def load_event_tracer(file_path):
+    """
+    Loads the columns of a saved trace.
+    
+    Parameters:
+        file_path: A trace saved by Monitor.save_event_tracer (.npz, .parquet or .csv).
+    
+    Returns:
+        dict: 'time', 'event', 'job', 'step' and 'machine' arrays.
+    """
+    extension = os.path.splitext(file_path)[1].lower()
+    if extension == '.npz':
+        with np.load(file_path) as data:
+            return {name: data[name] for name in data.files}
+    if extension == '.parquet':
+        df = pd.read_parquet(file_path)
+        return {name: df[name].to_numpy() for name in df.columns}
+
+    df = pd.read_csv(file_path, names=['Time', 'Event', 'Part', 'Process', 'Machine'], skiprows=1)
+    df = df[df['Event'].isin(EVENTS)]
+    return {
+        'time': df['Time'].to_numpy(dtype=np.float64),
+        'event': df['Event'].map(_EVENT_CODES).to_numpy(dtype=np.int8),
+        'job': df['Part'].str.slice(4).str.split('_').str[0].astype(np.int32).to_numpy(),
+        'step': np.full(len(df), -1, dtype=np.int32),
+        'machine': df['Machine'].str.slice(1).astype(np.int32).to_numpy()
+    }
 # endregion
 
 def monitor_by_console(console_mode, env, part, object='Single Part', command=''):
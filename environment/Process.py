@@ -7,9 +7,11 @@ handles the working, dispatching, and routing of parts through different
 machines and processes.
 
 Classes:
+    PartQueue: A FilterStore of parts indexed by part type.
     Process: A class to represent a manufacturing process in a simulation.
 
 Functions:
+    reset: Rebinds the process to a new environment and machine order.
     work: Simulates the working process on a machine.
     dispatch: Handles the dispatching of parts to be processed.
     check_item: Checks if the next part in the queue is ready for processing.
@@ -17,7 +19,89 @@ Functions:
 """
 
 import simpy
-from .Monitor import Monitor
+from collections import defaultdict, deque
+from simpy.core import BoundClass
+from simpy.resources.store import FilterStoreGet
+from .Monitor import Monitor, STARTED, FINISHED
+
+
+class PartTypeGet(FilterStoreGet):
+    """
+    Request to get the first part of a given part type out of a PartQueue.
+    """
+
+    def __init__(self, resource, part_type):
+        self.part_type = part_type
+        super().__init__(resource, lambda item: item.part_type == part_type)
+
+
+class PartQueue(simpy.FilterStore):
+    """
+    A FilterStore of parts that also keeps a FIFO bucket per part type.
+
+    get_part_type(part_type) behaves exactly like get(lambda x: x.part_type == part_type)
+    (same item, same event scheduling) but finds and removes the item in O(1) instead of
+    scanning the store with a Python filter. The parts are kept in an insertion-ordered
+    dict, so removing one is O(1) as well; items is only built as a list on request.
+    Plain get(filter) requests keep working.
+    
+    Attributes:
+        parts (dict): The stored parts in arrival order (keys, values are None).
+        items (list): The stored parts in arrival order (as in FilterStore), built from parts.
+        by_type (dict): part_type -> deque of the stored parts of that type in arrival order.
+    """
+
+    get_part_type = BoundClass(PartTypeGet)
+
+    def __init__(self, env, capacity=float('inf')):
+        self.by_type = defaultdict(deque)
+        self.parts = {}
+        super().__init__(env, capacity)
+
+    @property
+    def items(self):
+        return list(self.parts)
+
+    @items.setter
+    def items(self, items):
+        # Store.__init__이 items = []로 초기화할 때 사용
+        self.parts = dict.fromkeys(items)
+        self.by_type = defaultdict(deque)
+        for item in self.parts:
+            self.by_type[item.part_type].append(item)
+
+    def __len__(self):
+        return len(self.parts)
+
+    def has_part_type(self, part_type):
+        """
+        Returns True if a part of the given type is in the queue.
+        """
+        return bool(self.by_type.get(part_type))
+
+    def _do_put(self, event):
+        if len(self.parts) < self._capacity:
+            self.parts[event.item] = None
+            self.by_type[event.item.part_type].append(event.item)
+            event.succeed()
+        return None
+
+    def _do_get(self, event):
+        if isinstance(event, PartTypeGet):
+            bucket = self.by_type.get(event.part_type)
+            if bucket:
+                item = bucket.popleft()
+                del self.parts[item]
+                event.succeed(item)
+            return True
+        for item in self.parts:
+            if event.filter(item):
+                del self.parts[item]
+                self.by_type[item.part_type].remove(item)
+                event.succeed(item)
+                break
+        return True
+
 
 class Process(object):
     """
@@ -32,7 +116,7 @@ class Process(object):
         machine_order: Order of machines for processing parts.
         parts_sent (int): Number of parts sent for processing.
         scheduled (int): Number of parts scheduled for processing.
-        in_part: Store for parts entering the process.
+        in_part (PartQueue): Store for parts entering the process, indexed by part type.
         part_ready: Store for parts ready for processing.
         out_part: Store for parts exiting the process.
         input_event: Event signaling a new input part.
@@ -53,15 +137,26 @@ class Process(object):
             config: Configuration object with simulation settings.
         """
         self.config = config
-        self.env = _env
         self.name = _name
         self.model = _model
+        self.reset(_env, _monitor, _machine_order)
+
+    def reset(self, _env, _monitor, _machine_order):
+        """
+        Rebinds the process to a new environment and machine order and restarts its processes.
+        
+        Parameters:
+            _env: The new simulation environment.
+            _monitor: Monitor object for recording events.
+            _machine_order: Order of machines for processing parts.
+        """
+        self.env = _env
         self.monitor = _monitor
         self.machine_order = _machine_order
         self.parts_sent = 0
         self.scheduled = 0
 
-        self.in_part = simpy.FilterStore(_env)
+        self.in_part = PartQueue(_env)
         self.part_ready = simpy.FilterStore(_env)
         self.out_part = simpy.FilterStore(_env)
         self.input_event = simpy.Event(_env)
@@ -93,8 +188,7 @@ class Process(object):
 
             # Logging the 'Started' event
             try:
-                self.monitor.record(self.env.now, self.name, machine='M' + str(operation.machine),
-                                    part_name=part.name, event="Started")
+                self.monitor.record_operation(self.env.now, STARTED, part.part_type, part.step, operation.machine)
             except Exception as e:
                 print(f"Error logging 'Started' event: {e}")
 
@@ -102,8 +196,7 @@ class Process(object):
 
             # Logging the 'Finished' event
             try:
-                self.monitor.record(self.env.now, self.name, machine='M' + str(operation.machine),
-                                    part_name=part.name, event="Finished")
+                self.monitor.record_operation(self.env.now, FINISHED, part.part_type, part.step, operation.machine)
             except Exception as e:
                 print(f"Error logging 'Finished' event: {e}")
 
@@ -124,10 +217,11 @@ class Process(object):
                 part_ready = yield self.in_part.get()
                 yield self.part_ready.put(part_ready)
             elif self.config.dispatch_mode == 'Manual':
-                num_scan = len(self.in_part.items)
+                num_scan = len(self.in_part)
                 for i in range(num_scan):
                     if self.check_item():
-                        part_ready = yield self.in_part.get(lambda x: x.part_type == self.machine_order[self.scheduled])
+                        # 다음 순서의 part type bucket에서 바로 꺼냄 (queue를 scan하지 않음)
+                        part_ready = yield self.in_part.get_part_type(self.machine_order[self.scheduled])
                         yield self.part_ready.put(part_ready)
                         self.scheduled += 1
 
@@ -138,10 +232,9 @@ class Process(object):
         Returns:
             bool: True if the part is ready, False otherwise.
         """
-        for i, item in enumerate(self.in_part.items):
-            if item.part_type == self.machine_order[self.scheduled]:
-                return True
-        return False
+        if self.scheduled >= len(self.machine_order):
+            return False
+        return self.in_part.has_part_type(self.machine_order[self.scheduled])
 
     def routing(self):
         """
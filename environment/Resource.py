@@ -34,9 +34,18 @@ class Machine(object):
             env: The simulation environment.
             id (int): The ID of the machine.
         """
-        self.env = env
         self.id = id
         self.capacity = 1
+        self.reset(env)
+
+    def reset(self, env):
+        """
+        Rebinds the machine to a new environment and clears its logs.
+        
+        Parameters:
+            env: The new simulation environment.
+        """
+        self.env = env
         self.availability = simpy.Store(env, capacity=self.capacity)
         self.workingtime_log = []
         self.util_time = 0.0
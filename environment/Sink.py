@@ -9,6 +9,7 @@ Classes:
     Sink: A class to represent the final destination for parts in the simulation.
 
 Functions:
+    reset: Rebinds the sink to a new environment and clears its counters.
     put: Records the arrival of parts at the sink and logs the completion event.
 """
 
@@ -26,6 +27,7 @@ class Sink(object):
         monitor: Monitor object for recording events.
         parts_rec (int): Number of parts received by the sink.
         last_arrival (float): Time when the last part arrived at the sink.
+        all_parts_done: Event triggered when all n_job parts have arrived.
         config: Configuration object with simulation settings.
     """
     
@@ -38,15 +40,27 @@ class Sink(object):
             monitor: Monitor object for recording events.
             config: Configuration object with simulation settings.
         """
-        self.env = env
         self.name = 'Sink'
+        self.config = config
+        self.reset(env, monitor)
+
+    def reset(self, env, monitor):
+        """
+        Rebinds the sink to a new environment and clears its counters.
+        
+        Parameters:
+            env: The new simulation environment.
+            monitor: Monitor object for recording events.
+        """
+        self.env = env
         self.monitor = monitor
 
         # Number of parts completed through the Sink
         self.parts_rec = 0
         # Time when the last part arrived
         self.last_arrival = 0.0
-        self.config = config
+        # 모든 Part가 도착하면 발생 (시뮬레이션 종료 조건)
+        self.all_parts_done = env.event()
 
     def put(self, part):
         """
@@ -63,6 +77,7 @@ class Sink(object):
 
         if self.parts_rec == self.config.n_job:
             self.last_arrival = self.env.now
+            self.all_parts_done.succeed()
             # Optionally print or handle the event when all parts are finished
             # print(str(self.env.now))
             # print(str(self.env.now) + '\tAll Parts Finished')
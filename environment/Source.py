@@ -9,6 +9,8 @@ Classes:
     Source: A class to represent a source of parts in the simulation.
 
 Functions:
+    compile_iat: Compiles an IAT specification into a sampling function.
+    reset: Rebinds the source to a new environment and restarts its processes.
     generate: Generates parts at specified inter-arrival times (IAT).
     routing: Routes parts to the next process in the simulation model.
 """
@@ -17,6 +19,22 @@ import simpy
 import numpy as np
 from environment.Part import Job
 
+
+def compile_iat(IAT):
+    """
+    Compiles an IAT specification into a sampling function.
+    
+    Parameters:
+        IAT: A number, or a string such as 'exponential(1)' naming a numpy.random distribution.
+    
+    Returns:
+        function: Returns one inter-arrival time per call.
+    """
+    if isinstance(IAT, str):
+        # 'exponential(1)' -> lambda: np.random.exponential(1) (한 번만 compile)
+        return eval('lambda: np.random.' + IAT)
+    return lambda: IAT
+
 # region Source
 class Source(object):
     """
@@ -34,6 +52,7 @@ class Source(object):
         config: Configuration object with simulation settings.
         rec (int): Number of parts generated.
         generated_parts: Store for generated parts.
+        sample_iat: Compiled IAT sampler.
     """
     
     def __init__(self, _env, _name, _model, _monitor, part_type, op_data, config, IAT='exponential(1)'):
@@ -50,16 +69,27 @@ class Source(object):
             config: Configuration object with simulation settings.
             IAT (str): Inter-arrival time for part generation (default is 'exponential(1)').
         """
-        self.env = _env
         self.name = _name  # 해당 Source의 이름
         self.model = _model
-        self.monitor = _monitor
         self.part_type = part_type  # Source가 생산하는 Part의 type
         self.IAT = config.IAT  # Source가 생성하는 Part의 IAT(jobtype을 통한 Part 생성)
+        self.sample_iat = compile_iat(self.IAT)
         self.num_parts = float('inf')  # Source가 생성하는 Part의 갯수
         self.op_data = op_data
         self.config = config
 
+        self.reset(_env, _monitor)
+
+    def reset(self, _env, _monitor):
+        """
+        Rebinds the source to a new environment and restarts its processes.
+        
+        Parameters:
+            _env: The new simulation environment.
+            _monitor: Monitor object for recording events.
+        """
+        self.env = _env
+        self.monitor = _monitor
         self.rec = 0  # 생성된 Part의 갯수를 기록하는 변수
         self.generated_parts = simpy.Store(_env, capacity=10)  # 10 is an arbitrary number
 
@@ -90,13 +120,9 @@ class Source(object):
                     print('-' * 15 + part.name + " Created" + '-' * 15)
 
                 # 5. Proceed on IAT timeout
-                # Handling an IAT value given as a string variable
-                # If self.IAT is the string 'exponential(1)',
-                # then this line will be equivalent to IAT = np.random.exponential(1)
-                if isinstance(self.IAT, str):
-                    IAT = eval('np.random.' + self.IAT)
-                else:
-                    IAT = self.IAT
+                # If self.IAT is the string 'exponential(1)', the compiled sampler
+                # returns np.random.exponential(1)
+                IAT = self.sample_iat()
                 yield self.env.timeout(np.round(IAT))
 
     def routing(self):
@@ -2,56 +2,51 @@
 generate_machine_log Function
 
 This script defines the generate_machine_log function, which generates a log of machine activities 
-from a CSV file. The function reads the log file, filters the 'Started' and 'Finished' events, and 
-creates a structured log of machine activities including start time, finish time, and duration.
+from the event trace. The 'Started' and 'Finished' events of each machine are paired into a
+structured log of machine activities including start time, finish time, and duration. The trace
+is taken directly from a Monitor when one is given, otherwise it is loaded from the saved log file.
 
 Functions:
-    generate_machine_log(config): Generates a machine activity log from the given configuration.
+    generate_machine_log(config, monitor): Generates a machine activity log from the given configuration.
 """
 
 import pandas as pd
-import os
-from collections import OrderedDict, defaultdict
+import numpy as np
+from environment.Monitor import STARTED, FINISHED, load_event_tracer
 
-def generate_machine_log(config):
+def generate_machine_log(config, monitor=None):
     """
     Generates a machine activity log from the given configuration.
     
     Parameters:
         config: Configuration object with log file paths and simulation settings.
+        monitor (Monitor): Monitor holding the trace (default is None, read config.filename['log']).
     
     Returns:
         DataFrame: A DataFrame containing the machine activity log with columns 
                    'Machine', 'Job', 'Start', 'Finish', and 'Delta'.
     """
-    # 첫 번째 열을 'Time' 열로 인식하도록 설정
-    df = pd.read_csv(config.filename['log'], names=['Time', 'Event', 'Part', 'Process', 'Machine'], skiprows=1)
+    # Monitor가 있으면 파일을 다시 읽지 않고 column을 바로 사용 (.npz/.parquet/.csv 모두 지원)
+    columns = monitor.columns() if monitor is not None else load_event_tracer(config.filename['log'])
+    time, event, job, machine = columns['time'], columns['event'], columns['job'], columns['machine']
+    started = event == STARTED
+    finished = event == FINISHED
 
-    # 'Started'와 'Finished' 이벤트 필터링
-    df_started = df[df['Event'] == 'Started'].drop(['Event', 'Process'], axis=1).reset_index(drop=True)
-    df_finished = df[df['Event'] == 'Finished'].drop(['Event', 'Process'], axis=1).reset_index(drop=True)
-
-    machine_start = []
-    machine_finish = []
-    for i in range(config.n_machine):
-        machine_start.append(df_started[(df_started['Machine'] == 'M' + str(i))])
-        machine_finish.append(df_finished[(df_finished['Machine'] == 'M' + str(i))])
-
-        machine_start[i].reset_index(drop=True, inplace=True)
-        machine_finish[i].reset_index(drop=True, inplace=True)
-    
     data = []
-
     for i in range(config.n_machine):
-        for j in range(len(machine_finish[i])):
-            temp = {'Machine': i,
-                    'Job': machine_start[i].loc[j, 'Part'],
-                    'Start': int(float(machine_start[i].loc[j, 'Time'])),  # 수정된 부분
-                    'Finish': int(float(machine_finish[i].loc[j, 'Time'])),  # 수정된 부분
-                    'Delta': int(float(machine_finish[i].loc[j, 'Time']) - float(machine_start[i].loc[j, 'Time']))}  # 수정된 부분
-            data.append(temp)
-
-    data = pd.DataFrame(data)
+        # machine별 j번째 'Started'와 j번째 'Finished'를 짝지음
+        on_machine = machine == i
+        start = time[started & on_machine].astype(np.int64)
+        jobs = job[started & on_machine]
+        finish = time[finished & on_machine].astype(np.int64)
+        n = len(finish)
+        data.append(pd.DataFrame({'Machine': i,
+                                  'Job': ['Part' + str(j) + '_0' for j in jobs[:n].tolist()],
+                                  'Start': start[:n],
+                                  'Finish': finish,
+                                  'Delta': finish - start[:n]}))
+
+    data = pd.concat(data, ignore_index=True)
     data = data.sort_values(by=['Start'])
     data.reset_index(drop=True, inplace=True)
     if config.save_machinelog:
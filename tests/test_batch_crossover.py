@@ -0,0 +1,147 @@
+"""
+Tests of the batched crossover kernels (GAS/Crossover/BatchCrossover.py): every kernel
+returns valid permutations, and for fixed cut points gives the same children as the
+cross() method of its operator class.
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+import pytest
+
+from Data.Dataset.ProblemInstance import ProblemInstance
+from GAS.Individual import Individual
+from GAS.Crossover import BatchCrossover
+from GAS.Crossover import OrderCrossover, PMX, LOX, CX, OrderBasedCrossover, PositionBasedCrossover, SXX, PSX, JBX
+
+N_JOB, N_MACHINE = 5, 4
+N_OP = N_JOB * N_MACHINE
+CASES = 200
+
+
+class FixedRandom:
+    """
+    Replaces the random module of an operator so that cross() uses given cut points.
+    """
+
+    def __init__(self, sample=None, randint=None):
+        self._sample = sample
+        self._randint = randint
+
+    def random(self):
+        return 0.0
+
+    def sample(self, population, k):
+        return list(self._sample)
+
+    def randint(self, a, b):
+        return self._randint
+
+
+@pytest.fixture(scope='module')
+def instance():
+    rng = np.random.default_rng(0)
+    machine_table = np.array([rng.permutation(N_MACHINE) for _ in range(N_JOB)])
+    return ProblemInstance('test', machine_table, rng.integers(1, 10, size=(N_JOB, N_MACHINE)))
+
+
+def _pairs(seed):
+    rng = np.random.default_rng(seed)
+    for _ in range(CASES):
+        yield rng, rng.permutation(N_OP), rng.permutation(N_OP)
+
+
+def _legacy(module, operator, fixed, parent1, parent2, instance, monkeypatch):
+    monkeypatch.setattr(module, 'random', fixed)
+    child1, child2 = operator.cross(Individual(seq=parent1.tolist(), op_data=instance),
+                                    Individual(seq=parent2.tolist(), op_data=instance))
+    return child1.seq.tolist(), child2.seq.tolist()
+
+
+def _kernel(kernel, parent1, parent2, *args):
+    children1, children2 = kernel(parent1[None, :], parent2[None, :], *[np.array([arg]) for arg in args])
+    return children1[0].tolist(), children2[0].tolist()
+
+
+@pytest.mark.parametrize('method', BatchCrossover.BATCH_CROSSOVERS)
+def test_kernels_return_permutations(method):
+    rng = np.random.default_rng(1)
+    for length in (2, 3, 7, N_OP):
+        parents1 = np.argsort(rng.random((300, length)), axis=1)
+        parents2 = np.argsort(rng.random((300, length)), axis=1)
+        parents2[:50] = parents1[:50]
+        children1, children2, crossed = BatchCrossover.batch_crossover(parents1, parents2, method, 1.0, rng)
+        assert crossed.all()
+        assert BatchCrossover.valid_permutations(children1).all()
+        assert BatchCrossover.valid_permutations(children2).all()
+
+
+def test_uncrossed_pairs_are_unchanged():
+    rng = np.random.default_rng(2)
+    parents1 = np.argsort(rng.random((100, N_OP)), axis=1)
+    parents2 = np.argsort(rng.random((100, N_OP)), axis=1)
+    children1, children2, crossed = BatchCrossover.batch_crossover(parents1, parents2, 'OX', 0.5, rng)
+    assert (children1[~crossed] == parents1[~crossed]).all()
+    assert (children2[~crossed] == parents2[~crossed]).all()
+
+
+@pytest.mark.parametrize('module, operator, kernel', [
+    (OrderCrossover, OrderCrossover.OrderCrossover(pc=1.0), BatchCrossover.order_crossover),
+    (PMX, PMX.PMXCrossover(pc=1.0), BatchCrossover.pmx_crossover),
+    (LOX, LOX.LOXCrossover(pc=1.0), BatchCrossover.lox_crossover),
+    (SXX, SXX.SXX(pc=1.0), BatchCrossover.sxx_crossover),
+])
+def test_segment_kernels_match_cross(module, operator, kernel, instance, monkeypatch):
+    for rng, parent1, parent2 in _pairs(3):
+        point1, point2 = sorted(rng.choice(N_OP, 2, replace=False).tolist())
+        expected = _legacy(module, operator, FixedRandom(sample=[point1, point2]), parent1, parent2, instance, monkeypatch)
+        assert _kernel(kernel, parent1, parent2, point1, point2) == expected
+
+
+def test_psx_kernel_matches_cross(instance, monkeypatch):
+    # cross()는 두 번째 부모의 window가 끝을 넘으면 길이가 틀린 chromosome을 만들므로 그 경우는 제외.
+    # missing gene은 cross()에서 set 순서, kernel에서 오름차순으로 채워지므로 채워진 위치의 gene 집합만 비교
+    compared = 0
+    for rng, parent1, parent2 in _pairs(4):
+        point1, point2 = sorted(rng.choice(N_OP, 2, replace=False).tolist())
+        segment = set(parent1[point1:point2].tolist())
+        start = next(i for i in range(N_OP) if parent2[i] in segment)
+        if start + point2 - point1 > N_OP:
+            continue
+        expected = _legacy(PSX, PSX.PSXCrossover(pc=1.0), FixedRandom(sample=[point1, point2]), parent1, parent2, instance, monkeypatch)
+        for child, legacy in zip(_kernel(BatchCrossover.psx_crossover, parent1, parent2, point1, point2), expected):
+            assert sorted(child) == sorted(legacy) == list(range(N_OP))
+            differing = [i for i in range(N_OP) if child[i] != legacy[i]]
+            assert {child[i] for i in differing} == {legacy[i] for i in differing}
+        compared += 1
+    assert compared > 0
+
+
+def test_jbx_kernel_matches_cross(instance, monkeypatch):
+    for rng, parent1, parent2 in _pairs(5):
+        point1, point2 = sorted(rng.choice(N_OP, 2, replace=False).tolist())
+        expected = _legacy(JBX, JBX.JBX(pc=1.0), FixedRandom(sample=[point1, point2]), parent1, parent2, instance, monkeypatch)
+        assert _kernel(BatchCrossover.jbx_crossover, parent1, parent2, point1, point2) == expected
+
+
+@pytest.mark.parametrize('module, operator, kernel', [
+    (OrderBasedCrossover, OrderBasedCrossover.OBC(pc=1.0), BatchCrossover.order_based_crossover),
+    (PositionBasedCrossover, PositionBasedCrossover.PositionBasedCrossover(pc=1.0), BatchCrossover.position_based_crossover),
+])
+def test_position_kernels_match_cross(module, operator, kernel, instance, monkeypatch):
+    for rng, parent1, parent2 in _pairs(6):
+        size = int(rng.integers(1, N_OP))
+        positions = sorted(rng.choice(N_OP, size, replace=False).tolist())
+        mask = np.zeros(N_OP, dtype=bool)
+        mask[positions] = True
+        expected = _legacy(module, operator, FixedRandom(sample=positions, randint=size), parent1, parent2, instance, monkeypatch)
+        assert _kernel(kernel, parent1, parent2, mask) == expected
+
+
+def test_cycle_kernel_matches_cross(instance, monkeypatch):
+    for rng, parent1, parent2 in _pairs(7):
+        start = int(rng.integers(N_OP))
+        expected = _legacy(CX, CX.CXCrossover(pc=1.0), FixedRandom(randint=start), parent1, parent2, instance, monkeypatch)
+        assert _kernel(BatchCrossover.cycle_crossover, parent1, parent2, start) == expected
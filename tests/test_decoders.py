@@ -0,0 +1,78 @@
+"""
+Tests of the evaluation paths: the array decoder (evaluator='array') gives the same makespan,
+MIO score and machine input orders as the SimPy model, and the incremental evaluation of
+GAS/IncrementalEvaluator.py gives the same values as a full decode, pruning only neighbours
+whose makespan is >= cutoff.
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+import pytest
+
+from Data.Dataset.Dataset import Dataset
+from Config.Run_Config import Run_Config
+from GAS.Individual import Individual
+from GAS.IncrementalEvaluator import IncrementalEvaluator
+
+CASES = 20
+
+
+@pytest.fixture(scope='module', params=['la01.txt', 'la16.txt'])
+def dataset(request):
+    return Dataset(request.param)
+
+
+def _config(dataset, evaluator):
+    # cache를 끄고 두 evaluator가 각자 계산한 값을 비교
+    return Run_Config(dataset.n_job, dataset.n_machine, dataset.n_op, 1, 1, evaluator=evaluator, fitness_cache_mb=0)
+
+
+def _individual(config, dataset, seq):
+    return Individual(config, seq=seq, op_data=dataset.instance)
+
+
+def test_array_matches_simpy(dataset):
+    rng = np.random.default_rng(0)
+    simpy_config, array_config = _config(dataset, 'simpy'), _config(dataset, 'array')
+    for _ in range(CASES):
+        seq = rng.permutation(dataset.n_op)
+        simpy = _individual(simpy_config, dataset, seq)
+        array = _individual(array_config, dataset, seq)
+        assert array.makespan == simpy.makespan
+        assert array.mio_score == simpy.mio_score
+        assert [list(mio) for mio in array.MIO] == [list(mio) for mio in simpy.MIO]
+
+
+def _check_neighbours(dataset, neighbour, evaluate):
+    rng = np.random.default_rng(1)
+    config = _config(dataset, 'array')
+    evaluator = IncrementalEvaluator(rng.permutation(dataset.n_op).tolist(), dataset.instance)
+    for _ in range(CASES):
+        i, j = rng.choice(dataset.n_op, 2, replace=False).tolist()
+        expected = _individual(config, dataset, neighbour(evaluator, i, j))
+        assert evaluate(evaluator, i, j, None) == (expected.makespan, expected.mio_score)
+
+        cutoff = expected.makespan + int(rng.integers(-50, 50))
+        makespan, mio_score = evaluate(evaluator, i, j, cutoff)
+        if mio_score is None:
+            # 잘린 이웃은 실제 makespan이 cutoff 이상이어야 하고, 반환값은 cutoff 이상의 bound
+            assert expected.makespan >= cutoff and makespan >= cutoff
+        else:
+            assert (makespan, mio_score) == (expected.makespan, expected.mio_score)
+
+        # 이웃을 base로 받아들인 뒤에도 checkpoint에서 이어서 decoding한 값이 같아야 함
+        if rng.random() < 0.3:
+            assert evaluator.accept(neighbour(evaluator, i, j)) == (expected.makespan, expected.mio_score)
+
+
+def test_incremental_swap_matches_full_decode(dataset):
+    _check_neighbours(dataset, IncrementalEvaluator.swap,
+                      lambda evaluator, i, j, cutoff: evaluator.evaluate_swap(i, j, cutoff))
+
+
+def test_incremental_insert_matches_full_decode(dataset):
+    _check_neighbours(dataset, IncrementalEvaluator.insert,
+                      lambda evaluator, i, j, cutoff: evaluator.evaluate_insert(i, j, cutoff))